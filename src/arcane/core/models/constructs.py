@@ -30,13 +30,13 @@ class Direction(Enum):
 AbsoluteCoordinatePosition = Tuple[float, float]
 
 
-@dataclass
+@dataclass(slots=True)
 class RelativeAnglePosition:
     variable: Identifier
     angle: float
 
 
-@dataclass
+@dataclass(slots=True)
 class RelativeDirectionPosition:
     variable: Identifier
     placement: RelativePositionPlacement
@@ -47,93 +47,104 @@ Position = (
 )
 
 
-@dataclass(eq=True)
+# objects the user didn't name get an integer id from gen_id(), so they can
+# never be confused with (or collide with) the names given in a program
+NodeId = int
+ObjectId = Union[NodeId, str]
+
+
+@dataclass(eq=True, slots=True)
 class Identifier:
-    id: str = field(init=False, compare=False)
-    value: str = ""
+    id: ObjectId = field(init=False, compare=False)
+    value: ObjectId = ""
 
     def __post_init__(self):
         self.id = self.value
 
+    @property
+    def is_generated(self) -> bool:
+        """Whether this refers to an unnamed object rather than a user variable"""
+        return isinstance(self.value, NodeId)
+
 
 ###### end Primitives
 
 
 ##### Transforms
-@dataclass
+@dataclass(slots=True)
 class SweepDot:
-    id: str
+    id: ObjectId
     variable: Identifier
 
 
-@dataclass
+@dataclass(slots=True)
 class SweepTransform:
     sweep_from: float
     sweep_to: float
 
 
-@dataclass
+@dataclass(slots=True)
 class SweepCoordinates:
     sweep_from: Tuple[float, float]
     sweep_to: Tuple[float, float]
 
 
-@dataclass
+@dataclass(slots=True)
 class SweepObjects:
     sweep_from: Identifier
     sweep_to: Identifier
 
 
-@dataclass
+@dataclass(slots=True)
 class PropagateRays:
-    id: str
+    id: ObjectId
     lenses: List[Identifier]
 
 
-@dataclass
+@dataclass(slots=True)
 class CoordinateAngleLength:
     sweep_from: Tuple[float, float]
     angle: float
     length: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ObjectTransformExpression:
     object_from: sympy.Basic | Animatable
     object_to: sympy.Basic | List[sympy.Basic] | Animatable
 
 
-@dataclass
+@dataclass(slots=True)
 class ObjectTransform:
-    id: str
+    id: ObjectId
     object_from: DirectAnimatableType | MathFunction
     object_to: DirectAnimatableType | MathFunction
 
 
-@dataclass
+@dataclass(slots=True)
 class ArcaneRotate:
-    id: str
+    id: ObjectId
     variable: Identifier
     angle: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ArcaneScale:
-    id: str
+    id: ObjectId
     variable: Identifier
     factor: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ArcaneMove:
-    id: str
+    id: ObjectId
     variable: Identifier
     position_to: Position
 
 
-@dataclass
+@dataclass(slots=True)
 class ArcaneMoveAlong:
-    id: str
+    id: ObjectId
     variable_to_move: Identifier
     variable_along: Identifier
 
@@ -144,35 +155,40 @@ class ArcaneMoveAlong:
 ######### math functions
 
 
-@dataclass
+def unevaluated_math_function(x):
+    """Placeholder until the interpreter generates the function (module level so programs can be pickled)"""
+    ...
+
+
+@dataclass(slots=True)
 class RegularMathFunction:
-    id: str
+    id: ObjectId
     variables: List[str]
     expression: Any
-    math_function: Callable = lambda x: ...
+    math_function: Callable = unevaluated_math_function
     x_range: Tuple[float, float] = (0, 0)
     y_range: Tuple[float, float] = (0, 0)
     container_type: Literal["Axis"] = "Axis"  # TODO:(remove this in refactor)
 
 
-@dataclass
+@dataclass(slots=True)
 class ParametricMathFunction:
-    id: str
+    id: ObjectId
     variables: List[str]
     expressions: Any
-    math_function: Callable = lambda x: ...
+    math_function: Callable = unevaluated_math_function
     t_range: Tuple[float, float] = (0, 0)
     x_range: Tuple[float, float] = (0, 0)
     y_range: Tuple[float, float] = (0, 0)
     container_type: Literal["Axis"] = "Axis"
 
 
-@dataclass
+@dataclass(slots=True)
 class PolarMathFunction:
-    id: str
+    id: ObjectId
     variables: List[str]
     expression: Any
-    math_function: Callable = lambda x: ...
+    math_function: Callable = unevaluated_math_function
     x_range: Tuple[float, float] = (0, 0)
     y_range: Tuple[float, float] = (0, 0)
     container_type: Literal["PolarPlane"] = "PolarPlane"
@@ -182,145 +198,145 @@ class PolarMathFunction:
 
 
 ####### animation primitives
-@dataclass
+@dataclass(slots=True)
 class Animation:
     instance: Animatable
     transforms: List[Transform]
 
 
-@dataclass
+@dataclass(slots=True)
 class ArcaneText:
-    id: str
+    id: ObjectId
     value: str
     position: Optional[Position]
     options: Dict = field(default_factory=dict)
     is_latex: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ArcaneClearObject:
-    id: str
+    id: ObjectId
     variable: Identifier
 
 
-@dataclass
+@dataclass(slots=True)
 class ThreePoint:
     position: Position
     point1: Tuple[float, float]
     point2: Tuple[float, float]
 
 
-@dataclass
+@dataclass(slots=True)
 class ArcaneElbow:
-    id: str
+    id: ObjectId
     definition: ThreePoint | CoordinateAngleLength
 
 
-@dataclass
+@dataclass(slots=True)
 class ArcanePoint:
-    id: str
+    id: ObjectId
     position: Position
 
 
-@dataclass
+@dataclass(slots=True)
 class ArcaneLine:
-    id: str
+    id: ObjectId
     definition: SweepCoordinates | CoordinateAngleLength
 
 
-@dataclass
+@dataclass(slots=True)
 class PositionLength:
     position: Position
     length: float
 
 
-@dataclass
+@dataclass(slots=True)
 class StyleProperties:
     fill: Optional[str] = None
     stroke_color: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ArcaneSquare:
-    id: str
+    id: ObjectId
     definition: PositionLength
     style: Optional[StyleProperties] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RectangleDefinition:
     position: Position
     width: float
     height: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ArcaneRectangle:
-    id: str
+    id: ObjectId
     definition: RectangleDefinition
     style: Optional[StyleProperties] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RegularPolygonDefinition:
     position: Position
     radius: float
     num_sides: int
 
 
-@dataclass
+@dataclass(slots=True)
 class ArcaneRegularPolygon:
-    id: str
+    id: ObjectId
     definition: RegularPolygonDefinition
     style: Optional[StyleProperties] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PolygonDefinition:
     points: List[Tuple[float, float]]
 
 
-@dataclass
+@dataclass(slots=True)
 class ArcanePolygon:
-    id: str
+    id: ObjectId
     definition: PolygonDefinition
     style: Optional[StyleProperties] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CircleDefinition:
     position: Position
     radius: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ArcaneCircle:
-    id: str
+    id: ObjectId
     definition: CircleDefinition
     style: Optional[StyleProperties] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ArcaneLens:
-    id: str
+    id: ObjectId
     focal_length: int
     thickness: int
     position: Position
     style: Optional[StyleProperties] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ArcaneRays:
-    id: str
+    id: ObjectId
     definition: SweepCoordinates
     count: int
     direction: Direction
     style: Optional[StyleProperties] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ArcaneArrow:
-    id: str
+    id: ObjectId
     definition: Union[SweepCoordinates, SweepObjects]
     style: Optional[StyleProperties] = None
 
@@ -329,7 +345,7 @@ class ArcaneArrow:
 
 
 ######### blocks
-@dataclass
+@dataclass(slots=True)
 class Definition:
     name: Identifier
     value: (
@@ -350,48 +366,59 @@ class Definition:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class ArcaneBrace:
-    id: str
+    id: ObjectId
     variable: Identifier
     text: str
     is_latex: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class ArcaneCharge:
-    id: str
+    id: ObjectId
     position: Position
     magnitude: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ElectricFieldBlock:
-    id: str
+    id: ObjectId
     _statements: List[any]
     statements: List[int] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class AxisBlock:
-    id: str
+    id: ObjectId
     _statements: List[any]
     statements: List[int] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class PolarBlock:
-    id: str
+    id: ObjectId
     _statements: List[any]
     statements: List[int] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
+class ForLoop:
+    """A loop whose body is kept once and substituted lazily per iteration"""
+
+    id: ObjectId
+    name: Identifier
+    start: float
+    stop: float
+    body: List[Animation]
+
+
+@dataclass(slots=True)
 class Program:
     statements: List[Statement]
 
 
-@dataclass
+@dataclass(slots=True)
 class Statement:
     index: int
     value: (
@@ -401,12 +428,13 @@ class Statement:
         | PolarBlock
         | ArcaneClearObject
         | ElectricFieldBlock
+        | ForLoop
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class VLines:
-    id: str
+    id: ObjectId
     variable: str
     num_lines: float
 
@@ -0,0 +1,63 @@
+import logging
+import os
+import pickle
+import zlib
+from hashlib import sha256
+
+from arcane.core.models.constructs import Program
+from arcane.core.parsing.parser import grammar_hash, parse
+from arcane.core.parsing.process import resolve_dependencies
+from arcane.utils import evict_cache, get_cache_dir, get_source_hash, ids
+
+logger = logging.getLogger(__name__)
+
+# total size of the cached programs, least recently used ones are evicted past it
+MAX_CACHE_SIZE = 64 * 1024 * 1024
+
+# cached programs are pickles of the models built by these modules
+model_hash = get_source_hash(
+    "arcane.core.models.constructs",
+    "arcane.core.parsing.transfomer",
+    "arcane.core.parsing.process",
+)
+
+
+def program_cache_key(source: str) -> str:
+    """Hashes the source together with everything that changes how it is parsed"""
+    key = "\0".join((source, grammar_hash, model_hash, str(pickle.HIGHEST_PROTOCOL)))
+    return sha256(key.encode()).hexdigest()
+
+
+def load_program(source: str, max_size: int = MAX_CACHE_SIZE) -> Program:
+    """Parses and resolves a program, reusing the result of previous runs on the same source"""
+    cache_dir = get_cache_dir("programs")
+    cache_file = cache_dir / f"{program_cache_key(source)}.program"
+
+    try:
+        next_id, program = pickle.loads(zlib.decompress(cache_file.read_bytes()))
+        ids.advance_to(next_id)  # the program's ids were handed out by another run
+        os.utime(cache_file)  # mark as recently used
+        return program
+    except FileNotFoundError:
+        pass
+    except Exception:
+        # unreadable or written by incompatible code, parse it again
+        cache_file.unlink(missing_ok=True)
+
+    program = resolve_dependencies(parse(source))
+
+    # write to a temporary file first so concurrent readers never see a partial entry
+    temp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        temp_file.write_bytes(
+            zlib.compress(
+                pickle.dumps((ids.peek(), program), protocol=pickle.HIGHEST_PROTOCOL)
+            )
+        )
+        os.replace(temp_file, cache_file)
+        evict_cache(cache_dir, "*.program", max_size)
+    except OSError as e:
+        temp_file.unlink(missing_ok=True)
+        logger.warning("Unable to cache program: %s", e)
+
+    return program
@@ -0,0 +1,15 @@
+#!/bin/bash
+
+# Regenerates the standalone LALR parser from grammar.lark.
+# Run this whenever the grammar changes, until then parser.py falls back
+# to building (and caching) the tables from the grammar itself.
+# Usage: ./generate_parser.sh
+
+cd "$(dirname "$0")"
+
+python -m lark.tools.standalone --maybe_placeholders --compress \
+    -o standalone_parser.py grammar.lark
+
+# record which grammar the tables were generated from
+GRAMMAR_HASH=$(python -c "import hashlib; print(hashlib.sha256(open('grammar.lark', 'rb').read()).hexdigest())")
+echo "GRAMMAR_HASH = \"$GRAMMAR_HASH\"" >> standalone_parser.py
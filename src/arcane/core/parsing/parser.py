@@ -1,16 +1,38 @@
-from lark import Lark, ParseTree
-import os
-from arcane.utils import get_project_root
+from hashlib import sha256
+from importlib import resources
 
-grammar = ""
-with open(
-    os.path.join(get_project_root(), "src/arcane/core/parsing/grammar.lark"), "r"
-) as f:
-    grammar = f.read()
+import lark
 
-parser = Lark(grammar)
+from arcane.core.models.constructs import Program
+from arcane.core.parsing import standalone_parser
+from arcane.core.parsing.transfomer import ArcaneTransfomer
+from arcane.utils import get_cache_dir
 
+grammar = resources.files("arcane.core.parsing").joinpath("grammar.lark").read_text()
+grammar_hash = sha256(grammar.encode()).hexdigest()
 
-def parse(source: str) -> ParseTree:
-    tree = parser.parse(source)
-    return tree
\ No newline at end of file
+
+def _load_parser():
+    """Loads the LALR parser, running the transformer inline as rules are reduced"""
+    if standalone_parser.GRAMMAR_HASH == grammar_hash:
+        # tables pre-generated from this exact grammar (see generate_parser.sh)
+        return standalone_parser.Lark_StandAlone(transformer=ArcaneTransfomer())
+
+    # the grammar changed since the standalone parser was generated, build the
+    # tables once per grammar version and share them through the on-disk cache
+    cache_file = get_cache_dir("parser") / f"{grammar_hash}-lark{lark.__version__}"
+    return lark.Lark(
+        grammar,
+        parser="lalr",
+        maybe_placeholders=True,
+        transformer=ArcaneTransfomer(),
+        cache=str(cache_file),
+    )
+
+
+parser = _load_parser()
+
+
+def parse(source: str) -> Program:
+    program = parser.parse(source)
+    return program
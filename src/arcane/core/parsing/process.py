@@ -1,98 +1,86 @@
-import re
 from dataclasses import fields, is_dataclass
-from typing import Any, Set
+from enum import Enum
+from functools import cache
+from typing import Any, Dict, List, Tuple
 
-from arcane.core.models.constructs import (Animation, Definition, Identifier,
-                                           Program, Statement)
+import sympy
 
+from arcane.core.models.constructs import (Animation, Definition, ForLoop,
+                                           Identifier, Program, Statement)
 
-def _is_generated_id(id_str: str) -> bool:
-    """Check if a string looks like a generated UUID"""
-    # TODO: come up with better way off handling this, this approach could technically cause overlap if the user decides to name a variable with a uuid
-    return bool(
-        re.match(
-            r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$", id_str
-        )
+# values that can never hold an Identifier, so the search never looks inside them
+_LEAF_TYPES = (str, int, float, Enum, sympy.Basic)
+
+
+@cache
+def _reference_fields(node_type: type) -> Tuple[str, ...]:
+    """The fields of a construct type that can reference variables, computed once per type"""
+    return tuple(
+        field.name for field in fields(node_type) if field.name not in ("id", "name")
     )
 
 
-def _get_defined_variables(ast: Program) -> set[str]:
-    """Extract all defined variable names from the AST"""
-    defined_vars = set()
-    for statement in ast.statements:
-        if isinstance(statement.value, Definition):
-            defined_vars.add(statement.value.name.value)
-    return defined_vars
-
-
-# TODO: refactor this to use a vistor pattern or similar(this is kind of hacky)
-def _search_for_identifiers(obj: Any, deps: Set[str]) -> None:
-    """Recursively search through an object and its fields for Identifier instances"""
-    # Skip None objects
-    if obj is None:
-        return
-
-    # Handle lists, tuples, and sets
-    if isinstance(obj, (list, tuple, set)):
-        for item in obj:
-            _search_for_identifiers(item, deps)
-        return
-
-    # Handle dictionaries
-    if isinstance(obj, dict):
-        for value in obj.values():
-            _search_for_identifiers(value, deps)
-        return
-
-    # If it's an Identifier and not in a field named 'id', add its value
-    if isinstance(obj, Identifier):
-        deps.add(obj.value)
-        return
-
-    if isinstance(obj, str):
-        pass
-
-    # For dataclasses, recursively check all fields
-    if is_dataclass(obj):
-        for field in fields(obj):
-            if field.name not in ["id", "name"] and field.name != "instance":
-                field_value = getattr(obj, field.name)
-                _search_for_identifiers(field_value, deps)
-            elif field.name == "instance":
-                # Special case for instance field(should only exist on Animation), which can be an Identifier
-                instance_value = getattr(obj, field.name)
-                if not isinstance(instance_value, Identifier):
-                    _search_for_identifiers(instance_value, deps)
-
-
-def _get_dependencies(node) -> set[str]:
-    """Extract dependencies from a node by finding all Identifier instances"""
-    deps = set()
-    _search_for_identifiers(node, deps)
-    # Filter out empty strings and generated IDs
-    return {dep for dep in deps if dep and not _is_generated_id(dep)}
+def _get_dependencies(node: Any) -> List[str]:
+    """Extract dependencies from a node by finding all Identifier instances, in one iterative pass"""
+    deps: Dict[str, None] = {}  # ordered set, so injected animations are deterministic
+    pending = [node]
+    while pending:
+        obj = pending.pop()
+        if obj is None or isinstance(obj, _LEAF_TYPES):
+            continue
+
+        if isinstance(obj, Identifier):
+            if obj.value and not obj.is_generated:
+                deps[obj.value] = None
+        elif isinstance(obj, (list, tuple, set)):
+            pending.extend(reversed(obj))
+        elif isinstance(obj, dict):
+            pending.extend(reversed(obj.values()))
+        elif is_dataclass(obj):
+            for field_name in reversed(_reference_fields(type(obj))):
+                value = getattr(obj, field_name)
+                # the variable an animation shows isn't a dependency of it (should only exist on Animation)
+                if field_name == "instance" and isinstance(value, Identifier):
+                    continue
+                pending.append(value)
+
+    return list(deps)
+
+
+def _get_animated_variables(value: Any) -> List[str]:
+    """The variables (or object ids) a statement animates"""
+    # a loop body is the same for every iteration, so it only needs checking once
+    animations = value.body if isinstance(value, ForLoop) else [value]
+    animated_vars = []
+    for animation in animations:
+        if not isinstance(animation, Animation):
+            continue
+        if isinstance(animation.instance, Identifier):
+            animated_vars.append(animation.instance.value)
+        elif hasattr(animation.instance, "id"):
+            animated_vars.append(animation.instance.id)
+    return animated_vars
 
 
 def resolve_dependencies(ast: Program) -> Program:
     """Resolve dependencies between objects in the AST, updating block statement indices as needed"""
-    defined_vars = _get_defined_variables(ast)
+    defined_vars = set()
     animated_vars = set()
+    statement_deps = []
     new_statements = []
     next_index = 0
     old_to_new_index = {}
     block_statements_map = {}  # Maps block id to (block obj, old indices)
 
-    # First pass: collect all variables that are already animated
+    # First pass: build the dependency graph and collect the defined and animated variables
     for statement in ast.statements:
-        if isinstance(statement.value, Animation):
-            if isinstance(statement.value.instance, Identifier):
-                animated_vars.add(statement.value.instance.value)
-            elif hasattr(statement.value.instance, "id"):
-                animated_vars.add(statement.value.instance.id)
+        if isinstance(statement.value, Definition):
+            defined_vars.add(statement.value.name.value)
+        animated_vars.update(_get_animated_variables(statement.value))
+        statement_deps.append(_get_dependencies(statement.value))
 
     # Second pass: process statements and inject animations where needed
-    for old_idx, statement in enumerate(ast.statements):
-        deps = _get_dependencies(statement.value)
+    for old_idx, (statement, deps) in enumerate(zip(ast.statements, statement_deps)):
         # For each dependency that hasn't been animated yet
         for dep in deps:
             if dep not in defined_vars:
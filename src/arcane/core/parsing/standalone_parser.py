@@ -0,0 +1,3575 @@
+# The file was automatically generated by Lark v1.3.1
+__version__ = "1.3.1"
+
+#
+#
+#   Lark Stand-alone Generator Tool
+# ----------------------------------
+# Generates a stand-alone LALR(1) parser
+#
+# Git:    https://github.com/erezsh/lark
+# Author: Erez Shinan (erezshin@gmail.com)
+#
+#
+#    >>> LICENSE
+#
+#    This tool and its generated code use a separate license from Lark,
+#    and are subject to the terms of the Mozilla Public License, v. 2.0.
+#    If a copy of the MPL was not distributed with this
+#    file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#    If you wish to purchase a commercial license for this tool and its
+#    generated code, you may contact me via email or otherwise.
+#
+#    If MPL2 is incompatible with your free or open-source project,
+#    contact me and we'll work it out.
+#
+#
+
+from copy import deepcopy
+from abc import ABC, abstractmethod
+from types import ModuleType
+from typing import (
+    TypeVar, Generic, Type, Tuple, List, Dict, Iterator, Collection, Callable, Optional, FrozenSet, Any,
+    Union, Iterable, IO, TYPE_CHECKING, overload, Sequence,
+    Pattern as REPattern, ClassVar, Set, Mapping
+)
+
+
+class LarkError(Exception):
+    pass
+
+
+class ConfigurationError(LarkError, ValueError):
+    pass
+
+
+def assert_config(value, options: Collection, msg='Got %r, expected one of %s'):
+    if value not in options:
+        raise ConfigurationError(msg % (value, options))
+
+
+class GrammarError(LarkError):
+    pass
+
+
+class ParseError(LarkError):
+    pass
+
+
+class LexError(LarkError):
+    pass
+
+T = TypeVar('T')
+
+class UnexpectedInput(LarkError):
+    #--
+    line: int
+    column: int
+    pos_in_stream = None
+    state: Any
+    _terminals_by_name = None
+    interactive_parser: 'InteractiveParser'
+
+    def get_context(self, text: str, span: int=40) -> str:
+        #--
+        pos = self.pos_in_stream or 0
+        start = max(pos - span, 0)
+        end = pos + span
+        if not isinstance(text, bytes):
+            before = text[start:pos].rsplit('\n', 1)[-1]
+            after = text[pos:end].split('\n', 1)[0]
+            return before + after + '\n' + ' ' * len(before.expandtabs()) + '^\n'
+        else:
+            before = text[start:pos].rsplit(b'\n', 1)[-1]
+            after = text[pos:end].split(b'\n', 1)[0]
+            return (before + after + b'\n' + b' ' * len(before.expandtabs()) + b'^\n').decode("ascii", "backslashreplace")
+
+    def match_examples(self, parse_fn: 'Callable[[str], Tree]',
+                             examples: Union[Mapping[T, Iterable[str]], Iterable[Tuple[T, Iterable[str]]]],
+                             token_type_match_fallback: bool=False,
+                             use_accepts: bool=True
+                         ) -> Optional[T]:
+        #--
+        assert self.state is not None, "Not supported for this exception"
+
+        if isinstance(examples, Mapping):
+            examples = examples.items()
+
+        candidate = (None, False)
+        for i, (label, example) in enumerate(examples):
+            assert not isinstance(example, str), "Expecting a list"
+
+            for j, malformed in enumerate(example):
+                try:
+                    parse_fn(malformed)
+                except UnexpectedInput as ut:
+                    if ut.state == self.state:
+                        if (
+                            use_accepts
+                            and isinstance(self, UnexpectedToken)
+                            and isinstance(ut, UnexpectedToken)
+                            and ut.accepts != self.accepts
+                        ):
+                            logger.debug("Different accepts with same state[%d]: %s != %s at example [%s][%s]" %
+                                         (self.state, self.accepts, ut.accepts, i, j))
+                            continue
+                        if (
+                            isinstance(self, (UnexpectedToken, UnexpectedEOF))
+                            and isinstance(ut, (UnexpectedToken, UnexpectedEOF))
+                        ):
+                            if ut.token == self.token:  ##
+
+                                logger.debug("Exact Match at example [%s][%s]" % (i, j))
+                                return label
+
+                            if token_type_match_fallback:
+                                ##
+
+                                if (ut.token.type == self.token.type) and not candidate[-1]:
+                                    logger.debug("Token Type Fallback at example [%s][%s]" % (i, j))
+                                    candidate = label, True
+
+                        if candidate[0] is None:
+                            logger.debug("Same State match at example [%s][%s]" % (i, j))
+                            candidate = label, False
+
+        return candidate[0]
+
+    def _format_expected(self, expected):
+        if self._terminals_by_name:
+            d = self._terminals_by_name
+            expected = [d[t_name].user_repr() if t_name in d else t_name for t_name in expected]
+        return "Expected one of: \n\t* %s\n" % '\n\t* '.join(expected)
+
+
+class UnexpectedEOF(ParseError, UnexpectedInput):
+    #--
+    expected: 'List[Token]'
+
+    def __init__(self, expected, state=None, terminals_by_name=None):
+        super(UnexpectedEOF, self).__init__()
+
+        self.expected = expected
+        self.state = state
+        from .lexer import Token
+        self.token = Token("<EOF>", "")  ##
+
+        self.pos_in_stream = -1
+        self.line = -1
+        self.column = -1
+        self._terminals_by_name = terminals_by_name
+
+
+    def __str__(self):
+        message = "Unexpected end-of-input. "
+        message += self._format_expected(self.expected)
+        return message
+
+
+class UnexpectedCharacters(LexError, UnexpectedInput):
+    #--
+
+    allowed: Set[str]
+    considered_tokens: Set[Any]
+
+    def __init__(self, seq, lex_pos, line, column, allowed=None, considered_tokens=None, state=None, token_history=None,
+                 terminals_by_name=None, considered_rules=None):
+        super(UnexpectedCharacters, self).__init__()
+
+        ##
+
+        self.line = line
+        self.column = column
+        self.pos_in_stream = lex_pos
+        self.state = state
+        self._terminals_by_name = terminals_by_name
+
+        self.allowed = allowed
+        self.considered_tokens = considered_tokens
+        self.considered_rules = considered_rules
+        self.token_history = token_history
+
+        if isinstance(seq, bytes):
+            self.char = seq[lex_pos:lex_pos + 1].decode("ascii", "backslashreplace")
+        else:
+            self.char = seq[lex_pos]
+        self._context = self.get_context(seq)
+
+
+    def __str__(self):
+        message = "No terminal matches '%s' in the current parser context, at line %d col %d" % (self.char, self.line, self.column)
+        message += '\n\n' + self._context
+        if self.allowed:
+            message += self._format_expected(self.allowed)
+        if self.token_history:
+            message += '\nPrevious tokens: %s\n' % ', '.join(repr(t) for t in self.token_history)
+        return message
+
+
+class UnexpectedToken(ParseError, UnexpectedInput):
+    #--
+
+    expected: Set[str]
+    considered_rules: Set[str]
+
+    def __init__(self, token, expected, considered_rules=None, state=None, interactive_parser=None, terminals_by_name=None, token_history=None):
+        super(UnexpectedToken, self).__init__()
+
+        ##
+
+        self.line = getattr(token, 'line', '?')
+        self.column = getattr(token, 'column', '?')
+        self.pos_in_stream = getattr(token, 'start_pos', None)
+        self.state = state
+
+        self.token = token
+        self.expected = expected  ##
+
+        self._accepts = NO_VALUE
+        self.considered_rules = considered_rules
+        self.interactive_parser = interactive_parser
+        self._terminals_by_name = terminals_by_name
+        self.token_history = token_history
+
+
+    @property
+    def accepts(self) -> Set[str]:
+        if self._accepts is NO_VALUE:
+            self._accepts = self.interactive_parser and self.interactive_parser.accepts()
+        return self._accepts
+
+    def __str__(self):
+        message = ("Unexpected token %r at line %s, column %s.\n%s"
+                   % (self.token, self.line, self.column, self._format_expected(self.accepts or self.expected)))
+        if self.token_history:
+            message += "Previous tokens: %r\n" % self.token_history
+
+        return message
+
+
+
+class VisitError(LarkError):
+    #--
+
+    obj: 'Union[Tree, Token]'
+    orig_exc: Exception
+
+    def __init__(self, rule, obj, orig_exc):
+        message = 'Error trying to process rule "%s":\n\n%s' % (rule, orig_exc)
+        super(VisitError, self).__init__(message)
+
+        self.rule = rule
+        self.obj = obj
+        self.orig_exc = orig_exc
+
+
+class MissingVariableError(LarkError):
+    pass
+
+
+import sys, re
+import logging
+from dataclasses import dataclass
+from typing import Generic, AnyStr
+
+logger: logging.Logger = logging.getLogger("lark")
+logger.addHandler(logging.StreamHandler())
+##
+
+##
+
+logger.setLevel(logging.CRITICAL)
+
+
+NO_VALUE = object()
+
+T = TypeVar("T")
+
+
+def classify(seq: Iterable, key: Optional[Callable] = None, value: Optional[Callable] = None) -> Dict:
+    d: Dict[Any, Any] = {}
+    for item in seq:
+        k = key(item) if (key is not None) else item
+        v = value(item) if (value is not None) else item
+        try:
+            d[k].append(v)
+        except KeyError:
+            d[k] = [v]
+    return d
+
+
+def _deserialize(data: Any, namespace: Dict[str, Any], memo: Dict) -> Any:
+    if isinstance(data, dict):
+        if '__type__' in data:  ##
+
+            class_ = namespace[data['__type__']]
+            return class_.deserialize(data, memo)
+        elif '@' in data:
+            return memo[data['@']]
+        return {key:_deserialize(value, namespace, memo) for key, value in data.items()}
+    elif isinstance(data, list):
+        return [_deserialize(value, namespace, memo) for value in data]
+    return data
+
+
+_T = TypeVar("_T", bound="Serialize")
+
+class Serialize:
+    #--
+
+    def memo_serialize(self, types_to_memoize: List) -> Any:
+        memo = SerializeMemoizer(types_to_memoize)
+        return self.serialize(memo), memo.serialize()
+
+    def serialize(self, memo = None) -> Dict[str, Any]:
+        if memo and memo.in_types(self):
+            return {'@': memo.memoized.get(self)}
+
+        fields = getattr(self, '__serialize_fields__')
+        res = {f: _serialize(getattr(self, f), memo) for f in fields}
+        res['__type__'] = type(self).__name__
+        if hasattr(self, '_serialize'):
+            self._serialize(res, memo)
+        return res
+
+    @classmethod
+    def deserialize(cls: Type[_T], data: Dict[str, Any], memo: Dict[int, Any]) -> _T:
+        namespace = getattr(cls, '__serialize_namespace__', [])
+        namespace = {c.__name__:c for c in namespace}
+
+        fields = getattr(cls, '__serialize_fields__')
+
+        if '@' in data:
+            return memo[data['@']]
+
+        inst = cls.__new__(cls)
+        for f in fields:
+            try:
+                setattr(inst, f, _deserialize(data[f], namespace, memo))
+            except KeyError as e:
+                raise KeyError("Cannot find key for class", cls, e)
+
+        if hasattr(inst, '_deserialize'):
+            inst._deserialize()
+
+        return inst
+
+
+class SerializeMemoizer(Serialize):
+    #--
+
+    __serialize_fields__ = 'memoized',
+
+    def __init__(self, types_to_memoize: List) -> None:
+        self.types_to_memoize = tuple(types_to_memoize)
+        self.memoized = Enumerator()
+
+    def in_types(self, value: Serialize) -> bool:
+        return isinstance(value, self.types_to_memoize)
+
+    def serialize(self) -> Dict[int, Any]:  ##
+
+        return _serialize(self.memoized.reversed(), None)
+
+    @classmethod
+    def deserialize(cls, data: Dict[int, Any], namespace: Dict[str, Any], memo: Dict[Any, Any]) -> Dict[int, Any]:  ##
+
+        return _deserialize(data, namespace, memo)
+
+
+try:
+    import regex
+    _has_regex = True
+except ImportError:
+    _has_regex = False
+
+if sys.version_info >= (3, 11):
+    import re._parser as sre_parse
+    import re._constants as sre_constants
+else:
+    import sre_parse
+    import sre_constants
+
+categ_pattern = re.compile(r'\\p{[A-Za-z_]+}')
+
+def get_regexp_width(expr: str) -> Union[Tuple[int, int], List[int]]:
+    if _has_regex:
+        ##
+
+        ##
+
+        ##
+
+        regexp_final = re.sub(categ_pattern, 'A', expr)
+    else:
+        if re.search(categ_pattern, expr):
+            raise ImportError('`regex` module must be installed in order to use Unicode categories.', expr)
+        regexp_final = expr
+    try:
+        ##
+
+        return [int(x) for x in sre_parse.parse(regexp_final).getwidth()]
+    except sre_constants.error:
+        if not _has_regex:
+            raise ValueError(expr)
+        else:
+            ##
+
+            ##
+
+            c = regex.compile(regexp_final)
+            ##
+
+            ##
+
+            MAXWIDTH = getattr(sre_parse, "MAXWIDTH", sre_constants.MAXREPEAT)
+            if c.match('') is None:
+                ##
+
+                return 1, int(MAXWIDTH)
+            else:
+                return 0, int(MAXWIDTH)
+
+
+@dataclass(frozen=True)
+class TextSlice(Generic[AnyStr]):
+    #--
+    text: AnyStr
+    start: int
+    end: int
+
+    def __post_init__(self):
+        if not isinstance(self.text, (str, bytes)):
+            raise TypeError("text must be str or bytes")
+
+        if self.start < 0:
+            object.__setattr__(self, 'start', self.start + len(self.text))
+            assert self.start >=0
+
+        if self.end is None:
+            object.__setattr__(self, 'end', len(self.text))
+        elif self.end < 0:
+            object.__setattr__(self, 'end', self.end + len(self.text))
+            assert self.end <= len(self.text)
+
+    @classmethod
+    def cast_from(cls, text: 'TextOrSlice') -> 'TextSlice[AnyStr]':
+        if isinstance(text, TextSlice):
+            return text
+
+        return cls(text, 0, len(text))
+
+    def is_complete_text(self):
+        return self.start == 0 and self.end == len(self.text)
+
+    def __len__(self):
+        return self.end - self.start
+
+    def count(self, substr: AnyStr):
+        return self.text.count(substr, self.start, self.end)
+
+    def rindex(self, substr: AnyStr):
+        return self.text.rindex(substr, self.start, self.end)
+
+
+TextOrSlice = Union[AnyStr, 'TextSlice[AnyStr]']
+LarkInput = Union[AnyStr, TextSlice[AnyStr], Any]
+
+
+
+class Meta:
+
+    empty: bool
+    line: int
+    column: int
+    start_pos: int
+    end_line: int
+    end_column: int
+    end_pos: int
+    orig_expansion: 'List[TerminalDef]'
+    match_tree: bool
+
+    def __init__(self):
+        self.empty = True
+
+
+_Leaf_T = TypeVar("_Leaf_T")
+Branch = Union[_Leaf_T, 'Tree[_Leaf_T]']
+
+
+class Tree(Generic[_Leaf_T]):
+    #--
+
+    data: str
+    children: 'List[Branch[_Leaf_T]]'
+
+    def __init__(self, data: str, children: 'List[Branch[_Leaf_T]]', meta: Optional[Meta]=None) -> None:
+        self.data = data
+        self.children = children
+        self._meta = meta
+
+    @property
+    def meta(self) -> Meta:
+        if self._meta is None:
+            self._meta = Meta()
+        return self._meta
+
+    def __repr__(self):
+        return 'Tree(%r, %r)' % (self.data, self.children)
+
+    __match_args__ = ("data", "children")
+
+    def _pretty_label(self):
+        return self.data
+
+    def _pretty(self, level, indent_str):
+        yield f'{indent_str*level}{self._pretty_label()}'
+        if len(self.children) == 1 and not isinstance(self.children[0], Tree):
+            yield f'\t{self.children[0]}\n'
+        else:
+            yield '\n'
+            for n in self.children:
+                if isinstance(n, Tree):
+                    yield from n._pretty(level+1, indent_str)
+                else:
+                    yield f'{indent_str*(level+1)}{n}\n'
+
+    def pretty(self, indent_str: str='  ') -> str:
+        #--
+        return ''.join(self._pretty(0, indent_str))
+
+    def __rich__(self, parent:Optional['rich.tree.Tree']=None) -> 'rich.tree.Tree':
+        #--
+        return self._rich(parent)
+
+    def _rich(self, parent):
+        if parent:
+            tree = parent.add(f'[bold]{self.data}[/bold]')
+        else:
+            import rich.tree
+            tree = rich.tree.Tree(self.data)
+
+        for c in self.children:
+            if isinstance(c, Tree):
+                c._rich(tree)
+            else:
+                tree.add(f'[green]{c}[/green]')
+
+        return tree
+
+    def __eq__(self, other):
+        try:
+            return self.data == other.data and self.children == other.children
+        except AttributeError:
+            return False
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __hash__(self) -> int:
+        return hash((self.data, tuple(self.children)))
+
+    def iter_subtrees(self) -> 'Iterator[Tree[_Leaf_T]]':
+        #--
+        queue = [self]
+        subtrees = dict()
+        for subtree in queue:
+            subtrees[id(subtree)] = subtree
+            queue += [c for c in reversed(subtree.children)
+                      if isinstance(c, Tree) and id(c) not in subtrees]
+
+        del queue
+        return reversed(list(subtrees.values()))
+
+    def iter_subtrees_topdown(self):
+        #--
+        stack = [self]
+        stack_append = stack.append
+        stack_pop = stack.pop
+        while stack:
+            node = stack_pop()
+            if not isinstance(node, Tree):
+                continue
+            yield node
+            for child in reversed(node.children):
+                stack_append(child)
+
+    def find_pred(self, pred: 'Callable[[Tree[_Leaf_T]], bool]') -> 'Iterator[Tree[_Leaf_T]]':
+        #--
+        return filter(pred, self.iter_subtrees())
+
+    def find_data(self, data: str) -> 'Iterator[Tree[_Leaf_T]]':
+        #--
+        return self.find_pred(lambda t: t.data == data)
+
+
+from functools import wraps, update_wrapper
+from inspect import getmembers, getmro
+
+_Return_T = TypeVar('_Return_T')
+_Return_V = TypeVar('_Return_V')
+_Leaf_T = TypeVar('_Leaf_T')
+_Leaf_U = TypeVar('_Leaf_U')
+_R = TypeVar('_R')
+_FUNC = Callable[..., _Return_T]
+_DECORATED = Union[_FUNC, type]
+
+class _DiscardType:
+    #--
+
+    def __repr__(self):
+        return "lark.visitors.Discard"
+
+Discard = _DiscardType()
+
+##
+
+
+class _Decoratable:
+    #--
+
+    @classmethod
+    def _apply_v_args(cls, visit_wrapper):
+        mro = getmro(cls)
+        assert mro[0] is cls
+        libmembers = {name for _cls in mro[1:] for name, _ in getmembers(_cls)}
+        for name, value in getmembers(cls):
+
+            ##
+
+            if name.startswith('_') or (name in libmembers and name not in cls.__dict__):
+                continue
+            if not callable(value):
+                continue
+
+            ##
+
+            if isinstance(cls.__dict__[name], _VArgsWrapper):
+                continue
+
+            setattr(cls, name, _VArgsWrapper(cls.__dict__[name], visit_wrapper))
+        return cls
+
+    def __class_getitem__(cls, _):
+        return cls
+
+
+class Transformer(_Decoratable, ABC, Generic[_Leaf_T, _Return_T]):
+    #--
+    __visit_tokens__ = True   ##
+
+
+    def __init__(self,  visit_tokens: bool=True) -> None:
+        self.__visit_tokens__ = visit_tokens
+
+    def _call_userfunc(self, tree, new_children=None):
+        ##
+
+        children = new_children if new_children is not None else tree.children
+        try:
+            f = getattr(self, tree.data)
+        except AttributeError:
+            return self.__default__(tree.data, children, tree.meta)
+        else:
+            try:
+                wrapper = getattr(f, 'visit_wrapper', None)
+                if wrapper is not None:
+                    return f.visit_wrapper(f, tree.data, children, tree.meta)
+                else:
+                    return f(children)
+            except GrammarError:
+                raise
+            except Exception as e:
+                raise VisitError(tree.data, tree, e)
+
+    def _call_userfunc_token(self, token):
+        try:
+            f = getattr(self, token.type)
+        except AttributeError:
+            return self.__default_token__(token)
+        else:
+            try:
+                return f(token)
+            except GrammarError:
+                raise
+            except Exception as e:
+                raise VisitError(token.type, token, e)
+
+    def _transform_children(self, children):
+        for c in children:
+            if isinstance(c, Tree):
+                res = self._transform_tree(c)
+            elif self.__visit_tokens__ and isinstance(c, Token):
+                res = self._call_userfunc_token(c)
+            else:
+                res = c
+
+            if res is not Discard:
+                yield res
+
+    def _transform_tree(self, tree):
+        children = list(self._transform_children(tree.children))
+        return self._call_userfunc(tree, children)
+
+    def transform(self, tree: Tree[_Leaf_T]) -> _Return_T:
+        #--
+        res = list(self._transform_children([tree]))
+        if not res:
+            return None     ##
+
+        assert len(res) == 1
+        return res[0]
+
+    def __mul__(
+            self: 'Transformer[_Leaf_T, Tree[_Leaf_U]]',
+            other: 'Union[Transformer[_Leaf_U, _Return_V], TransformerChain[_Leaf_U, _Return_V,]]'
+    ) -> 'TransformerChain[_Leaf_T, _Return_V]':
+        #--
+        return TransformerChain(self, other)
+
+    def __default__(self, data, children, meta):
+        #--
+        return Tree(data, children, meta)
+
+    def __default_token__(self, token):
+        #--
+        return token
+
+
+def merge_transformers(base_transformer=None, **transformers_to_merge):
+    #--
+    if base_transformer is None:
+        base_transformer = Transformer()
+    for prefix, transformer in transformers_to_merge.items():
+        for method_name in dir(transformer):
+            method = getattr(transformer, method_name)
+            if not callable(method):
+                continue
+            if method_name.startswith("_") or method_name == "transform":
+                continue
+            prefixed_method = prefix + "__" + method_name
+            if hasattr(base_transformer, prefixed_method):
+                raise AttributeError("Cannot merge: method '%s' appears more than once" % prefixed_method)
+
+            setattr(base_transformer, prefixed_method, method)
+
+    return base_transformer
+
+
+class InlineTransformer(Transformer):   ##
+
+    def _call_userfunc(self, tree, new_children=None):
+        ##
+
+        children = new_children if new_children is not None else tree.children
+        try:
+            f = getattr(self, tree.data)
+        except AttributeError:
+            return self.__default__(tree.data, children, tree.meta)
+        else:
+            return f(*children)
+
+
+class TransformerChain(Generic[_Leaf_T, _Return_T]):
+
+    transformers: 'Tuple[Union[Transformer, TransformerChain], ...]'
+
+    def __init__(self, *transformers: 'Union[Transformer, TransformerChain]') -> None:
+        self.transformers = transformers
+
+    def transform(self, tree: Tree[_Leaf_T]) -> _Return_T:
+        for t in self.transformers:
+            tree = t.transform(tree)
+        return cast(_Return_T, tree)
+
+    def __mul__(
+            self: 'TransformerChain[_Leaf_T, Tree[_Leaf_U]]',
+            other: 'Union[Transformer[_Leaf_U, _Return_V], TransformerChain[_Leaf_U, _Return_V]]'
+    ) -> 'TransformerChain[_Leaf_T, _Return_V]':
+        return TransformerChain(*self.transformers + (other,))
+
+
+class Transformer_InPlace(Transformer[_Leaf_T, _Return_T]):
+    #--
+    def _transform_tree(self, tree):           ##
+
+        return self._call_userfunc(tree)
+
+    def transform(self, tree: Tree[_Leaf_T]) -> _Return_T:
+        for subtree in tree.iter_subtrees():
+            subtree.children = list(self._transform_children(subtree.children))
+
+        return self._transform_tree(tree)
+
+
+class Transformer_NonRecursive(Transformer[_Leaf_T, _Return_T]):
+    #--
+
+    def transform(self, tree: Tree[_Leaf_T]) -> _Return_T:
+        ##
+
+        rev_postfix = []
+        q: List[Branch[_Leaf_T]] = [tree]
+        while q:
+            t = q.pop()
+            rev_postfix.append(t)
+            if isinstance(t, Tree):
+                q += t.children
+
+        ##
+
+        stack: List = []
+        for x in reversed(rev_postfix):
+            if isinstance(x, Tree):
+                size = len(x.children)
+                if size:
+                    args = stack[-size:]
+                    del stack[-size:]
+                else:
+                    args = []
+
+                res = self._call_userfunc(x, args)
+                if res is not Discard:
+                    stack.append(res)
+
+            elif self.__visit_tokens__ and isinstance(x, Token):
+                res = self._call_userfunc_token(x)
+                if res is not Discard:
+                    stack.append(res)
+            else:
+                stack.append(x)
+
+        result, = stack  ##
+
+        ##
+
+        ##
+
+        ##
+
+        return cast(_Return_T, result)
+
+
+class Transformer_InPlaceRecursive(Transformer[_Leaf_T, _Return_T]):
+    #--
+    def _transform_tree(self, tree):
+        tree.children = list(self._transform_children(tree.children))
+        return self._call_userfunc(tree)
+
+
+##
+
+
+class VisitorBase:
+    def _call_userfunc(self, tree):
+        return getattr(self, tree.data, self.__default__)(tree)
+
+    def __default__(self, tree):
+        #--
+        return tree
+
+    def __class_getitem__(cls, _):
+        return cls
+
+
+class Visitor(VisitorBase, ABC, Generic[_Leaf_T]):
+    #--
+
+    def visit(self, tree: Tree[_Leaf_T]) -> Tree[_Leaf_T]:
+        #--
+        for subtree in tree.iter_subtrees():
+            self._call_userfunc(subtree)
+        return tree
+
+    def visit_topdown(self, tree: Tree[_Leaf_T]) -> Tree[_Leaf_T]:
+        #--
+        for subtree in tree.iter_subtrees_topdown():
+            self._call_userfunc(subtree)
+        return tree
+
+
+class Visitor_Recursive(VisitorBase, Generic[_Leaf_T]):
+    #--
+
+    def visit(self, tree: Tree[_Leaf_T]) -> Tree[_Leaf_T]:
+        #--
+        for child in tree.children:
+            if isinstance(child, Tree):
+                self.visit(child)
+
+        self._call_userfunc(tree)
+        return tree
+
+    def visit_topdown(self,tree: Tree[_Leaf_T]) -> Tree[_Leaf_T]:
+        #--
+        self._call_userfunc(tree)
+
+        for child in tree.children:
+            if isinstance(child, Tree):
+                self.visit_topdown(child)
+
+        return tree
+
+
+class Interpreter(_Decoratable, ABC, Generic[_Leaf_T, _Return_T]):
+    #--
+
+    def visit(self, tree: Tree[_Leaf_T]) -> _Return_T:
+        ##
+
+        ##
+
+        ##
+
+        return self._visit_tree(tree)
+
+    def _visit_tree(self, tree: Tree[_Leaf_T]):
+        f = getattr(self, tree.data)
+        wrapper = getattr(f, 'visit_wrapper', None)
+        if wrapper is not None:
+            return f.visit_wrapper(f, tree.data, tree.children, tree.meta)
+        else:
+            return f(tree)
+
+    def visit_children(self, tree: Tree[_Leaf_T]) -> List:
+        return [self._visit_tree(child) if isinstance(child, Tree) else child
+                for child in tree.children]
+
+    def __getattr__(self, name):
+        return self.__default__
+
+    def __default__(self, tree):
+        return self.visit_children(tree)
+
+
+_InterMethod = Callable[[Type[Interpreter], _Return_T], _R]
+
+def visit_children_decor(func: _InterMethod) -> _InterMethod:
+    #--
+    @wraps(func)
+    def inner(cls, tree):
+        values = cls.visit_children(tree)
+        return func(cls, values)
+    return inner
+
+##
+
+
+def _apply_v_args(obj, visit_wrapper):
+    try:
+        _apply = obj._apply_v_args
+    except AttributeError:
+        return _VArgsWrapper(obj, visit_wrapper)
+    else:
+        return _apply(visit_wrapper)
+
+
+class _VArgsWrapper:
+    #--
+    base_func: Callable
+
+    def __init__(self, func: Callable, visit_wrapper: Callable[[Callable, str, list, Any], Any]):
+        if isinstance(func, _VArgsWrapper):
+            func = func.base_func
+        self.base_func = func
+        self.visit_wrapper = visit_wrapper
+        update_wrapper(self, func)
+
+    def __call__(self, *args, **kwargs):
+        return self.base_func(*args, **kwargs)
+
+    def __get__(self, instance, owner=None):
+        try:
+            ##
+
+            ##
+
+            g = type(self.base_func).__get__
+        except AttributeError:
+            return self
+        else:
+            return _VArgsWrapper(g(self.base_func, instance, owner), self.visit_wrapper)
+
+    def __set_name__(self, owner, name):
+        try:
+            f = type(self.base_func).__set_name__
+        except AttributeError:
+            return
+        else:
+            f(self.base_func, owner, name)
+
+
+def _vargs_inline(f, _data, children, _meta):
+    return f(*children)
+def _vargs_meta_inline(f, _data, children, meta):
+    return f(meta, *children)
+def _vargs_meta(f, _data, children, meta):
+    return f(meta, children)
+def _vargs_tree(f, data, children, meta):
+    return f(Tree(data, children, meta))
+
+
+def v_args(inline: bool = False, meta: bool = False, tree: bool = False, wrapper: Optional[Callable] = None) -> Callable[[_DECORATED], _DECORATED]:
+    #--
+    if tree and (meta or inline):
+        raise ValueError("Visitor functions cannot combine 'tree' with 'meta' or 'inline'.")
+
+    func = None
+    if meta:
+        if inline:
+            func = _vargs_meta_inline
+        else:
+            func = _vargs_meta
+    elif inline:
+        func = _vargs_inline
+    elif tree:
+        func = _vargs_tree
+
+    if wrapper is not None:
+        if func is not None:
+            raise ValueError("Cannot use 'wrapper' along with 'tree', 'meta' or 'inline'.")
+        func = wrapper
+
+    def _visitor_args_dec(obj):
+        return _apply_v_args(obj, func)
+    return _visitor_args_dec
+
+
+
+TOKEN_DEFAULT_PRIORITY = 0
+
+
+class Symbol(Serialize):
+    __slots__ = ('name',)
+
+    name: str
+    is_term: ClassVar[bool] = NotImplemented
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __eq__(self, other):
+        if not isinstance(other, Symbol):
+            return NotImplemented
+        return self.is_term == other.is_term and self.name == other.name
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __hash__(self):
+        return hash(self.name)
+
+    def __repr__(self):
+        return '%s(%r)' % (type(self).__name__, self.name)
+
+    fullrepr = property(__repr__)
+
+    def renamed(self, f):
+        return type(self)(f(self.name))
+
+
+class Terminal(Symbol):
+    __serialize_fields__ = 'name', 'filter_out'
+
+    is_term: ClassVar[bool] = True
+
+    def __init__(self, name: str, filter_out: bool = False) -> None:
+        self.name = name
+        self.filter_out = filter_out
+
+    @property
+    def fullrepr(self):
+        return '%s(%r, %r)' % (type(self).__name__, self.name, self.filter_out)
+
+    def renamed(self, f):
+        return type(self)(f(self.name), self.filter_out)
+
+
+class NonTerminal(Symbol):
+    __serialize_fields__ = 'name',
+
+    is_term: ClassVar[bool] = False
+
+    def serialize(self, memo=None) -> Dict[str, Any]:
+        ##
+
+        ##
+
+        return {'name': str(self.name), '__type__': 'NonTerminal'}
+
+
+class RuleOptions(Serialize):
+    __serialize_fields__ = 'keep_all_tokens', 'expand1', 'priority', 'template_source', 'empty_indices'
+
+    keep_all_tokens: bool
+    expand1: bool
+    priority: Optional[int]
+    template_source: Optional[str]
+    empty_indices: Tuple[bool, ...]
+
+    def __init__(self, keep_all_tokens: bool=False, expand1: bool=False, priority: Optional[int]=None, template_source: Optional[str]=None, empty_indices: Tuple[bool, ...]=()) -> None:
+        self.keep_all_tokens = keep_all_tokens
+        self.expand1 = expand1
+        self.priority = priority
+        self.template_source = template_source
+        self.empty_indices = empty_indices
+
+    def __repr__(self):
+        return 'RuleOptions(%r, %r, %r, %r)' % (
+            self.keep_all_tokens,
+            self.expand1,
+            self.priority,
+            self.template_source
+        )
+
+
+class Rule(Serialize):
+    #--
+    __slots__ = ('origin', 'expansion', 'alias', 'options', 'order', '_hash')
+
+    __serialize_fields__ = 'origin', 'expansion', 'order', 'alias', 'options'
+    __serialize_namespace__ = Terminal, NonTerminal, RuleOptions
+
+    origin: NonTerminal
+    expansion: Sequence[Symbol]
+    order: int
+    alias: Optional[str]
+    options: RuleOptions
+    _hash: int
+
+    def __init__(self, origin: NonTerminal, expansion: Sequence[Symbol],
+                 order: int=0, alias: Optional[str]=None, options: Optional[RuleOptions]=None):
+        self.origin = origin
+        self.expansion = expansion
+        self.alias = alias
+        self.order = order
+        self.options = options or RuleOptions()
+        self._hash = hash((self.origin, tuple(self.expansion)))
+
+    def _deserialize(self):
+        self._hash = hash((self.origin, tuple(self.expansion)))
+
+    def __str__(self):
+        return '<%s : %s>' % (self.origin.name, ' '.join(x.name for x in self.expansion))
+
+    def __repr__(self):
+        return 'Rule(%r, %r, %r, %r)' % (self.origin, self.expansion, self.alias, self.options)
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        if not isinstance(other, Rule):
+            return False
+        return self.origin == other.origin and self.expansion == other.expansion
+
+
+
+from contextlib import suppress
+from copy import copy
+
+try:  ##
+
+    has_interegular = bool(interegular)
+except NameError:
+    has_interegular = False
+
+class Pattern(Serialize, ABC):
+    #--
+
+    value: str
+    flags: Collection[str]
+    raw: Optional[str]
+    type: ClassVar[str]
+
+    def __init__(self, value: str, flags: Collection[str] = (), raw: Optional[str] = None) -> None:
+        self.value = value
+        self.flags = frozenset(flags)
+        self.raw = raw
+
+    def __repr__(self):
+        return repr(self.to_regexp())
+
+    ##
+
+    def __hash__(self):
+        return hash((type(self), self.value, self.flags))
+
+    def __eq__(self, other):
+        return type(self) == type(other) and self.value == other.value and self.flags == other.flags
+
+    @abstractmethod
+    def to_regexp(self) -> str:
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def min_width(self) -> int:
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def max_width(self) -> int:
+        raise NotImplementedError()
+
+    def _get_flags(self, value):
+        for f in self.flags:
+            value = ('(?%s:%s)' % (f, value))
+        return value
+
+
+class PatternStr(Pattern):
+    __serialize_fields__ = 'value', 'flags', 'raw'
+
+    type: ClassVar[str] = "str"
+
+    def to_regexp(self) -> str:
+        return self._get_flags(re.escape(self.value))
+
+    @property
+    def min_width(self) -> int:
+        return len(self.value)
+
+    @property
+    def max_width(self) -> int:
+        return len(self.value)
+
+
+class PatternRE(Pattern):
+    __serialize_fields__ = 'value', 'flags', 'raw', '_width'
+
+    type: ClassVar[str] = "re"
+
+    def to_regexp(self) -> str:
+        return self._get_flags(self.value)
+
+    _width = None
+    def _get_width(self):
+        if self._width is None:
+            self._width = get_regexp_width(self.to_regexp())
+        return self._width
+
+    @property
+    def min_width(self) -> int:
+        return self._get_width()[0]
+
+    @property
+    def max_width(self) -> int:
+        return self._get_width()[1]
+
+
+class TerminalDef(Serialize):
+    #--
+    __serialize_fields__ = 'name', 'pattern', 'priority'
+    __serialize_namespace__ = PatternStr, PatternRE
+
+    name: str
+    pattern: Pattern
+    priority: int
+
+    def __init__(self, name: str, pattern: Pattern, priority: int = TOKEN_DEFAULT_PRIORITY) -> None:
+        assert isinstance(pattern, Pattern), pattern
+        self.name = name
+        self.pattern = pattern
+        self.priority = priority
+
+    def __repr__(self):
+        return '%s(%r, %r)' % (type(self).__name__, self.name, self.pattern)
+
+    def user_repr(self) -> str:
+        if self.name.startswith('__'):  ##
+
+            return self.pattern.raw or self.name
+        else:
+            return self.name
+
+_T = TypeVar('_T', bound="Token")
+
+class Token(str):
+    #--
+    __slots__ = ('type', 'start_pos', 'value', 'line', 'column', 'end_line', 'end_column', 'end_pos')
+
+    __match_args__ = ('type', 'value')
+
+    type: str
+    start_pos: Optional[int]
+    value: Any
+    line: Optional[int]
+    column: Optional[int]
+    end_line: Optional[int]
+    end_column: Optional[int]
+    end_pos: Optional[int]
+
+
+    @overload
+    def __new__(
+            cls,
+            type: str,
+            value: Any,
+            start_pos: Optional[int] = None,
+            line: Optional[int] = None,
+            column: Optional[int] = None,
+            end_line: Optional[int] = None,
+            end_column: Optional[int] = None,
+            end_pos: Optional[int] = None
+    ) -> 'Token':
+        ...
+
+    @overload
+    def __new__(
+            cls,
+            type_: str,
+            value: Any,
+            start_pos: Optional[int] = None,
+            line: Optional[int] = None,
+            column: Optional[int] = None,
+            end_line: Optional[int] = None,
+            end_column: Optional[int] = None,
+            end_pos: Optional[int] = None
+    ) -> 'Token':        ...
+
+    def __new__(cls, *args, **kwargs):
+        if "type_" in kwargs:
+            warnings.warn("`type_` is deprecated use `type` instead", DeprecationWarning)
+
+            if "type" in kwargs:
+                raise TypeError("Error: using both 'type' and the deprecated 'type_' as arguments.")
+            kwargs["type"] = kwargs.pop("type_")
+
+        return cls._future_new(*args, **kwargs)
+
+
+    @classmethod
+    def _future_new(cls, type, value, start_pos=None, line=None, column=None, end_line=None, end_column=None, end_pos=None):
+        inst = super(Token, cls).__new__(cls, value)
+
+        inst.type = type
+        inst.start_pos = start_pos
+        inst.value = value
+        inst.line = line
+        inst.column = column
+        inst.end_line = end_line
+        inst.end_column = end_column
+        inst.end_pos = end_pos
+        return inst
+
+    @overload
+    def update(self, type: Optional[str] = None, value: Optional[Any] = None) -> 'Token':
+        ...
+
+    @overload
+    def update(self, type_: Optional[str] = None, value: Optional[Any] = None) -> 'Token':
+        ...
+
+    def update(self, *args, **kwargs):
+        if "type_" in kwargs:
+            warnings.warn("`type_` is deprecated use `type` instead", DeprecationWarning)
+
+            if "type" in kwargs:
+                raise TypeError("Error: using both 'type' and the deprecated 'type_' as arguments.")
+            kwargs["type"] = kwargs.pop("type_")
+
+        return self._future_update(*args, **kwargs)
+
+    def _future_update(self, type: Optional[str] = None, value: Optional[Any] = None) -> 'Token':
+        return Token.new_borrow_pos(
+            type if type is not None else self.type,
+            value if value is not None else self.value,
+            self
+        )
+
+    @classmethod
+    def new_borrow_pos(cls: Type[_T], type_: str, value: Any, borrow_t: 'Token') -> _T:
+        return cls(type_, value, borrow_t.start_pos, borrow_t.line, borrow_t.column, borrow_t.end_line, borrow_t.end_column, borrow_t.end_pos)
+
+    def __reduce__(self):
+        return (self.__class__, (self.type, self.value, self.start_pos, self.line, self.column))
+
+    def __repr__(self):
+        return 'Token(%r, %r)' % (self.type, self.value)
+
+    def __deepcopy__(self, memo):
+        return Token(self.type, self.value, self.start_pos, self.line, self.column)
+
+    def __eq__(self, other):
+        if isinstance(other, Token) and self.type != other.type:
+            return False
+
+        return str.__eq__(self, other)
+
+    __hash__ = str.__hash__
+
+
+class LineCounter:
+    #--
+
+    __slots__ = 'char_pos', 'line', 'column', 'line_start_pos', 'newline_char'
+
+    def __init__(self, newline_char):
+        self.newline_char = newline_char
+        self.char_pos = 0
+        self.line = 1
+        self.column = 1
+        self.line_start_pos = 0
+
+    def __eq__(self, other):
+        if not isinstance(other, LineCounter):
+            return NotImplemented
+
+        return self.char_pos == other.char_pos and self.newline_char == other.newline_char
+
+    def feed(self, token: TextOrSlice, test_newline=True):
+        #--
+        if test_newline:
+            newlines = token.count(self.newline_char)
+            if newlines:
+                self.line += newlines
+                self.line_start_pos = self.char_pos + token.rindex(self.newline_char) + 1
+
+        self.char_pos += len(token)
+        self.column = self.char_pos - self.line_start_pos + 1
+
+
+class UnlessCallback:
+    def __init__(self, scanner: 'Scanner'):
+        self.scanner = scanner
+
+    def __call__(self, t: Token):
+        res = self.scanner.fullmatch(t.value)
+        if res is not None:
+            t.type = res
+        return t
+
+
+class CallChain:
+    def __init__(self, callback1, callback2, cond):
+        self.callback1 = callback1
+        self.callback2 = callback2
+        self.cond = cond
+
+    def __call__(self, t):
+        t2 = self.callback1(t)
+        return self.callback2(t) if self.cond(t2) else t2
+
+
+def _get_match(re_, regexp, s, flags):
+    m = re_.match(regexp, s, flags)
+    if m:
+        return m.group(0)
+
+def _create_unless(terminals, g_regex_flags, re_, use_bytes):
+    tokens_by_type = classify(terminals, lambda t: type(t.pattern))
+    assert len(tokens_by_type) <= 2, tokens_by_type.keys()
+    embedded_strs = set()
+    callback = {}
+    for retok in tokens_by_type.get(PatternRE, []):
+        unless = []
+        for strtok in tokens_by_type.get(PatternStr, []):
+            if strtok.priority != retok.priority:
+                continue
+            s = strtok.pattern.value
+            if s == _get_match(re_, retok.pattern.to_regexp(), s, g_regex_flags):
+                unless.append(strtok)
+                if strtok.pattern.flags <= retok.pattern.flags:
+                    embedded_strs.add(strtok)
+        if unless:
+            callback[retok.name] = UnlessCallback(Scanner(unless, g_regex_flags, re_, use_bytes=use_bytes))
+
+    new_terminals = [t for t in terminals if t not in embedded_strs]
+    return new_terminals, callback
+
+
+class Scanner:
+    def __init__(self, terminals, g_regex_flags, re_, use_bytes):
+        self.terminals = terminals
+        self.g_regex_flags = g_regex_flags
+        self.re_ = re_
+        self.use_bytes = use_bytes
+
+        self.allowed_types = {t.name for t in self.terminals}
+
+        self._mres = self._build_mres(terminals, len(terminals))
+
+    def _build_mres(self, terminals, max_size):
+        ##
+
+        ##
+
+        ##
+
+        mres = []
+        while terminals:
+            pattern = u'|'.join(u'(?P<%s>%s)' % (t.name, t.pattern.to_regexp()) for t in terminals[:max_size])
+            if self.use_bytes:
+                pattern = pattern.encode('latin-1')
+            try:
+                mre = self.re_.compile(pattern, self.g_regex_flags)
+            except AssertionError:  ##
+
+                return self._build_mres(terminals, max_size // 2)
+
+            mres.append(mre)
+            terminals = terminals[max_size:]
+        return mres
+
+    def match(self, text: TextSlice, pos):
+        for mre in self._mres:
+            m = mre.match(text.text, pos, text.end)
+            if m:
+                return m.group(0), m.lastgroup
+
+
+    def fullmatch(self, text: str) -> Optional[str]:
+        for mre in self._mres:
+            m = mre.fullmatch(text)
+            if m:
+                return m.lastgroup
+        return None
+
+def _regexp_has_newline(r: str):
+    #--
+    return '\n' in r or '\\n' in r or '\\s' in r or '[^' in r or ('(?s' in r and '.' in r)
+
+
+class LexerState:
+    #--
+
+    __slots__ = 'text', 'line_ctr', 'last_token'
+
+    text: TextSlice
+    line_ctr: LineCounter
+    last_token: Optional[Token]
+
+    def __init__(self, text: TextSlice, line_ctr: Optional[LineCounter] = None, last_token: Optional[Token]=None):
+        if isinstance(text, TextSlice):
+            if line_ctr is None:
+                line_ctr = LineCounter(b'\n' if isinstance(text.text, bytes) else '\n')
+
+                if text.start > 0:
+                    ##
+
+                    line_ctr.feed(TextSlice(text.text, 0, text.start))
+
+            if not (text.start <= line_ctr.char_pos <= text.end):
+                raise ValueError("LineCounter.char_pos is out of bounds")
+
+        self.text = text
+        self.line_ctr = line_ctr
+        self.last_token = last_token
+
+
+    def __eq__(self, other):
+        if not isinstance(other, LexerState):
+            return NotImplemented
+
+        return self.text == other.text and self.line_ctr == other.line_ctr and self.last_token == other.last_token
+
+    def __copy__(self):
+        return type(self)(self.text, copy(self.line_ctr), self.last_token)
+
+
+class LexerThread:
+    #--
+
+    def __init__(self, lexer: 'Lexer', lexer_state: Optional[LexerState]):
+        self.lexer = lexer
+        self.state = lexer_state
+
+    @classmethod
+    def from_text(cls, lexer: 'Lexer', text_or_slice: TextOrSlice) -> 'LexerThread':
+        text = TextSlice.cast_from(text_or_slice)
+        return cls(lexer, LexerState(text))
+
+    @classmethod
+    def from_custom_input(cls, lexer: 'Lexer', text: Any) -> 'LexerThread':
+        return cls(lexer, LexerState(text))
+
+    def lex(self, parser_state):
+        if self.state is None:
+            raise TypeError("Cannot lex: No text assigned to lexer state")
+        return self.lexer.lex(self.state, parser_state)
+
+    def __copy__(self):
+        return type(self)(self.lexer, copy(self.state))
+
+    _Token = Token
+
+
+_Callback = Callable[[Token], Token]
+
+class Lexer(ABC):
+    #--
+    @abstractmethod
+    def lex(self, lexer_state: LexerState, parser_state: Any) -> Iterator[Token]:
+        return NotImplemented
+
+    def make_lexer_state(self, text: str):
+        #--
+        return LexerState(TextSlice.cast_from(text))
+
+
+def _check_regex_collisions(terminal_to_regexp: Dict[TerminalDef, str], comparator, strict_mode, max_collisions_to_show=8):
+    if not comparator:
+        comparator = interegular.Comparator.from_regexes(terminal_to_regexp)
+
+    ##
+
+    ##
+
+    max_time = 2 if strict_mode else 0.2
+
+    ##
+
+    if comparator.count_marked_pairs() >= max_collisions_to_show:
+        return
+    for group in classify(terminal_to_regexp, lambda t: t.priority).values():
+        for a, b in comparator.check(group, skip_marked=True):
+            assert a.priority == b.priority
+            ##
+
+            comparator.mark(a, b)
+
+            ##
+
+            message = f"Collision between Terminals {a.name} and {b.name}. "
+            try:
+                example = comparator.get_example_overlap(a, b, max_time).format_multiline()
+            except ValueError:
+                ##
+
+                example = "No example could be found fast enough. However, the collision does still exists"
+            if strict_mode:
+                raise LexError(f"{message}\n{example}")
+            logger.warning("%s The lexer will choose between them arbitrarily.\n%s", message, example)
+            if comparator.count_marked_pairs() >= max_collisions_to_show:
+                logger.warning("Found 8 regex collisions, will not check for more.")
+                return
+
+
+class AbstractBasicLexer(Lexer):
+    terminals_by_name: Dict[str, TerminalDef]
+
+    @abstractmethod
+    def __init__(self, conf: 'LexerConf', comparator=None) -> None:
+        ...
+
+    @abstractmethod
+    def next_token(self, lex_state: LexerState, parser_state: Any = None) -> Token:
+        ...
+
+    def lex(self, state: LexerState, parser_state: Any) -> Iterator[Token]:
+        with suppress(EOFError):
+            while True:
+                yield self.next_token(state, parser_state)
+
+
+class BasicLexer(AbstractBasicLexer):
+    terminals: Collection[TerminalDef]
+    ignore_types: FrozenSet[str]
+    newline_types: FrozenSet[str]
+    user_callbacks: Dict[str, _Callback]
+    callback: Dict[str, _Callback]
+    re: ModuleType
+
+    def __init__(self, conf: 'LexerConf', comparator=None) -> None:
+        terminals = list(conf.terminals)
+        assert all(isinstance(t, TerminalDef) for t in terminals), terminals
+
+        self.re = conf.re_module
+
+        if not conf.skip_validation:
+            ##
+
+            terminal_to_regexp = {}
+            for t in terminals:
+                regexp = t.pattern.to_regexp()
+                try:
+                    self.re.compile(regexp, conf.g_regex_flags)
+                except self.re.error:
+                    raise LexError("Cannot compile token %s: %s" % (t.name, t.pattern))
+
+                if t.pattern.min_width == 0:
+                    raise LexError("Lexer does not allow zero-width terminals. (%s: %s)" % (t.name, t.pattern))
+                if t.pattern.type == "re":
+                    terminal_to_regexp[t] = regexp
+
+            if not (set(conf.ignore) <= {t.name for t in terminals}):
+                raise LexError("Ignore terminals are not defined: %s" % (set(conf.ignore) - {t.name for t in terminals}))
+
+            if has_interegular:
+                _check_regex_collisions(terminal_to_regexp, comparator, conf.strict)
+            elif conf.strict:
+                raise LexError("interegular must be installed for strict mode. Use `pip install 'lark[interegular]'`.")
+
+        ##
+
+        self.newline_types = frozenset(t.name for t in terminals if _regexp_has_newline(t.pattern.to_regexp()))
+        self.ignore_types = frozenset(conf.ignore)
+
+        terminals.sort(key=lambda x: (-x.priority, -x.pattern.max_width, -len(x.pattern.value), x.name))
+        self.terminals = terminals
+        self.user_callbacks = conf.callbacks
+        self.g_regex_flags = conf.g_regex_flags
+        self.use_bytes = conf.use_bytes
+        self.terminals_by_name = conf.terminals_by_name
+
+        self._scanner: Optional[Scanner] = None
+
+    def _build_scanner(self) -> Scanner:
+        terminals, self.callback = _create_unless(self.terminals, self.g_regex_flags, self.re, self.use_bytes)
+        assert all(self.callback.values())
+
+        for type_, f in self.user_callbacks.items():
+            if type_ in self.callback:
+                ##
+
+                self.callback[type_] = CallChain(self.callback[type_], f, lambda t: t.type == type_)
+            else:
+                self.callback[type_] = f
+
+        return Scanner(terminals, self.g_regex_flags, self.re, self.use_bytes)
+
+    @property
+    def scanner(self) -> Scanner:
+        if self._scanner is None:
+            self._scanner = self._build_scanner()
+        return self._scanner
+
+    def match(self, text, pos):
+        return self.scanner.match(text, pos)
+
+    def next_token(self, lex_state: LexerState, parser_state: Any = None) -> Token:
+        line_ctr = lex_state.line_ctr
+        while line_ctr.char_pos < lex_state.text.end:
+            res = self.match(lex_state.text, line_ctr.char_pos)
+            if not res:
+                allowed = self.scanner.allowed_types - self.ignore_types
+                if not allowed:
+                    allowed = {"<END-OF-FILE>"}
+                raise UnexpectedCharacters(lex_state.text.text, line_ctr.char_pos, line_ctr.line, line_ctr.column,
+                                           allowed=allowed, token_history=lex_state.last_token and [lex_state.last_token],
+                                           state=parser_state, terminals_by_name=self.terminals_by_name)
+
+            value, type_ = res
+
+            ignored = type_ in self.ignore_types
+            t = None
+            if not ignored or type_ in self.callback:
+                t = Token(type_, value, line_ctr.char_pos, line_ctr.line, line_ctr.column)
+            line_ctr.feed(value, type_ in self.newline_types)
+            if t is not None:
+                t.end_line = line_ctr.line
+                t.end_column = line_ctr.column
+                t.end_pos = line_ctr.char_pos
+                if t.type in self.callback:
+                    t = self.callback[t.type](t)
+                if not ignored:
+                    if not isinstance(t, Token):
+                        raise LexError("Callbacks must return a token (returned %r)" % t)
+                    lex_state.last_token = t
+                    return t
+
+        ##
+
+        raise EOFError(self)
+
+
+class ContextualLexer(Lexer):
+    lexers: Dict[int, AbstractBasicLexer]
+    root_lexer: AbstractBasicLexer
+
+    BasicLexer: Type[AbstractBasicLexer] = BasicLexer
+
+    def __init__(self, conf: 'LexerConf', states: Dict[int, Collection[str]], always_accept: Collection[str]=()) -> None:
+        terminals = list(conf.terminals)
+        terminals_by_name = conf.terminals_by_name
+
+        trad_conf = copy(conf)
+        trad_conf.terminals = terminals
+
+        if has_interegular and not conf.skip_validation:
+            comparator = interegular.Comparator.from_regexes({t: t.pattern.to_regexp() for t in terminals})
+        else:
+            comparator = None
+        lexer_by_tokens: Dict[FrozenSet[str], AbstractBasicLexer] = {}
+        self.lexers = {}
+        for state, accepts in states.items():
+            key = frozenset(accepts)
+            try:
+                lexer = lexer_by_tokens[key]
+            except KeyError:
+                accepts = set(accepts) | set(conf.ignore) | set(always_accept)
+                lexer_conf = copy(trad_conf)
+                lexer_conf.terminals = [terminals_by_name[n] for n in accepts if n in terminals_by_name]
+                lexer = self.BasicLexer(lexer_conf, comparator)
+                lexer_by_tokens[key] = lexer
+
+            self.lexers[state] = lexer
+
+        assert trad_conf.terminals is terminals
+        trad_conf.skip_validation = True  ##
+
+        self.root_lexer = self.BasicLexer(trad_conf, comparator)
+
+    def lex(self, lexer_state: LexerState, parser_state: 'ParserState') -> Iterator[Token]:
+        try:
+            while True:
+                lexer = self.lexers[parser_state.position]
+                yield lexer.next_token(lexer_state, parser_state)
+        except EOFError:
+            pass
+        except UnexpectedCharacters as e:
+            ##
+
+            ##
+
+            try:
+                last_token = lexer_state.last_token  ##
+
+                token = self.root_lexer.next_token(lexer_state, parser_state)
+                raise UnexpectedToken(token, e.allowed, state=parser_state, token_history=[last_token], terminals_by_name=self.root_lexer.terminals_by_name)
+            except UnexpectedCharacters:
+                raise e  ##
+
+
+
+
+_ParserArgType: 'TypeAlias' = 'Literal["earley", "lalr", "cyk", "auto"]'
+_LexerArgType: 'TypeAlias' = 'Union[Literal["auto", "basic", "contextual", "dynamic", "dynamic_complete"], Type[Lexer]]'
+_LexerCallback = Callable[[Token], Token]
+ParserCallbacks = Dict[str, Callable]
+
+class LexerConf(Serialize):
+    __serialize_fields__ = 'terminals', 'ignore', 'g_regex_flags', 'use_bytes', 'lexer_type'
+    __serialize_namespace__ = TerminalDef,
+
+    terminals: Collection[TerminalDef]
+    re_module: ModuleType
+    ignore: Collection[str]
+    postlex: 'Optional[PostLex]'
+    callbacks: Dict[str, _LexerCallback]
+    g_regex_flags: int
+    skip_validation: bool
+    use_bytes: bool
+    lexer_type: Optional[_LexerArgType]
+    strict: bool
+
+    def __init__(self, terminals: Collection[TerminalDef], re_module: ModuleType, ignore: Collection[str]=(), postlex: 'Optional[PostLex]'=None,
+                 callbacks: Optional[Dict[str, _LexerCallback]]=None, g_regex_flags: int=0, skip_validation: bool=False, use_bytes: bool=False, strict: bool=False):
+        self.terminals = terminals
+        self.terminals_by_name = {t.name: t for t in self.terminals}
+        assert len(self.terminals) == len(self.terminals_by_name)
+        self.ignore = ignore
+        self.postlex = postlex
+        self.callbacks = callbacks or {}
+        self.g_regex_flags = g_regex_flags
+        self.re_module = re_module
+        self.skip_validation = skip_validation
+        self.use_bytes = use_bytes
+        self.strict = strict
+        self.lexer_type = None
+
+    def _deserialize(self):
+        self.terminals_by_name = {t.name: t for t in self.terminals}
+
+    def __deepcopy__(self, memo=None):
+        return type(self)(
+            deepcopy(self.terminals, memo),
+            self.re_module,
+            deepcopy(self.ignore, memo),
+            deepcopy(self.postlex, memo),
+            deepcopy(self.callbacks, memo),
+            deepcopy(self.g_regex_flags, memo),
+            deepcopy(self.skip_validation, memo),
+            deepcopy(self.use_bytes, memo),
+        )
+
+class ParserConf(Serialize):
+    __serialize_fields__ = 'rules', 'start', 'parser_type'
+
+    rules: List['Rule']
+    callbacks: ParserCallbacks
+    start: List[str]
+    parser_type: _ParserArgType
+
+    def __init__(self, rules: List['Rule'], callbacks: ParserCallbacks, start: List[str]):
+        assert isinstance(start, list)
+        self.rules = rules
+        self.callbacks = callbacks
+        self.start = start
+
+
+from functools import partial, wraps
+from itertools import product
+
+
+class ExpandSingleChild:
+    def __init__(self, node_builder):
+        self.node_builder = node_builder
+
+    def __call__(self, children):
+        if len(children) == 1:
+            return children[0]
+        else:
+            return self.node_builder(children)
+
+
+
+class PropagatePositions:
+    def __init__(self, node_builder, node_filter=None):
+        self.node_builder = node_builder
+        self.node_filter = node_filter
+
+    def __call__(self, children):
+        res = self.node_builder(children)
+
+        if isinstance(res, Tree):
+            ##
+
+            ##
+
+            ##
+
+            ##
+
+
+            res_meta = res.meta
+
+            first_meta = self._pp_get_meta(children)
+            if first_meta is not None:
+                if not hasattr(res_meta, 'line'):
+                    ##
+
+                    res_meta.line = getattr(first_meta, 'container_line', first_meta.line)
+                    res_meta.column = getattr(first_meta, 'container_column', first_meta.column)
+                    res_meta.start_pos = getattr(first_meta, 'container_start_pos', first_meta.start_pos)
+                    res_meta.empty = False
+
+                res_meta.container_line = getattr(first_meta, 'container_line', first_meta.line)
+                res_meta.container_column = getattr(first_meta, 'container_column', first_meta.column)
+                res_meta.container_start_pos = getattr(first_meta, 'container_start_pos', first_meta.start_pos)
+
+            last_meta = self._pp_get_meta(reversed(children))
+            if last_meta is not None:
+                if not hasattr(res_meta, 'end_line'):
+                    res_meta.end_line = getattr(last_meta, 'container_end_line', last_meta.end_line)
+                    res_meta.end_column = getattr(last_meta, 'container_end_column', last_meta.end_column)
+                    res_meta.end_pos = getattr(last_meta, 'container_end_pos', last_meta.end_pos)
+                    res_meta.empty = False
+
+                res_meta.container_end_line = getattr(last_meta, 'container_end_line', last_meta.end_line)
+                res_meta.container_end_column = getattr(last_meta, 'container_end_column', last_meta.end_column)
+                res_meta.container_end_pos = getattr(last_meta, 'container_end_pos', last_meta.end_pos)
+
+        return res
+
+    def _pp_get_meta(self, children):
+        for c in children:
+            if self.node_filter is not None and not self.node_filter(c):
+                continue
+            if isinstance(c, Tree):
+                if not c.meta.empty:
+                    return c.meta
+            elif isinstance(c, Token):
+                return c
+            elif hasattr(c, '__lark_meta__'):
+                return c.__lark_meta__()
+
+def make_propagate_positions(option):
+    if callable(option):
+        return partial(PropagatePositions, node_filter=option)
+    elif option is True:
+        return PropagatePositions
+    elif option is False:
+        return None
+
+    raise ConfigurationError('Invalid option for propagate_positions: %r' % option)
+
+
+class ChildFilter:
+    def __init__(self, to_include, append_none, node_builder):
+        self.node_builder = node_builder
+        self.to_include = to_include
+        self.append_none = append_none
+
+    def __call__(self, children):
+        filtered = []
+
+        for i, to_expand, add_none in self.to_include:
+            if add_none:
+                filtered += [None] * add_none
+            if to_expand:
+                filtered += children[i].children
+            else:
+                filtered.append(children[i])
+
+        if self.append_none:
+            filtered += [None] * self.append_none
+
+        return self.node_builder(filtered)
+
+
+class ChildFilterLALR(ChildFilter):
+    #--
+
+    def __call__(self, children):
+        filtered = []
+        for i, to_expand, add_none in self.to_include:
+            if add_none:
+                filtered += [None] * add_none
+            if to_expand:
+                if filtered:
+                    filtered += children[i].children
+                else:   ##
+
+                    filtered = children[i].children
+            else:
+                filtered.append(children[i])
+
+        if self.append_none:
+            filtered += [None] * self.append_none
+
+        return self.node_builder(filtered)
+
+
+class ChildFilterLALR_NoPlaceholders(ChildFilter):
+    #--
+    def __init__(self, to_include, node_builder):
+        self.node_builder = node_builder
+        self.to_include = to_include
+
+    def __call__(self, children):
+        filtered = []
+        for i, to_expand in self.to_include:
+            if to_expand:
+                if filtered:
+                    filtered += children[i].children
+                else:   ##
+
+                    filtered = children[i].children
+            else:
+                filtered.append(children[i])
+        return self.node_builder(filtered)
+
+
+def _should_expand(sym):
+    return not sym.is_term and sym.name.startswith('_')
+
+
+def maybe_create_child_filter(expansion, keep_all_tokens, ambiguous, _empty_indices: List[bool]):
+    ##
+
+    if _empty_indices:
+        assert _empty_indices.count(False) == len(expansion)
+        s = ''.join(str(int(b)) for b in _empty_indices)
+        empty_indices = [len(ones) for ones in s.split('0')]
+        assert len(empty_indices) == len(expansion)+1, (empty_indices, len(expansion))
+    else:
+        empty_indices = [0] * (len(expansion)+1)
+
+    to_include = []
+    nones_to_add = 0
+    for i, sym in enumerate(expansion):
+        nones_to_add += empty_indices[i]
+        if keep_all_tokens or not (sym.is_term and sym.filter_out):
+            to_include.append((i, _should_expand(sym), nones_to_add))
+            nones_to_add = 0
+
+    nones_to_add += empty_indices[len(expansion)]
+
+    if _empty_indices or len(to_include) < len(expansion) or any(to_expand for i, to_expand,_ in to_include):
+        if _empty_indices or ambiguous:
+            return partial(ChildFilter if ambiguous else ChildFilterLALR, to_include, nones_to_add)
+        else:
+            ##
+
+            return partial(ChildFilterLALR_NoPlaceholders, [(i, x) for i,x,_ in to_include])
+
+
+class AmbiguousExpander:
+    #--
+    def __init__(self, to_expand, tree_class, node_builder):
+        self.node_builder = node_builder
+        self.tree_class = tree_class
+        self.to_expand = to_expand
+
+    def __call__(self, children):
+        def _is_ambig_tree(t):
+            return hasattr(t, 'data') and t.data == '_ambig'
+
+        ##
+
+        ##
+
+        ##
+
+        ##
+
+        ambiguous = []
+        for i, child in enumerate(children):
+            if _is_ambig_tree(child):
+                if i in self.to_expand:
+                    ambiguous.append(i)
+
+                child.expand_kids_by_data('_ambig')
+
+        if not ambiguous:
+            return self.node_builder(children)
+
+        expand = [child.children if i in ambiguous else (child,) for i, child in enumerate(children)]
+        return self.tree_class('_ambig', [self.node_builder(list(f)) for f in product(*expand)])
+
+
+def maybe_create_ambiguous_expander(tree_class, expansion, keep_all_tokens):
+    to_expand = [i for i, sym in enumerate(expansion)
+                 if keep_all_tokens or ((not (sym.is_term and sym.filter_out)) and _should_expand(sym))]
+    if to_expand:
+        return partial(AmbiguousExpander, to_expand, tree_class)
+
+
+class AmbiguousIntermediateExpander:
+    #--
+
+    def __init__(self, tree_class, node_builder):
+        self.node_builder = node_builder
+        self.tree_class = tree_class
+
+    def __call__(self, children):
+        def _is_iambig_tree(child):
+            return hasattr(child, 'data') and child.data == '_iambig'
+
+        def _collapse_iambig(children):
+            #--
+
+            ##
+
+            ##
+
+            if children and _is_iambig_tree(children[0]):
+                iambig_node = children[0]
+                result = []
+                for grandchild in iambig_node.children:
+                    collapsed = _collapse_iambig(grandchild.children)
+                    if collapsed:
+                        for child in collapsed:
+                            child.children += children[1:]
+                        result += collapsed
+                    else:
+                        new_tree = self.tree_class('_inter', grandchild.children + children[1:])
+                        result.append(new_tree)
+                return result
+
+        collapsed = _collapse_iambig(children)
+        if collapsed:
+            processed_nodes = [self.node_builder(c.children) for c in collapsed]
+            return self.tree_class('_ambig', processed_nodes)
+
+        return self.node_builder(children)
+
+
+
+def inplace_transformer(func):
+    @wraps(func)
+    def f(children):
+        ##
+
+        tree = Tree(func.__name__, children)
+        return func(tree)
+    return f
+
+
+def apply_visit_wrapper(func, name, wrapper):
+    if wrapper is _vargs_meta or wrapper is _vargs_meta_inline:
+        raise NotImplementedError("Meta args not supported for internal transformer; use YourTransformer().transform(parser.parse()) instead")
+
+    @wraps(func)
+    def f(children):
+        return wrapper(func, name, children, None)
+    return f
+
+
+class ParseTreeBuilder:
+    def __init__(self, rules, tree_class, propagate_positions=False, ambiguous=False, maybe_placeholders=False):
+        self.tree_class = tree_class
+        self.propagate_positions = propagate_positions
+        self.ambiguous = ambiguous
+        self.maybe_placeholders = maybe_placeholders
+
+        self.rule_builders = list(self._init_builders(rules))
+
+    def _init_builders(self, rules):
+        propagate_positions = make_propagate_positions(self.propagate_positions)
+
+        for rule in rules:
+            options = rule.options
+            keep_all_tokens = options.keep_all_tokens
+            expand_single_child = options.expand1
+
+            wrapper_chain = list(filter(None, [
+                (expand_single_child and not rule.alias) and ExpandSingleChild,
+                maybe_create_child_filter(rule.expansion, keep_all_tokens, self.ambiguous, options.empty_indices if self.maybe_placeholders else None),
+                propagate_positions,
+                self.ambiguous and maybe_create_ambiguous_expander(self.tree_class, rule.expansion, keep_all_tokens),
+                self.ambiguous and partial(AmbiguousIntermediateExpander, self.tree_class)
+            ]))
+
+            yield rule, wrapper_chain
+
+    def create_callback(self, transformer=None):
+        callbacks = {}
+
+        default_handler = getattr(transformer, '__default__', None)
+        if default_handler:
+            def default_callback(data, children):
+                return default_handler(data, children, None)
+        else:
+            default_callback = self.tree_class
+
+        for rule, wrapper_chain in self.rule_builders:
+
+            user_callback_name = rule.alias or rule.options.template_source or rule.origin.name
+            try:
+                f = getattr(transformer, user_callback_name)
+                wrapper = getattr(f, 'visit_wrapper', None)
+                if wrapper is not None:
+                    f = apply_visit_wrapper(f, user_callback_name, wrapper)
+                elif isinstance(transformer, Transformer_InPlace):
+                    f = inplace_transformer(f)
+            except AttributeError:
+                f = partial(default_callback, user_callback_name)
+
+            for w in wrapper_chain:
+                f = w(f)
+
+            if rule in callbacks:
+                raise GrammarError("Rule '%s' already exists" % (rule,))
+
+            callbacks[rule] = f
+
+        return callbacks
+
+
+
+class Action:
+    def __init__(self, name):
+        self.name = name
+    def __str__(self):
+        return self.name
+    def __repr__(self):
+        return str(self)
+
+Shift = Action('Shift')
+Reduce = Action('Reduce')
+
+StateT = TypeVar("StateT")
+
+class ParseTableBase(Generic[StateT]):
+    states: Dict[StateT, Dict[str, Tuple]]
+    start_states: Dict[str, StateT]
+    end_states: Dict[str, StateT]
+
+    def __init__(self, states, start_states, end_states):
+        self.states = states
+        self.start_states = start_states
+        self.end_states = end_states
+
+    def serialize(self, memo):
+        tokens = Enumerator()
+
+        states = {
+            state: {tokens.get(token): ((1, arg.serialize(memo)) if action is Reduce else (0, arg))
+                    for token, (action, arg) in actions.items()}
+            for state, actions in self.states.items()
+        }
+
+        return {
+            'tokens': tokens.reversed(),
+            'states': states,
+            'start_states': self.start_states,
+            'end_states': self.end_states,
+        }
+
+    @classmethod
+    def deserialize(cls, data, memo):
+        tokens = data['tokens']
+        states = {
+            state: {tokens[token]: ((Reduce, Rule.deserialize(arg, memo)) if action==1 else (Shift, arg))
+                    for token, (action, arg) in actions.items()}
+            for state, actions in data['states'].items()
+        }
+        return cls(states, data['start_states'], data['end_states'])
+
+class ParseTable(ParseTableBase['State']):
+    #--
+    pass
+
+
+class IntParseTable(ParseTableBase[int]):
+    #--
+
+    @classmethod
+    def from_ParseTable(cls, parse_table: ParseTable):
+        enum = list(parse_table.states)
+        state_to_idx: Dict['State', int] = {s:i for i,s in enumerate(enum)}
+        int_states = {}
+
+        for s, la in parse_table.states.items():
+            la = {k:(v[0], state_to_idx[v[1]]) if v[0] is Shift else v
+                  for k,v in la.items()}
+            int_states[ state_to_idx[s] ] = la
+
+
+        start_states = {start:state_to_idx[s] for start, s in parse_table.start_states.items()}
+        end_states = {start:state_to_idx[s] for start, s in parse_table.end_states.items()}
+        return cls(int_states, start_states, end_states)
+
+
+
+class ParseConf(Generic[StateT]):
+    __slots__ = 'parse_table', 'callbacks', 'start', 'start_state', 'end_state', 'states'
+
+    parse_table: ParseTableBase[StateT]
+    callbacks: ParserCallbacks
+    start: str
+
+    start_state: StateT
+    end_state: StateT
+    states: Dict[StateT, Dict[str, tuple]]
+
+    def __init__(self, parse_table: ParseTableBase[StateT], callbacks: ParserCallbacks, start: str):
+        self.parse_table = parse_table
+
+        self.start_state = self.parse_table.start_states[start]
+        self.end_state = self.parse_table.end_states[start]
+        self.states = self.parse_table.states
+
+        self.callbacks = callbacks
+        self.start = start
+
+class ParserState(Generic[StateT]):
+    __slots__ = 'parse_conf', 'lexer', 'state_stack', 'value_stack'
+
+    parse_conf: ParseConf[StateT]
+    lexer: LexerThread
+    state_stack: List[StateT]
+    value_stack: list
+
+    def __init__(self, parse_conf: ParseConf[StateT], lexer: LexerThread, state_stack=None, value_stack=None):
+        self.parse_conf = parse_conf
+        self.lexer = lexer
+        self.state_stack = state_stack or [self.parse_conf.start_state]
+        self.value_stack = value_stack or []
+
+    @property
+    def position(self) -> StateT:
+        return self.state_stack[-1]
+
+    ##
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ParserState):
+            return NotImplemented
+        return len(self.state_stack) == len(other.state_stack) and self.position == other.position
+
+    def __copy__(self):
+        return self.copy()
+
+    def copy(self, deepcopy_values=True) -> 'ParserState[StateT]':
+        return type(self)(
+            self.parse_conf,
+            self.lexer, ##
+
+            copy(self.state_stack),
+            deepcopy(self.value_stack) if deepcopy_values else copy(self.value_stack),
+        )
+
+    def feed_token(self, token: Token, is_end=False) -> Any:
+        state_stack = self.state_stack
+        value_stack = self.value_stack
+        states = self.parse_conf.states
+        end_state = self.parse_conf.end_state
+        callbacks = self.parse_conf.callbacks
+
+        while True:
+            state = state_stack[-1]
+            try:
+                action, arg = states[state][token.type]
+            except KeyError:
+                expected = {s for s in states[state].keys() if s.isupper()}
+                raise UnexpectedToken(token, expected, state=self, interactive_parser=None)
+
+            assert arg != end_state
+
+            if action is Shift:
+                ##
+
+                assert not is_end
+                state_stack.append(arg)
+                value_stack.append(token if token.type not in callbacks else callbacks[token.type](token))
+                return
+            else:
+                ##
+
+                rule = arg
+                size = len(rule.expansion)
+                if size:
+                    s = value_stack[-size:]
+                    del state_stack[-size:]
+                    del value_stack[-size:]
+                else:
+                    s = []
+
+                value = callbacks[rule](s) if callbacks else s
+
+                _action, new_state = states[state_stack[-1]][rule.origin.name]
+                assert _action is Shift
+                state_stack.append(new_state)
+                value_stack.append(value)
+
+                if is_end and state_stack[-1] == end_state:
+                    return value_stack[-1]
+
+
+class LALR_Parser(Serialize):
+    def __init__(self, parser_conf: ParserConf, debug: bool=False, strict: bool=False):
+        analysis = LALR_Analyzer(parser_conf, debug=debug, strict=strict)
+        analysis.compute_lalr()
+        callbacks = parser_conf.callbacks
+
+        self._parse_table = analysis.parse_table
+        self.parser_conf = parser_conf
+        self.parser = _Parser(analysis.parse_table, callbacks, debug)
+
+    @classmethod
+    def deserialize(cls, data, memo, callbacks, debug=False):
+        inst = cls.__new__(cls)
+        inst._parse_table = IntParseTable.deserialize(data, memo)
+        inst.parser = _Parser(inst._parse_table, callbacks, debug)
+        return inst
+
+    def serialize(self, memo: Any = None) -> Dict[str, Any]:
+        return self._parse_table.serialize(memo)
+
+    def parse_interactive(self, lexer: LexerThread, start: str):
+        return self.parser.parse(lexer, start, start_interactive=True)
+
+    def parse(self, lexer, start, on_error=None):
+        try:
+            return self.parser.parse(lexer, start)
+        except UnexpectedInput as e:
+            if on_error is None:
+                raise
+
+            while True:
+                if isinstance(e, UnexpectedCharacters):
+                    s = e.interactive_parser.lexer_thread.state
+                    p = s.line_ctr.char_pos
+
+                if not on_error(e):
+                    raise e
+
+                if isinstance(e, UnexpectedCharacters):
+                    ##
+
+                    if p == s.line_ctr.char_pos:
+                        s.line_ctr.feed(s.text.text[p:p+1])
+
+                try:
+                    return e.interactive_parser.resume_parse()
+                except UnexpectedToken as e2:
+                    if (isinstance(e, UnexpectedToken)
+                        and e.token.type == e2.token.type == '$END'
+                        and e.interactive_parser == e2.interactive_parser):
+                        ##
+
+                        raise e2
+                    e = e2
+                except UnexpectedCharacters as e2:
+                    e = e2
+
+
+class _Parser:
+    parse_table: ParseTableBase
+    callbacks: ParserCallbacks
+    debug: bool
+
+    def __init__(self, parse_table: ParseTableBase, callbacks: ParserCallbacks, debug: bool=False):
+        self.parse_table = parse_table
+        self.callbacks = callbacks
+        self.debug = debug
+
+    def parse(self, lexer: LexerThread, start: str, value_stack=None, state_stack=None, start_interactive=False):
+        parse_conf = ParseConf(self.parse_table, self.callbacks, start)
+        parser_state = ParserState(parse_conf, lexer, state_stack, value_stack)
+        if start_interactive:
+            return InteractiveParser(self, parser_state, parser_state.lexer)
+        return self.parse_from_state(parser_state)
+
+
+    def parse_from_state(self, state: ParserState, last_token: Optional[Token]=None):
+        #--
+        try:
+            token = last_token
+            for token in state.lexer.lex(state):
+                assert token is not None
+                state.feed_token(token)
+
+            end_token = Token.new_borrow_pos('$END', '', token) if token else Token('$END', '', 0, 1, 1)
+            return state.feed_token(end_token, True)
+        except UnexpectedInput as e:
+            try:
+                e.interactive_parser = InteractiveParser(self, state, state.lexer)
+            except NameError:
+                pass
+            raise e
+        except Exception as e:
+            if self.debug:
+                print("")
+                print("STATE STACK DUMP")
+                print("----------------")
+                for i, s in enumerate(state.state_stack):
+                    print('%d)' % i , s)
+                print("")
+
+            raise
+
+
+class InteractiveParser:
+    #--
+    def __init__(self, parser, parser_state: ParserState, lexer_thread: LexerThread):
+        self.parser = parser
+        self.parser_state = parser_state
+        self.lexer_thread = lexer_thread
+        self.result = None
+
+    @property
+    def lexer_state(self) -> LexerThread:
+        warnings.warn("lexer_state will be removed in subsequent releases. Use lexer_thread instead.", DeprecationWarning)
+        return self.lexer_thread
+
+    def feed_token(self, token: Token):
+        #--
+        return self.parser_state.feed_token(token, token.type == '$END')
+
+    def iter_parse(self) -> Iterator[Token]:
+        #--
+        for token in self.lexer_thread.lex(self.parser_state):
+            yield token
+            self.result = self.feed_token(token)
+
+    def exhaust_lexer(self) -> List[Token]:
+        #--
+        return list(self.iter_parse())
+
+
+    def feed_eof(self, last_token=None):
+        #--
+        eof = Token.new_borrow_pos('$END', '', last_token) if last_token is not None else self.lexer_thread._Token('$END', '', 0, 1, 1)
+        return self.feed_token(eof)
+
+
+    def __copy__(self):
+        #--
+        return self.copy()
+
+    def copy(self, deepcopy_values=True):
+        return type(self)(
+            self.parser,
+            self.parser_state.copy(deepcopy_values=deepcopy_values),
+            copy(self.lexer_thread),
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, InteractiveParser):
+            return False
+
+        return self.parser_state == other.parser_state and self.lexer_thread == other.lexer_thread
+
+    def as_immutable(self):
+        #--
+        p = copy(self)
+        return ImmutableInteractiveParser(p.parser, p.parser_state, p.lexer_thread)
+
+    def pretty(self):
+        #--
+        out = ["Parser choices:"]
+        for k, v in self.choices().items():
+            out.append('\t- %s -> %r' % (k, v))
+        out.append('stack size: %s' % len(self.parser_state.state_stack))
+        return '\n'.join(out)
+
+    def choices(self):
+        #--
+        return self.parser_state.parse_conf.parse_table.states[self.parser_state.position]
+
+    def accepts(self):
+        #--
+        accepts = set()
+        conf_no_callbacks = copy(self.parser_state.parse_conf)
+        ##
+
+        ##
+
+        conf_no_callbacks.callbacks = {}
+        for t in self.choices():
+            if t.isupper(): ##
+
+                new_cursor = self.copy(deepcopy_values=False)
+                new_cursor.parser_state.parse_conf = conf_no_callbacks
+                try:
+                    new_cursor.feed_token(self.lexer_thread._Token(t, ''))
+                except UnexpectedToken:
+                    pass
+                else:
+                    accepts.add(t)
+        return accepts
+
+    def resume_parse(self):
+        #--
+        return self.parser.parse_from_state(self.parser_state, last_token=self.lexer_thread.state.last_token)
+
+
+
+class ImmutableInteractiveParser(InteractiveParser):
+    #--
+
+    result = None
+
+    def __hash__(self):
+        return hash((self.parser_state, self.lexer_thread))
+
+    def feed_token(self, token):
+        c = copy(self)
+        c.result = InteractiveParser.feed_token(c, token)
+        return c
+
+    def exhaust_lexer(self):
+        #--
+        cursor = self.as_mutable()
+        cursor.exhaust_lexer()
+        return cursor.as_immutable()
+
+    def as_mutable(self):
+        #--
+        p = copy(self)
+        return InteractiveParser(p.parser, p.parser_state, p.lexer_thread)
+
+
+
+def _wrap_lexer(lexer_class):
+    future_interface = getattr(lexer_class, '__future_interface__', 0)
+    if future_interface == 2:
+        return lexer_class
+    elif future_interface == 1:
+        class CustomLexerWrapper1(Lexer):
+            def __init__(self, lexer_conf):
+                self.lexer = lexer_class(lexer_conf)
+            def lex(self, lexer_state, parser_state):
+                if isinstance(lexer_state.text, TextSlice) and not lexer_state.text.is_complete_text():
+                    raise TypeError("Interface=1 Custom Lexer don't support TextSlice")
+                lexer_state.text = lexer_state.text
+                return self.lexer.lex(lexer_state, parser_state)
+        return CustomLexerWrapper1
+    elif future_interface == 0:
+        class CustomLexerWrapper0(Lexer):
+            def __init__(self, lexer_conf):
+                self.lexer = lexer_class(lexer_conf)
+
+            def lex(self, lexer_state, parser_state):
+                if isinstance(lexer_state.text, TextSlice):
+                    if not lexer_state.text.is_complete_text():
+                        raise TypeError("Interface=0 Custom Lexer don't support TextSlice")
+                    return self.lexer.lex(lexer_state.text.text)
+                return self.lexer.lex(lexer_state.text)
+        return CustomLexerWrapper0
+    else:
+        raise ValueError(f"Unknown __future_interface__ value {future_interface}, integer 0-2 expected")
+
+
+def _deserialize_parsing_frontend(data, memo, lexer_conf, callbacks, options):
+    parser_conf = ParserConf.deserialize(data['parser_conf'], memo)
+    cls = (options and options._plugins.get('LALR_Parser')) or LALR_Parser
+    parser = cls.deserialize(data['parser'], memo, callbacks, options.debug)
+    parser_conf.callbacks = callbacks
+    return ParsingFrontend(lexer_conf, parser_conf, options, parser=parser)
+
+
+_parser_creators: 'Dict[str, Callable[[LexerConf, Any, Any], Any]]' = {}
+
+
+class ParsingFrontend(Serialize):
+    __serialize_fields__ = 'lexer_conf', 'parser_conf', 'parser'
+
+    lexer_conf: LexerConf
+    parser_conf: ParserConf
+    options: Any
+
+    def __init__(self, lexer_conf: LexerConf, parser_conf: ParserConf, options, parser=None):
+        self.parser_conf = parser_conf
+        self.lexer_conf = lexer_conf
+        self.options = options
+
+        ##
+
+        if parser:  ##
+
+            self.parser = parser
+        else:
+            create_parser = _parser_creators.get(parser_conf.parser_type)
+            assert create_parser is not None, "{} is not supported in standalone mode".format(
+                    parser_conf.parser_type
+                )
+            self.parser = create_parser(lexer_conf, parser_conf, options)
+
+        ##
+
+        lexer_type = lexer_conf.lexer_type
+        self.skip_lexer = False
+        if lexer_type in ('dynamic', 'dynamic_complete'):
+            assert lexer_conf.postlex is None
+            self.skip_lexer = True
+            return
+
+        if isinstance(lexer_type, type):
+            assert issubclass(lexer_type, Lexer)
+            self.lexer = _wrap_lexer(lexer_type)(lexer_conf)
+        elif isinstance(lexer_type, str):
+            create_lexer = {
+                'basic': create_basic_lexer,
+                'contextual': create_contextual_lexer,
+            }[lexer_type]
+            self.lexer = create_lexer(lexer_conf, self.parser, lexer_conf.postlex, options)
+        else:
+            raise TypeError("Bad value for lexer_type: {lexer_type}")
+
+        if lexer_conf.postlex:
+            self.lexer = PostLexConnector(self.lexer, lexer_conf.postlex)
+
+    def _verify_start(self, start=None):
+        if start is None:
+            start_decls = self.parser_conf.start
+            if len(start_decls) > 1:
+                raise ConfigurationError("Lark initialized with more than 1 possible start rule. Must specify which start rule to parse", start_decls)
+            start ,= start_decls
+        elif start not in self.parser_conf.start:
+            raise ConfigurationError("Unknown start rule %s. Must be one of %r" % (start, self.parser_conf.start))
+        return start
+
+    def _make_lexer_thread(self, text: Optional[LarkInput]) -> Union[LarkInput, LexerThread, None]:
+        cls = (self.options and self.options._plugins.get('LexerThread')) or LexerThread
+        if self.skip_lexer:
+            return text
+        if text is None:
+            return cls(self.lexer, None)
+        if isinstance(text, (str, bytes, TextSlice)):
+            return cls.from_text(self.lexer, text)
+        return cls.from_custom_input(self.lexer, text)
+
+    def parse(self, text: Optional[LarkInput], start=None, on_error=None):
+        if self.lexer_conf.lexer_type in ("dynamic", "dynamic_complete"):
+            if isinstance(text, TextSlice) and not text.is_complete_text():
+                raise TypeError(f"Lexer {self.lexer_conf.lexer_type} does not support text slices.")
+
+        chosen_start = self._verify_start(start)
+        kw = {} if on_error is None else {'on_error': on_error}
+        stream = self._make_lexer_thread(text)
+        return self.parser.parse(stream, chosen_start, **kw)
+
+    def parse_interactive(self, text: Optional[TextOrSlice]=None, start=None):
+        ##
+
+        ##
+
+        chosen_start = self._verify_start(start)
+        if self.parser_conf.parser_type != 'lalr':
+            raise ConfigurationError("parse_interactive() currently only works with parser='lalr' ")
+        stream = self._make_lexer_thread(text)
+        return self.parser.parse_interactive(stream, chosen_start)
+
+
+def _validate_frontend_args(parser, lexer) -> None:
+    assert_config(parser, ('lalr', 'earley', 'cyk'))
+    if not isinstance(lexer, type):     ##
+
+        expected = {
+            'lalr': ('basic', 'contextual'),
+            'earley': ('basic', 'dynamic', 'dynamic_complete'),
+            'cyk': ('basic', ),
+         }[parser]
+        assert_config(lexer, expected, 'Parser %r does not support lexer %%r, expected one of %%s' % parser)
+
+
+def _get_lexer_callbacks(transformer, terminals):
+    result = {}
+    for terminal in terminals:
+        callback = getattr(transformer, terminal.name, None)
+        if callback is not None:
+            result[terminal.name] = callback
+    return result
+
+class PostLexConnector:
+    def __init__(self, lexer, postlexer):
+        self.lexer = lexer
+        self.postlexer = postlexer
+
+    def lex(self, lexer_state, parser_state):
+        i = self.lexer.lex(lexer_state, parser_state)
+        return self.postlexer.process(i)
+
+
+
+def create_basic_lexer(lexer_conf, parser, postlex, options) -> BasicLexer:
+    cls = (options and options._plugins.get('BasicLexer')) or BasicLexer
+    return cls(lexer_conf)
+
+def create_contextual_lexer(lexer_conf: LexerConf, parser, postlex, options) -> ContextualLexer:
+    cls = (options and options._plugins.get('ContextualLexer')) or ContextualLexer
+    parse_table: ParseTableBase[int] = parser._parse_table
+    states: Dict[int, Collection[str]] = {idx:list(t.keys()) for idx, t in parse_table.states.items()}
+    always_accept: Collection[str] = postlex.always_accept if postlex else ()
+    return cls(lexer_conf, states, always_accept=always_accept)
+
+def create_lalr_parser(lexer_conf: LexerConf, parser_conf: ParserConf, options=None) -> LALR_Parser:
+    debug = options.debug if options else False
+    strict = options.strict if options else False
+    cls = (options and options._plugins.get('LALR_Parser')) or LALR_Parser
+    return cls(parser_conf, debug=debug, strict=strict)
+
+_parser_creators['lalr'] = create_lalr_parser
+
+
+
+
+class PostLex(ABC):
+    @abstractmethod
+    def process(self, stream: Iterator[Token]) -> Iterator[Token]:
+        return stream
+
+    always_accept: Iterable[str] = ()
+
+class LarkOptions(Serialize):
+    #--
+
+    start: List[str]
+    debug: bool
+    strict: bool
+    transformer: 'Optional[Transformer]'
+    propagate_positions: Union[bool, str]
+    maybe_placeholders: bool
+    cache: Union[bool, str]
+    cache_grammar: bool
+    regex: bool
+    g_regex_flags: int
+    keep_all_tokens: bool
+    tree_class: Optional[Callable[[str, List], Any]]
+    parser: _ParserArgType
+    lexer: _LexerArgType
+    ambiguity: 'Literal["auto", "resolve", "explicit", "forest"]'
+    postlex: Optional[PostLex]
+    priority: 'Optional[Literal["auto", "normal", "invert"]]'
+    lexer_callbacks: Dict[str, Callable[[Token], Token]]
+    use_bytes: bool
+    ordered_sets: bool
+    edit_terminals: Optional[Callable[[TerminalDef], TerminalDef]]
+    import_paths: 'List[Union[str, Callable[[Union[None, str, PackageResource], str], Tuple[str, str]]]]'
+    source_path: Optional[str]
+
+    OPTIONS_DOC = r"""
+    **===  General Options  ===**
+
+    start
+            The start symbol. Either a string, or a list of strings for multiple possible starts (Default: "start")
+    debug
+            Display debug information and extra warnings. Use only when debugging (Default: ``False``)
+            When used with Earley, it generates a forest graph as "sppf.png", if 'dot' is installed.
+    strict
+            Throw an exception on any potential ambiguity, including shift/reduce conflicts, and regex collisions.
+    transformer
+            Applies the transformer to every parse tree (equivalent to applying it after the parse, but faster)
+    propagate_positions
+            Propagates positional attributes into the 'meta' attribute of all tree branches.
+            Sets attributes: (line, column, end_line, end_column, start_pos, end_pos,
+                              container_line, container_column, container_end_line, container_end_column)
+            Accepts ``False``, ``True``, or a callable, which will filter which nodes to ignore when propagating.
+    maybe_placeholders
+            When ``True``, the ``[]`` operator returns ``None`` when not matched.
+            When ``False``,  ``[]`` behaves like the ``?`` operator, and returns no value at all.
+            (default= ``True``)
+    cache
+            Cache the results of the Lark grammar analysis, for x2 to x3 faster loading. LALR only for now.
+
+            - When ``False``, does nothing (default)
+            - When ``True``, caches to a temporary file in the local directory
+            - When given a string, caches to the path pointed by the string
+    cache_grammar
+            For use with ``cache`` option. When ``True``, the unanalyzed grammar is also included in the cache.
+            Useful for classes that require the ``Lark.grammar`` to be present (e.g. Reconstructor).
+            (default= ``False``)
+    regex
+            When True, uses the ``regex`` module instead of the stdlib ``re``.
+    g_regex_flags
+            Flags that are applied to all terminals (both regex and strings)
+    keep_all_tokens
+            Prevent the tree builder from automagically removing "punctuation" tokens (Default: ``False``)
+    tree_class
+            Lark will produce trees comprised of instances of this class instead of the default ``lark.Tree``.
+
+    **=== Algorithm Options ===**
+
+    parser
+            Decides which parser engine to use. Accepts "earley" or "lalr". (Default: "earley").
+            (there is also a "cyk" option for legacy)
+    lexer
+            Decides whether or not to use a lexer stage
+
+            - "auto" (default): Choose for me based on the parser
+            - "basic": Use a basic lexer
+            - "contextual": Stronger lexer (only works with parser="lalr")
+            - "dynamic": Flexible and powerful (only with parser="earley")
+            - "dynamic_complete": Same as dynamic, but tries *every* variation of tokenizing possible.
+    ambiguity
+            Decides how to handle ambiguity in the parse. Only relevant if parser="earley"
+
+            - "resolve": The parser will automatically choose the simplest derivation
+              (it chooses consistently: greedy for tokens, non-greedy for rules)
+            - "explicit": The parser will return all derivations wrapped in "_ambig" tree nodes (i.e. a forest).
+            - "forest": The parser will return the root of the shared packed parse forest.
+
+    **=== Misc. / Domain Specific Options ===**
+
+    postlex
+            Lexer post-processing (Default: ``None``) Only works with the basic and contextual lexers.
+    priority
+            How priorities should be evaluated - "auto", ``None``, "normal", "invert" (Default: "auto")
+    lexer_callbacks
+            Dictionary of callbacks for the lexer. May alter tokens during lexing. Use with caution.
+    use_bytes
+            Accept an input of type ``bytes`` instead of ``str``.
+    ordered_sets
+            Should Earley use ordered-sets to achieve stable output (~10% slower than regular sets. Default: True)
+    edit_terminals
+            A callback for editing the terminals before parse.
+    import_paths
+            A List of either paths or loader functions to specify from where grammars are imported
+    source_path
+            Override the source of from where the grammar was loaded. Useful for relative imports and unconventional grammar loading
+    **=== End of Options ===**
+    """
+    if __doc__:
+        __doc__ += OPTIONS_DOC
+
+
+    ##
+
+    ##
+
+    ##
+
+    ##
+
+    ##
+
+    ##
+
+    _defaults: Dict[str, Any] = {
+        'debug': False,
+        'strict': False,
+        'keep_all_tokens': False,
+        'tree_class': None,
+        'cache': False,
+        'cache_grammar': False,
+        'postlex': None,
+        'parser': 'earley',
+        'lexer': 'auto',
+        'transformer': None,
+        'start': 'start',
+        'priority': 'auto',
+        'ambiguity': 'auto',
+        'regex': False,
+        'propagate_positions': False,
+        'lexer_callbacks': {},
+        'maybe_placeholders': True,
+        'edit_terminals': None,
+        'g_regex_flags': 0,
+        'use_bytes': False,
+        'ordered_sets': True,
+        'import_paths': [],
+        'source_path': None,
+        '_plugins': {},
+    }
+
+    def __init__(self, options_dict: Dict[str, Any]) -> None:
+        o = dict(options_dict)
+
+        options = {}
+        for name, default in self._defaults.items():
+            if name in o:
+                value = o.pop(name)
+                if isinstance(default, bool) and name not in ('cache', 'use_bytes', 'propagate_positions'):
+                    value = bool(value)
+            else:
+                value = default
+
+            options[name] = value
+
+        if isinstance(options['start'], str):
+            options['start'] = [options['start']]
+
+        self.__dict__['options'] = options
+
+
+        assert_config(self.parser, ('earley', 'lalr', 'cyk', None))
+
+        if self.parser == 'earley' and self.transformer:
+            raise ConfigurationError('Cannot specify an embedded transformer when using the Earley algorithm. '
+                             'Please use your transformer on the resulting parse tree, or use a different algorithm (i.e. LALR)')
+
+        if self.cache_grammar and not self.cache:
+            raise ConfigurationError('cache_grammar cannot be set when cache is disabled')
+
+        if o:
+            raise ConfigurationError("Unknown options: %s" % o.keys())
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self.__dict__['options'][name]
+        except KeyError as e:
+            raise AttributeError(e)
+
+    def __setattr__(self, name: str, value: str) -> None:
+        assert_config(name, self.options.keys(), "%r isn't a valid option. Expected one of: %s")
+        self.options[name] = value
+
+    def serialize(self, memo = None) -> Dict[str, Any]:
+        return self.options
+
+    @classmethod
+    def deserialize(cls, data: Dict[str, Any], memo: Dict[int, Union[TerminalDef, Rule]]) -> "LarkOptions":
+        return cls(data)
+
+
+##
+
+##
+
+_LOAD_ALLOWED_OPTIONS = {'postlex', 'transformer', 'lexer_callbacks', 'use_bytes', 'debug', 'g_regex_flags', 'regex', 'propagate_positions', 'tree_class', '_plugins'}
+
+_VALID_PRIORITY_OPTIONS = ('auto', 'normal', 'invert', None)
+_VALID_AMBIGUITY_OPTIONS = ('auto', 'resolve', 'explicit', 'forest')
+
+
+_T = TypeVar('_T', bound="Lark")
+
+class Lark(Serialize):
+    #--
+
+    source_path: str
+    source_grammar: str
+    grammar: 'Grammar'
+    options: LarkOptions
+    lexer: Lexer
+    parser: 'ParsingFrontend'
+    terminals: Collection[TerminalDef]
+
+    __serialize_fields__ = ['parser', 'rules', 'options']
+
+    def __init__(self, grammar: 'Union[Grammar, str, IO[str]]', **options) -> None:
+        self.options = LarkOptions(options)
+        re_module: types.ModuleType
+
+        ##
+
+        if self.options.cache_grammar:
+            self.__serialize_fields__ = self.__serialize_fields__ + ['grammar']
+
+        ##
+
+        use_regex = self.options.regex
+        if use_regex:
+            if _has_regex:
+                re_module = regex
+            else:
+                raise ImportError('`regex` module must be installed if calling `Lark(regex=True)`.')
+        else:
+            re_module = re
+
+        ##
+
+        if self.options.source_path is None:
+            try:
+                self.source_path = grammar.name  ##
+
+            except AttributeError:
+                self.source_path = '<string>'
+        else:
+            self.source_path = self.options.source_path
+
+        ##
+
+        try:
+            read = grammar.read  ##
+
+        except AttributeError:
+            pass
+        else:
+            grammar = read()
+
+        cache_fn = None
+        cache_sha256 = None
+        if isinstance(grammar, str):
+            self.source_grammar = grammar
+            if self.options.use_bytes:
+                if not grammar.isascii():
+                    raise ConfigurationError("Grammar must be ascii only, when use_bytes=True")
+
+            if self.options.cache:
+                if self.options.parser != 'lalr':
+                    raise ConfigurationError("cache only works with parser='lalr' for now")
+
+                unhashable = ('transformer', 'postlex', 'lexer_callbacks', 'edit_terminals', '_plugins')
+                options_str = ''.join(k+str(v) for k, v in options.items() if k not in unhashable)
+                from . import __version__
+                s = grammar + options_str + __version__ + str(sys.version_info[:2])
+                cache_sha256 = sha256_digest(s)
+
+                if isinstance(self.options.cache, str):
+                    cache_fn = self.options.cache
+                else:
+                    if self.options.cache is not True:
+                        raise ConfigurationError("cache argument must be bool or str")
+
+                    try:
+                        username = getpass.getuser()
+                    except Exception:
+                        ##
+
+                        ##
+
+                        ##
+
+                        username = "unknown"
+
+
+                    cache_fn = tempfile.gettempdir() + "/.lark_%s_%s_%s_%s_%s.tmp" % (
+                        "cache_grammar" if self.options.cache_grammar else "cache", username, cache_sha256, *sys.version_info[:2])
+
+                old_options = self.options
+                try:
+                    with FS.open(cache_fn, 'rb') as f:
+                        logger.debug('Loading grammar from cache: %s', cache_fn)
+                        ##
+
+                        for name in (set(options) - _LOAD_ALLOWED_OPTIONS):
+                            del options[name]
+                        file_sha256 = f.readline().rstrip(b'\n')
+                        cached_used_files = pickle.load(f)
+                        if file_sha256 == cache_sha256.encode('utf8') and verify_used_files(cached_used_files):
+                            cached_parser_data = pickle.load(f)
+                            self._load(cached_parser_data, **options)
+                            return
+                except FileNotFoundError:
+                    ##
+
+                    pass
+                except Exception: ##
+
+                    logger.exception("Failed to load Lark from cache: %r. We will try to carry on.", cache_fn)
+
+                    ##
+
+                    ##
+
+                    self.options = old_options
+
+
+            ##
+
+            self.grammar, used_files = load_grammar(grammar, self.source_path, self.options.import_paths, self.options.keep_all_tokens)
+        else:
+            assert isinstance(grammar, Grammar)
+            self.grammar = grammar
+
+
+        if self.options.lexer == 'auto':
+            if self.options.parser == 'lalr':
+                self.options.lexer = 'contextual'
+            elif self.options.parser == 'earley':
+                if self.options.postlex is not None:
+                    logger.info("postlex can't be used with the dynamic lexer, so we use 'basic' instead. "
+                                "Consider using lalr with contextual instead of earley")
+                    self.options.lexer = 'basic'
+                else:
+                    self.options.lexer = 'dynamic'
+            elif self.options.parser == 'cyk':
+                self.options.lexer = 'basic'
+            else:
+                assert False, self.options.parser
+        lexer = self.options.lexer
+        if isinstance(lexer, type):
+            assert issubclass(lexer, Lexer)     ##
+
+        else:
+            assert_config(lexer, ('basic', 'contextual', 'dynamic', 'dynamic_complete'))
+            if self.options.postlex is not None and 'dynamic' in lexer:
+                raise ConfigurationError("Can't use postlex with a dynamic lexer. Use basic or contextual instead")
+
+        if self.options.ambiguity == 'auto':
+            if self.options.parser == 'earley':
+                self.options.ambiguity = 'resolve'
+        else:
+            assert_config(self.options.parser, ('earley', 'cyk'), "%r doesn't support disambiguation. Use one of these parsers instead: %s")
+
+        if self.options.priority == 'auto':
+            self.options.priority = 'normal'
+
+        if self.options.priority not in _VALID_PRIORITY_OPTIONS:
+            raise ConfigurationError("invalid priority option: %r. Must be one of %r" % (self.options.priority, _VALID_PRIORITY_OPTIONS))
+        if self.options.ambiguity not in _VALID_AMBIGUITY_OPTIONS:
+            raise ConfigurationError("invalid ambiguity option: %r. Must be one of %r" % (self.options.ambiguity, _VALID_AMBIGUITY_OPTIONS))
+
+        if self.options.parser is None:
+            terminals_to_keep = '*'     ##
+
+        elif self.options.postlex is not None:
+            terminals_to_keep = set(self.options.postlex.always_accept)
+        else:
+            terminals_to_keep = set()
+
+        ##
+
+        self.terminals, self.rules, self.ignore_tokens = self.grammar.compile(self.options.start, terminals_to_keep)
+
+        if self.options.edit_terminals:
+            for t in self.terminals:
+                self.options.edit_terminals(t)
+
+        self._terminals_dict = {t.name: t for t in self.terminals}
+
+        ##
+
+        if self.options.priority == 'invert':
+            for rule in self.rules:
+                if rule.options.priority is not None:
+                    rule.options.priority = -rule.options.priority
+            for term in self.terminals:
+                term.priority = -term.priority
+        ##
+
+        ##
+
+        ##
+
+        elif self.options.priority is None:
+            for rule in self.rules:
+                if rule.options.priority is not None:
+                    rule.options.priority = None
+            for term in self.terminals:
+                term.priority = 0
+
+        ##
+
+        self.lexer_conf = LexerConf(
+                self.terminals, re_module, self.ignore_tokens, self.options.postlex,
+                self.options.lexer_callbacks, self.options.g_regex_flags, use_bytes=self.options.use_bytes, strict=self.options.strict
+            )
+
+        if self.options.parser:
+            self.parser = self._build_parser()
+        elif lexer:
+            self.lexer = self._build_lexer()
+
+        if cache_fn:
+            logger.debug('Saving grammar to cache: %s', cache_fn)
+            try:
+                with FS.open(cache_fn, 'wb') as f:
+                    assert cache_sha256 is not None
+                    f.write(cache_sha256.encode('utf8') + b'\n')
+                    pickle.dump(used_files, f)
+                    self.save(f, _LOAD_ALLOWED_OPTIONS)
+            except IOError as e:
+                logger.exception("Failed to save Lark to cache: %r.", cache_fn, e)
+
+    if __doc__:
+        __doc__ += "\n\n" + LarkOptions.OPTIONS_DOC
+
+    def _build_lexer(self, dont_ignore: bool=False) -> BasicLexer:
+        lexer_conf = self.lexer_conf
+        if dont_ignore:
+            from copy import copy
+            lexer_conf = copy(lexer_conf)
+            lexer_conf.ignore = ()
+        return BasicLexer(lexer_conf)
+
+    def _prepare_callbacks(self) -> None:
+        self._callbacks = {}
+        ##
+
+        if self.options.ambiguity != 'forest':
+            self._parse_tree_builder = ParseTreeBuilder(
+                    self.rules,
+                    self.options.tree_class or Tree,
+                    self.options.propagate_positions,
+                    self.options.parser != 'lalr' and self.options.ambiguity == 'explicit',
+                    self.options.maybe_placeholders
+                )
+            self._callbacks = self._parse_tree_builder.create_callback(self.options.transformer)
+        self._callbacks.update(_get_lexer_callbacks(self.options.transformer, self.terminals))
+
+    def _build_parser(self) -> "ParsingFrontend":
+        self._prepare_callbacks()
+        _validate_frontend_args(self.options.parser, self.options.lexer)
+        parser_conf = ParserConf(self.rules, self._callbacks, self.options.start)
+        return _construct_parsing_frontend(
+            self.options.parser,
+            self.options.lexer,
+            self.lexer_conf,
+            parser_conf,
+            options=self.options
+        )
+
+    def save(self, f, exclude_options: Collection[str] = ()) -> None:
+        #--
+        if self.options.parser != 'lalr':
+            raise NotImplementedError("Lark.save() is only implemented for the LALR(1) parser.")
+        data, m = self.memo_serialize([TerminalDef, Rule])
+        if exclude_options:
+            data["options"] = {n: v for n, v in data["options"].items() if n not in exclude_options}
+        pickle.dump({'data': data, 'memo': m}, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls: Type[_T], f) -> _T:
+        #--
+        inst = cls.__new__(cls)
+        return inst._load(f)
+
+    def _deserialize_lexer_conf(self, data: Dict[str, Any], memo: Dict[int, Union[TerminalDef, Rule]], options: LarkOptions) -> LexerConf:
+        lexer_conf = LexerConf.deserialize(data['lexer_conf'], memo)
+        lexer_conf.callbacks = options.lexer_callbacks or {}
+        lexer_conf.re_module = regex if options.regex else re
+        lexer_conf.use_bytes = options.use_bytes
+        lexer_conf.g_regex_flags = options.g_regex_flags
+        lexer_conf.skip_validation = True
+        lexer_conf.postlex = options.postlex
+        return lexer_conf
+
+    def _load(self: _T, f: Any, **kwargs) -> _T:
+        if isinstance(f, dict):
+            d = f
+        else:
+            d = pickle.load(f)
+        memo_json = d['memo']
+        data = d['data']
+
+        assert memo_json
+        memo = SerializeMemoizer.deserialize(memo_json, {'Rule': Rule, 'TerminalDef': TerminalDef}, {})
+        if 'grammar' in data:
+            self.grammar = Grammar.deserialize(data['grammar'], memo)
+        options = dict(data['options'])
+        if (set(kwargs) - _LOAD_ALLOWED_OPTIONS) & set(LarkOptions._defaults):
+            raise ConfigurationError("Some options are not allowed when loading a Parser: {}"
+                             .format(set(kwargs) - _LOAD_ALLOWED_OPTIONS))
+        options.update(kwargs)
+        self.options = LarkOptions.deserialize(options, memo)
+        self.rules = [Rule.deserialize(r, memo) for r in data['rules']]
+        self.source_path = '<deserialized>'
+        _validate_frontend_args(self.options.parser, self.options.lexer)
+        self.lexer_conf = self._deserialize_lexer_conf(data['parser'], memo, self.options)
+        self.terminals = self.lexer_conf.terminals
+        self._prepare_callbacks()
+        self._terminals_dict = {t.name: t for t in self.terminals}
+        self.parser = _deserialize_parsing_frontend(
+            data['parser'],
+            memo,
+            self.lexer_conf,
+            self._callbacks,
+            self.options,  ##
+
+        )
+        return self
+
+    @classmethod
+    def _load_from_dict(cls, data, memo, **kwargs):
+        inst = cls.__new__(cls)
+        return inst._load({'data': data, 'memo': memo}, **kwargs)
+
+    @classmethod
+    def open(cls: Type[_T], grammar_filename: str, rel_to: Optional[str]=None, **options) -> _T:
+        #--
+        if rel_to:
+            basepath = os.path.dirname(rel_to)
+            grammar_filename = os.path.join(basepath, grammar_filename)
+        with open(grammar_filename, encoding='utf8') as f:
+            return cls(f, **options)
+
+    @classmethod
+    def open_from_package(cls: Type[_T], package: str, grammar_path: str, search_paths: 'Sequence[str]'=[""], **options) -> _T:
+        #--
+        package_loader = FromPackageLoader(package, search_paths)
+        full_path, text = package_loader(None, grammar_path)
+        options.setdefault('source_path', full_path)
+        options.setdefault('import_paths', [])
+        options['import_paths'].append(package_loader)
+        return cls(text, **options)
+
+    def __repr__(self):
+        return 'Lark(open(%r), parser=%r, lexer=%r, ...)' % (self.source_path, self.options.parser, self.options.lexer)
+
+
+    def lex(self, text: TextOrSlice, dont_ignore: bool=False) -> Iterator[Token]:
+        #--
+        lexer: Lexer
+        if not hasattr(self, 'lexer') or dont_ignore:
+            lexer = self._build_lexer(dont_ignore)
+        else:
+            lexer = self.lexer
+        lexer_thread = LexerThread.from_text(lexer, text)
+        stream = lexer_thread.lex(None)
+        if self.options.postlex:
+            return self.options.postlex.process(stream)
+        return stream
+
+    def get_terminal(self, name: str) -> TerminalDef:
+        #--
+        return self._terminals_dict[name]
+
+    def parse_interactive(self, text: Optional[LarkInput]=None, start: Optional[str]=None) -> 'InteractiveParser':
+        #--
+        return self.parser.parse_interactive(text, start=start)
+
+    def parse(self, text: LarkInput, start: Optional[str]=None, on_error: 'Optional[Callable[[UnexpectedInput], bool]]'=None) -> 'ParseTree':
+        #--
+        if on_error is not None and self.options.parser != 'lalr':
+            raise NotImplementedError("The on_error option is only implemented for the LALR(1) parser.")
+        return self.parser.parse(text, start=start, on_error=on_error)
+
+
+
+
+class DedentError(LarkError):
+    pass
+
+class Indenter(PostLex, ABC):
+    #--
+    paren_level: int
+    indent_level: List[int]
+
+    def __init__(self) -> None:
+        self.paren_level = 0
+        self.indent_level = [0]
+        assert self.tab_len > 0
+
+    def handle_NL(self, token: Token) -> Iterator[Token]:
+        if self.paren_level > 0:
+            return
+
+        yield token
+
+        indent_str = token.rsplit('\n', 1)[1] ##
+
+        indent = indent_str.count(' ') + indent_str.count('\t') * self.tab_len
+
+        if indent > self.indent_level[-1]:
+            self.indent_level.append(indent)
+            yield Token.new_borrow_pos(self.INDENT_type, indent_str, token)
+        else:
+            while indent < self.indent_level[-1]:
+                self.indent_level.pop()
+                yield Token.new_borrow_pos(self.DEDENT_type, indent_str, token)
+
+            if indent != self.indent_level[-1]:
+                raise DedentError('Unexpected dedent to column %s. Expected dedent to %s' % (indent, self.indent_level[-1]))
+
+    def _process(self, stream):
+        token = None
+        for token in stream:
+            if token.type == self.NL_type:
+                yield from self.handle_NL(token)
+            else:
+                yield token
+
+            if token.type in self.OPEN_PAREN_types:
+                self.paren_level += 1
+            elif token.type in self.CLOSE_PAREN_types:
+                self.paren_level -= 1
+                assert self.paren_level >= 0
+
+        while len(self.indent_level) > 1:
+            self.indent_level.pop()
+            yield Token.new_borrow_pos(self.DEDENT_type, '', token) if token else Token(self.DEDENT_type, '', 0, 0, 0, 0, 0, 0)
+
+        assert self.indent_level == [0], self.indent_level
+
+    def process(self, stream):
+        self.paren_level = 0
+        self.indent_level = [0]
+        return self._process(stream)
+
+    ##
+
+    @property
+    def always_accept(self):
+        return (self.NL_type,)
+
+    @property
+    @abstractmethod
+    def NL_type(self) -> str:
+        #--
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def OPEN_PAREN_types(self) -> List[str]:
+        #--
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def CLOSE_PAREN_types(self) -> List[str]:
+        #--
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def INDENT_type(self) -> str:
+        #--
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def DEDENT_type(self) -> str:
+        #--
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def tab_len(self) -> int:
+        #--
+        raise NotImplementedError()
+
+
+class PythonIndenter(Indenter):
+    #--
+
+    NL_type = '_NEWLINE'
+    OPEN_PAREN_types = ['LPAR', 'LSQB', 'LBRACE']
+    CLOSE_PAREN_types = ['RPAR', 'RSQB', 'RBRACE']
+    INDENT_type = '_INDENT'
+    DEDENT_type = '_DEDENT'
+    tab_len = 8
+
+
+import pickle, zlib, base64
+DATA = (
+b'eJztfXd8VFXXde6kQjqh9yq9WejF9HKZBCGIDWMIQwiEJCQZTIAkRmQweEGEkUSjCSTSm9h7b49dH3vvBX3svTy+55x9brJ2QEAUeN/f9/mHa9adYfY+a6+zz7l37kwu8r/Sx8fwkf+VeQdYAQWZhUWuQq983DrXVeIqzMjKz5ureKtiV+HCnLzM3CLvLO+AMq9lnO41fYrKvPOCTIPAQeBL4EfgTxBAEEgQRNCKoDVBMEEIQShBGEE4QQRBJEEbgiiCtgTtCNoTdCDoSNCJoDNBF4KuBN0IuhP0IOhJ0IugN0Efgr4E/QhOIuhPMIBgIMEggsEEQwiGEgwjGE4wgmAkwckEpxCcSnAawSiC0QRjCMYSjCMYTzCBYCLBJILJBKcTRBPEEMQSxBHEEyQQJBIkESQTpBCYBFMInASpBGkEUwnOIJhGMJ0gnWAGwZkEMwnOIji7yGUF5GTn5Re6pAktx8zpXiswNX7mlOTUePEoNs3pjE9N97qs0OyMQle2qyRjbm5mdpEwqtXKXeTKmF1a7CryVtnmLi4tcHmt1sLjxa6SYndmrtcKylBHMzK8Vqsp8kWxcgK4rWCaGs3zwb/QnevSc0Gkdg5leC7BeQSzCM4nyCC4gCCTYDZBFsEcAhfBXIJsgnkEOQTzCRYQ5BIsJMgjyCcoIFhEUEhQRFBM4CZYTHAhQQlBKcESgqUEywjKCMoJKgguIqgkuJhgOcElBCsIPAQrCS4lqCJYRXAZgUWwmmANweUEawmuIFhHsJ7AS3AlwQaCaoIagqsIriaoJbiG4FqCOoJ6go0EmwgaCBoJriPYTLCFYCvBNoLtBDsIdhLsIthNsIdgL8H1BPsIbiC4keAmgpsJbiG4leA2gtsJ7iC4k+AugrsJ7iG4l+A+gvsJHiB4kOAhgocJHiF4lOAxgn8RPE7wBMGTBE8RPE3wDMGzBM8RPE/wb4IXCF4keIngZYJXCF4leI3gdYI3CN4keIvgbYJ3CN4leI/gfYIPCD4k+IjgY4JPCD4l2E/wGcHnBP8h+ILgS4KvCL4m+IbgW4LvCL4n+IHgR4KfCH4m+IXgV4LfCH4n+C/BHwqcPrQaOw2NDo2+Gv00+msM0BioMUhjK42tNQZrDNEYqjFMY7jGCI2RGttojNLYVmM7je01dtDYUWMnjZ01dtHYVWM3jd019tDYU2Mvjb019tHYV2M/jSdp7K9xgMaBGgdpHKxxiMahGodpHK5xhMaRGk/WeIrGUzWepnGUxtEax2gcq3GcxvEaJ2icqHGSxskaT9cYrTFGY6zGOI3xGhM0JmpM0pisMUWj3uU5p2h0akzVmKZxqsYzNE7TOF1jusYZGs/UONMQq7t/UXFmYbFYVefni21pZtOySyu1X25mbqF33gKr9VR1mNbmeYbauxbnL3DlFcm1Waz2AXHxCXJPYBrNuwLTYTnSUr2mr+UfOyU+eprX9LN8E9IE+lsB02KmRceK1wdYjmjx0kDLr298apzXDLIc6Wles5UVODVtytmJ8t+3tvymTJX/PNjyjZavCbH8EqalOb1mqOXrnDHFa4YJTBNPhFu+cclnes0Iy3f6jBivGSn+QZw43sbym6beIUqkIrKL9pptLb+ZyelJXrOdFZaZm+2aXZiZk5UxO7PI5TXbWxHNh+ZmZhXnF3rNDlZ488Hswnx3gdfsaPknx6mhdrKCxE5FiJlX7DU7W+2LC3Oy8/PyF7rEA/Ee7rys4pz8PK/ZxTLEoLtajqnJXrOb5ZseLQbY3QpIneGMiRcJ9sBs5BmA1+xpRTYfyi9wFWbmzfGavSy/aPWPe1u+sWnTvWYfMeZkwftabZtf7iopKHQVFanQ/azwhLTU9Iy0qenJaakZZvzZXvMkK3iu2IyJt6X0+lsRGRkFhfnZhZkLM6Q1MkZ4zQHKG+ZAK7IgP1ccmuPKEpBJ/2KQFZWZl7Mws9jFjw+2AvX7eM0hVivxXsWuhS6pzlCr9RzX3Jy8HHrhMCsyK9fV8m2HW+Fz81scG2F1duW6skjRHFfuHP70SFG1kpwifvBkKzLPvdAl/klmbrN4p1htm4+iRqdaYc1PkPynWRHNh2wzjMLXkWlGi0Fe6HIVZMzJF4McY/lPnxkfP9VrjpVb3OhUofhIrznOar8wf7ErIzM3Py+bZzpeuDw+VRRygtVFbKXdUmmhd6mwEX/hRMt/5rTkdGGjSZaR4DUnWwGxSdHTEsWB04VV8rJzW5Qi2vKPnjYtbabXjLEiLyzMaVmqWMvPmXam+OdxVmuqZebsXDGieMt/alqydHeCGE1s9BTxkkTRCqKnRTvj06clx3rNJKvNAlfphfmFczJy5ojq5oi6CHmSrVDxLvPA9ylWu2KhfZEo6kIe3RTjVp1jitVpsauwWEmam5PXIkmnGFphYf6F/Giq9GSOMDA7mmZFFM1r+dKpVqtp8bFiyiTKcZxhtUqfFp06XbQj0UemCQmTp8XKJ6ZbraZOS5sanRgtFU632tm1aDGgGUJUeqszpUxTZHeZKV+dVXyQEpxltcmal1mY3eLw2VbknBz5TzJQ93OsgOlnzIieJt77XNEo09JVKudZftOTZBFnWYHT4hNnqIjnW1E0J1tkl2FFFgkdW4S7wOoo2numbkot/kmmeqsD7Tbb8tetOksMIqcwq+W7zrHCxEwvyMyWPaAws1Sc/bmsDqL/ZLkycjNnu3L5y+dabQrziw/oF9lWxIFFn2dFqOnCDuaIV4qFhx+cb7UpWuTOLGzx2gVWeEF+keo0GeIfZRfP85q5VoesfOHYnDyZBBXLfm6hFWS/3mvmWR0KXbninRbbL2t+Lt/qmjm7KD/XLd4C3q35BQVWl2nxU6LTk8+Mz5iaNj1Z9dy4ZGnBZLmoLZKzXL85eUDm2PzvC63I4nmFLvmW0t8qvtcsEgtZ9NmiSRRb7aCU2MLcVrgoApdhsdUaX3Kh5ZeeFC+SKLF8488SParUCjozflp6spjjXnOJFZAUn5yYJOb9UjHvxQIn4i0T8yUpOdZMjZ8uWJkVMEWbolw8jE9NlCtphdUtI+NgfZVWklFe8yJh5+i45BniLSqt4KLiUqHp7Nz8rAVe82IRKv1sOZ+WWx3wbWQXpjcY7TUvsTrhc9SO6dkxXnOFWBPPShZv7rGC4qcIpVWPWimmk3iUmug1L7X8heSuEq9ZZQVTJ1ycmesWwq6y/EWx4s/ympc19Wux9FlWmJomTb3La64WeybZ573mGss/XsxTIdnlVrBqfxn6mbVi+qm1oNkaYlZcIWKITifyW2d1z8g4aGOhsYiVYr0cactdCD17mtf0WmGknpx5ommWes0rrTZKwAzZvkQxz6YVfoPVClxXLfc/U+SjGqs1OSs3p0isV1dZnUW4FsunTuYUr3m11S4jA+qVUZDrLsoYKRSqle84Qy4S1whXxZ8lHlxrdVSbCGgJ+p3EuOpE3xQJiGLUW44YkeBGq5UzOjE1OX1GnCj+Jll8vgOif3uq12wQC19ynHRaoxUYnZrsVH3xOitArVJC1s1i+5cmEthi9RIJ/Emno7c72WtutfwTkuOniO3hNrEHFf98uxWVkdEsCr1wrNfcYUXCJsl2zE4rMD1pWtqMRJHPLisgOnZampwau60uGRkHLLJ6/CLqHjlJDrZBo5cIrfeKvNLkTHRbAWrbpPfY6n+moc9APWKrjcSBxBeJHxJ/JAFIApEEAXHLx2YrEfsSj7fIdGAeP2MeP2MeP2MeP2MeP2MeP2MeP2MeP2MeP6s8fDH0rxj6Vwz9K4b+FUP/iqF/xdC/YuhfMfSvKrQfhv4NQ/+GoX/D0L9h6N8w9G8Y+jcM/RuG/k2F9pehW4vgb4un7BT+I18XjMRA4kDii8QPiT+SACQhSAKBuM0AlOJxDP04hn4cQz+OoR/H0I9j6Mcx2uMoxeMqdCCG/gND/4Gh/8DQf2DoPzD0Hxj6Dwz9B4b+Q4UOKpPv72M+LOdAK5lHqGBviNeFCfxJYLjAQoER+t9dIt8kEkkbJD5IDCQOJL5I/JAEIAlEEowkCIk/kigkIUDcZms5QH1IXrBpzlczgzEHY0GM+TLmx5g/YwGMBTIWzFhbZG4zWGbbzvRxhhriyfYi1R9UHXzMZwV2EHi9QDGFnD/KF3QUD/wc4kEn8eBVeaSzePC7fNBFvPZjgV3Fgd/kgW7iwWD5oLt4UCYf9BAP3pcPeorXrhLYSxyokgd6iwce+aCPeFAnH/QVD9yGTDFEpthP0OXy+EniwePqeGiZysfsKW0VhvZ2YyXdaBI3msSNJnGjSdxYcDc6xo0Fd6N93OgYtxI3XCZlv+cLmMcLaOMXMMALmOELmOELGO0FzPAFFS2C9HCuNKQgkZptUKyNzCRY0BkGBH4NU3oNA7+GgV9DaV7DwK9h5q9hfq+plKJwLgxgc2EAmwsD2FwYwObCADYXBrC5MIDNhQFsLgxgc2EAmwsD2FwYQHOhrcw2QIjUTYrUX6QarRL2MUeoBHzMeR7qZBcIlHYzBQ4UOE3gIIGJAgcLjBM4ROCVAocKzBc4TOA5asg+5hKBwwUuV0PxMa8TOELgtQJHCtwLSp6ncmtXpmah+ZysZnuZ6MmCnaXnao7AU0Tiqw2ammYSTTuzgSavOUHgqQInwkQ9TWAqzWBzLM7Xphl8iOk5SvyjOplYByxxf1bi/qzE/VmJ+7MS92cl7s9K3J+VuD8rcX9W4v6sxP1ZiftTiTvKbEeLQVwjBzFGPIhVvaQTtA/5qQTk7cPy9mGZ+rBMfVimPixTH5apDxu9D+XWGVvYjzg1f8Sp+SNOzR9xav6IU/NHnJo/4tT8ERvVjyp0F7s9PIDtYQ/msAdz2IM57MEc9mAOezCHPZjDHsxhj8qhq8xB9vMn9YJzlqpMN7tiDbxi3eVx6flZ8njLyXB850APW77/onzXo3zXo3zXo3zXo3zXo3zXo3zXo3zXo3zXK/l6igYxVqSQovp9L5mRWGWdAXKxblrfj9G6/ucauc3e6OpfUJJfUJJfUJJfUJJfUJJfUJJfUJJfUJJflCR9MPR3GPo7DP0dhv4OQ3+Hob/D0N9h6O8w9HcqdF/sJ4GsLwWy7hLIuksg6y6BrLsEsu4SyLpLIOsugdRP+uHwv8bhf43D/xqH/zUO/2sc/tc4/K9x+F/j8L9WoU+SocdJn0hPjRcP2skHE8SDjvKBOCN2jpQPJooHDgdM4EniQC8HzOTJ4kArh7bot9Jbp4sHYfJItHjwszwSIx68Jx/EigcvygeiMZjngXnjBE4RGC/wXzDfEwTmoqcTxYFSgUkCCwQmC3wIGkeKeOES+UJTHLhQ4BRx4GR5wCke3CQfpIoHQ2R+aeLBr/LIVPGgkzxyhnhQKY9ME//6d4HTBT4C/Sld4ICDzqgZ4pnhAs8U6I9daKY4METgWQL7Czxb4CCB5wgcCK3wXIHDBJ4n/uEi+Q9nSXNADzxf4FCBGXLLI/ACgWECMwV2FjhbYJDALIFyMHME+gp0CewkcK7AQIHZAvsJnCfQT2COwN6e5l48X2AfbChNfbQ/zhqDzRODzRODzRODzRODzRODzRODzRODrcIGzZoBOGuKYeISMZA4kPgi8UPijyQASQiSQCRBQNzmQJnUApHWtx65pfFx/oALzUeY5UeY5UeY5UeY5UeY5UeY5UeY5UeY5UeY5UcqsUGo1ocY+kMM/SGG/hBDf4ihP8TQH2K0D1W0wXrNN+/1nOglfwgO/Hsc+Pc48O9x4N/jwL/HgX+PA/8eB/49muF7pcJQDL0Ya78Y81iMeSzGPBZjHosxj8WYx2Ks/WJMajEmtVglNUyfbl6ith/DZYq5IsmrxQsXisORUrw8caC1wHyBHTxqu2K205Vq76Ezq1AV08fpIztMgTgQIXCRwCiBheKJt9WuYoQOd54KN1KGE6uMud9Da0trQzfEVzzNmx6xkpjrPWzzY27zwDJSJA68Ck6xFwv7qgguEs7u8oFY0MzPdIv8j6d5UWjacMle+KWHVoAzdON3xskHdqcvFgfmHnw3Zbf8JhvKzvmdQLfAH9GWdisXPd95sz4HpG2c3dTtZi7WM+d/5BNiHXHuZxdlxLpq/uqhJThSyi9Xlj8ELpaLtL3E+csHWXJnyfaNTdvFplkk2r7YiXjoSs4A+Rr7qo9cIINUGU+WhdOX9uRNRM1NTbNgxgzGHIxFMubPWBRjAYxFMBbCWBBjvoz5MRaIzG2eguMaw8Y1ho1rDBvXGDauMWxcY9i4xrBxjWHjGsPGNYaNawwb1xg2rjFsXGPYuMbQuE7VJzpmSvOIzGew6zyDXecZ7DrPYNd5BhvNM9hbnlGBTpOBLhQhngDpfJlYvkwsXzYUXzYUXyadLxPLlw3Tl8njS4MeVSaV9nGuVb1mtMxMtBRnjqGq4+NcKh/Y16cvxlFejKO8GFxAxEDiQOKLJBBJMBJ/JCFIgpBEAXGbYw528eifWzzlKfmVR7qKjpW5hOv0rsVcFQlFUoIkAkkkkjAkQUhKkbRB4kDSGslYJAVIfJAEIzGQ+CLxQ+KPJABJIJIlSJYiWYYkBEkZknIkbYG4zXHH8+L/n1/zlyvQFfyqwXg0qdzx/XxMzHokHp3QMpUtJyyViTKVCsGu0inUUgsyN8LM2YDG34DG34DG34D23oD23oBTYgNOiQ1o/A1o/A1o/A1o/A1o/A1o/A1o/A1o/A1o7w1o/A1o7w04Pzag1zfglNiAxt+gjD9JtPSLhLwzVUufTA3efEaS03F3vRmHtRl12Yxj3Ixj3Ixj3Ixj3Ixj3Ixl2qyyipah7cv/TZ9D/NnnDy0/d2j5OcMQ8QYZ8g1aftBgiCcukE/YnzjYKZ2rsoiRWcgpOUS+5sR3h+amEIuleRFL8yKW5kUszYtYmhexNC9iaV7E0ryodIgraz5yTpG0RjxenujH9nH92NakH9ua9GNbk35sa9KPbU36sa1JP7Y16ce2Jv1oa5JQJj3v4xyvfJyIHzeej/qcjxP3fBz4+ajc+ajc+SjJ+SpcEi7X9bhc1+NyXY/LdT0u1/W4XNfjcl2P06Eeu1Y9dq16TLcee1M99rN67Gf1OPh67Fr1qFE9Dr4ebVOPtqlH9epRo3psR/XYteqxn9Vjb6rHflaPLaweu1a9kj/5r+zc5D5soXHMlqIUmUulOFwjD18sHlyq5qgpHDkFffg8avw8luJ5VPJ5LOzzWIrnUePnsRTPK1Wc2BXuwWj34Hveg+95D5b3HnzPezCpezD0PejQe1ToVPtelkUeuodlp8DlAm/w0L0tN4H3a9D7NTh5avCda9D7Nej9GrR7Ddq9Bu1eg6OuQcFr0Ps1qFQNilOD4tSgODUoTg2KU4Per0Hv16D3a9D7Nej9GvR+DXq/Rkmdpi/49FCdbqoUXt4Jsli6z743xG2egV54Fkf4LKryLA73WRzuszjCZ3GEz6o0pqG1MzFAJiqdiW+TiaEzMXQmBshUAabLAPaFsj+7QNbyupi8wuaVSugra24zHS9AONkFCCe7rEBsCWP+jAUwtpSxZYyFMBbGWDhj5YwFMdaWsdaMhTJWwlgwYw7GDMaiGBvLWARjZYz5MubHWCljBYwFInObM/T1hFCHtPKZuKkIZ9mGs5GEM63CWUbhLKNwVsVwVsVwllE4UyCc5R7O9A+n3GfiBNuH/WQfToZ9aPl92EL24czYh41vH86MfTgp9+E02Ye9YZ9K6iyZ1CUirZXKFD7mZc2GM6/GTns19uCrod5EQpGEIQlCUoqkDRIHktZIxiIpQOKDJBiJgcQXiR8SfyQBSAKRLEGyFMkyJCFIypCUI2kLxG2eje0mhbWbFNZuUli7SWFGTWFGTWHtJoW1mxTWblJYu0lh7SaFtZsUNoVSWLtJYXZPYe0mhTWYFDZJU9gkTWENJoVNrxTWYFJYg0lh0zmFTecU1mBS2CRNYdM5hSbpObhIZaCTMtBwGeiXDLRvBhouA52UoQKci+WOY+WOY1LFManimFRxzBhxzBhxzBhxTNQ4ZpM4JnEcM00cEzyOWSiOWSiOFSOOmSaOmSaOFSqOWSiOlS2OlS2O2SuOFTGOFTGOinhemfzHPmalXCRmoeDxTPB4Jng8EzyeCR7PBI9ngsczweOZ4PFM8HgmeDwTPJ4JHs8Ej2eCxzPB45ng8UzweCZ4PBM8ngkezwSPZ4LHM8HjmeDxJPj5eHJ7Obb2y3FtUKQESQSSSCRhSHyQBCMxkDiQ+COJQhKAJARJEBJfJH5IAoG4zQw0WDIzWDKzTTKzTTKzTTIzSjKzRjIzQzIzQzJr4MmsgSczayQzayQzMySzgiezBp7MJkkymyTJbJIkM+snM7MnM3snMwsnM5smM2MmM2MmMysmMysmkxUvkNVYIbaIk+1Pak+TDzziwZnqPCfzSK4EyCsA0YbnWF+Uno3WMZl1TGYdk1nHZNYxmXVMZh2TWcdk1jGZdUxmHZNZx2TWMZl1TGYdk1nHZNYxmXVMZh2TWcdk1jGZdUxmHZNZx2TWMZl1TGYdk1nHJOtkHcoZ0hGvG57j9XHFHJnLSnH4FHn4UvFgqnxQJZ5/R+AqgTvk61yHy3ni8ct5Lp6OtWHVbsOq3YZVrQ2rWhvm7TbM221Y1dowV7ahGmbrzyPK5NI/T1/4WKAufOTI9OSA3tTX1Z0fqIYwX7zqMvFP9sgXLSiTa5ePOVOSXP0tmc8lWSj/+VLBkpWnfZyt1L/Ow7O6G3FJuhGXpBtxebkRl5cbcXm5EVeuG3GxuhEXnhtxHbxRDTwfN66zMI9ZuILOwvechRnOwqRmYbRZKkCBDGCJN2ojnlotsC/pYHZUPcXH7A5h3sAE3sAwb2CYN3Dsb+DY38A838Bs3lDZLLK/nTgB/H6gSW2D28YWRnfOkU/YU6bJ6fbcaXJ8k7/tydPk88KWH/06+9t33Z6gT3eKhFHXCPacMnrx4XpC2+PXE9xl6qZL8yWZ2GLwqPydKGgQUWzxi2LTPoo1jyjWPKJYS4iiJnChfQvdam3NzQIvF3izwLUCt8pXlchX2Y1mJos4k96n1DZZJFj7C5x7X6DPv0Cff4E+/wJ9/gX6/Av0+Re4If0CTf+FymcJNtjhTJXhTM3hTKPhrMEOZyMdzvQbTuNeKuPIqoVATUJYhBAWPYTFC2HxQlhDD2HRQ1j0ENbQQyiXZeiZdiyHdswz7dg7t2P5tWP5tWNR21Gcspa3KlQfZPIcnzlTzr5L5y8eBMsH8sPqEvl8hV6jVsg5dZH9/ZlGA0z6FvryLfTlW+jLt9CXb6Ev30JfvoVWfEvJVSlyuEKEu0XmcLGdgx/mcDfmcDfmcDfmcDfmcDfmcDfmcDfmcDeupnerhJbj+peFobNw/cvC98zCpLIwqSyMlqUCXKI72SQ54hU4E1PZNjeVeTSV+TCVOTyVuTKVzZpUNmtS2fY4lTk9lbk5ldzskfnJC+UhsiLrRKr3eMg06umV8ukS8fQk+bR94n4VBCESiSQCSSiSMCRBSEqRtEHiQNIayVgkBUh8kAQjMZD4IvFD4o8kAEkgkiVIliJZhiQESRmSciRtgbjNS2nyOqvVUl2F3a0jc05H1t06spp3ZK7qyHzUkfmhI/lhlYyzXoQNl/sQWfmTHFD5lVielVj5lVj5lVj5lVj5lVielViRlVjslVielVielViRlViRlVjslVjFlejXlViRlWjElUqBy45uwyhWBGca25j9hY2ihecGt6Iqt6Iqt2K2t6JEt6JEt+LYb0W9bkW9blXDXW235HhsyTswhx2Yww4MuwPD7sCwOzDsDgy7AwexQ+WwBq8KXoEWuwKNpEgJkggkkUjCkPggCUZiIHEg8UcShSQASQiSICS+SPyQBAJxm5eXyZ7gY34tp/laNMINmOENmOENGO0GjHYDRrsBB3ID5n4D5nEDynKDSuoKrIiFFbGwIhZWxMKKWFgRCytiYUUsDG3heC0cr4UDsbAiFo7KwopYqJGFGlmokYVKWGrw6/S2yZIVWa9X828k8eJqnsZW8zTWk9NY301jq3ka68JpbDVPY6t5GlvN01hnT2PdO42695WY3zCWwzCW3zCWwzCWwzAWZxiLM4zibJBxRBUF99DGc5B8cKWIfbt8vlor6JWi1dCvKjjvUQvZVfKfyjv6p+se6TzHgHpeiVVTpBRJGyRjkRQgcSBpjcQHSTASA4kvEj8k/kgCkAQiWYZkKZIyJEuQlCMJQdIWiNu8GpvELZj7LTj4W3Agt+BAbsGB3IIDuQUHcgvW4hYVuvZgi6N9MnP4RVKcBjln/92rKteUSXl9zDHSTtfibn42ajEbyz0bBzkbVZqNKs3G4c9WI67DTliLracWO2EtdsJa7IS12AlrsRPWor616PVa9HotpluLjq7FWVCLs6AWB1+LXq9FjWpx8LVokVq0SC2qV4sa1aKJa9HrtTgLatHRtTgLatH4tej1WiV/PX7wcQrrh6dQL9r49y2Z9Xctuemg3/GQ38k71X6nE/tLT26zAX1chz6uQx/XoY/r0Md16OM69HEd+rgOfVyHPq5DH9ehj+vQx3Xo4zr0cR36uA59XIc+rkMf16GP69DHdejjOvRxHfq4Dn1chz6uQx/XoY/r0Md1yqWNB/y+luGQx6/TnzwMUIvjZu1l5w3aHfJ3WtzmFn0qmK9etNXesd+LO/ZtqMc2lHobirMNxdmG4mxDcbahONuwvtvUcLbJHKS/vzie31/4S4bfrq9smFObVZJ/u6BZJs0cjPky5seYP2MBjAUyFoTMbe4QBVwpkjhT1m/nnzQs57yDX/c7yJnmUTeqXXSy4SxUTtptOykVnfQSOukldNJL6KSX0EkvoZNeQie9hE56SamxRySxQYR7UeawFxfwCzD0BTj3L8D3vACTugCTugCjXaCiXY+NrwobUhU2vipsfFXY+Kqw8VVh46vCDKuwO1XhQKow3SpUqgr7cBUOsQo7TRVOwCocbxUWoQoHX6UGv093jhGq3jeQFD7mnWrgPs4CQ43Gx1liwICrccDVmGI1JlKNnb4aha3G5l6Nzb0am3s16lKNWlajltWoZTWOvhpHX43CVqOW1ahLNXb6auz01djpq1H/auz01djpq7HTVyvJb9SnO4lK8pv+bLKff+wn+8329N6D03sXyrkLS7ALtd2F2u5CbXehtrtQ211oj11KjVv0z5KmSTFuxROXEqxxCSZVgkmVYFIlmFQJJlWCSZVg8UowwxLMsERleBt+ujdVde8rkbnN28UYqoWMXVVF77DX6Aipao28VKrWmzv/bB969jEv9F0tPpJy3o1vcHw/k7pb5nKVOLzR8MAXLAeJB1vtiwU7lGD32B893GV4qEvdpo7fq3tWfyX3ffZP010lX9X803T3H4evVcsNTvLR70AeKJNe83FerQbyoEzYvqVqILtmP5DtSgayXclAtp8YyPYoA9keZSDbowxke5SBbI8ykF25Gshu0xpInn9IZmvfvGHftCFv4ugmUN7ccRG0lHdw9r6Ds/cdnL3v4Ox9B2fvOzh738EJ+47K5mF9f41bCvmI3jJvUbI+qp/aJclj/+TPLsiJdD/zw1+aCP+SucgvDaXLw3/120ZNXzJ6/Nj+ksSBI5EfaT9w0BE9oYX3UcI/qd09UrGndBk8kjyNfX4vmmMvmmMvmmMvmmMvmmMvmmMvmmMvdvO9yinPHO6WFpdxjHQ7UK9nZS4HvlA2kyftDvSY3ZwePMBp6u4z2cDe0l1K3YYG/eW5Y/8jIxcf6Vif1027p/q+1b9lZleL5zaI18g+cZsHrg6/cLganXv8avSizKVWHL7doAbnfEJp+5I8rm+eVDdTzvXA3ZVN91teI56ZI1//sh7/FDUbXsGTmgKcAAW4zS1AZxfg1CjAqVGAni9QNn+VFhMfZ63MYq14cK1K+zX9kz7OEXKtu1ZEOq05nvxLf82paOZgzJcxP8b8GQtgLJCxIGRu83W8hncau4Z3Gr3iDbaYH/f74+SdeW0cbG69qW+UC1Z+futIvjAqer158aFa+du6f2Yrj7yDn9VEsspEsspEsspEsspEsspEsspEsspEsspEku7v2l8wj5Kjb/6C+XvYwHejf3ejS3ejS3djA9+NDXw32nw3mnk3NvDdKqX3UZZpKukLGTMYczDmz1gAY0GM+TLmx1ggMrf5ARa/TuB/D2ICudDnGuAGuTTmGYeyw4cH7H+/UeJ/ZJ+23Ymnbe9hFd7DKryHVXgPq/AeVuE9rMJ7WIX31DA/xusk1xV5mk/nFQlFUoIkAkkkkjAkUUiCkPggCUZiIHEg8UcSgCQEiS8SPySBSEqRtEYyFkkBkiVIliJZhqQMSTmStkDc5ifH53zGfN1ztKczn2JTeBLL8ySW50nU/UnU/Uks3JNYuCexIk+iQZ5U4uynD+GdQ1U3/gxX11xMJBftlIsRcjHFXEwxF2PnqnCfi3D1Itwq1aj/g+EWYriFGG4hhluI4RZiuIUYbqEK94UM8Jd+yLnpB5ybfrg5Tjy4wzbGEf+Cs/3jm/YvNP/ZDzMf8IPMf+t3mO1f5Wz5a8uH+5HlP/1x5WP9o8r6x5Td5pdoBRdawYVWcKEVXGgFF1rBhVZwKSt8hatfD7be9WDrXQ+2ivVgq1gPthb2YGthD7bC9WArYw9a7762r+BcxK7gyAs3l+OlHLf5jZgnG6XN1Dz51l63hjlAi9tRpdtRi9tRi9uxUdyOjeJ2FPN2lOx2bBS3q9y/wwLNx9DzsUDz8T3nY1LzMan5GG2+CvC9PcjrDbUG+Dg/VVL8II9vEgFaeejS+ufyeXlp/WP5IFw88KfvftC7rcDFcgWutisw0RU4hBWY6ApMdAWqtwIHtwKHsAIX2BWo3gpUfAUu1ytwTV2hNPgRRc7HDPMx93zMIx9zz8fc8zHDfBXgp3/sdEDu7LvKl/zN7838rE/v+iin/2Jfk0zi1yR/RWFyUJgcFCYHhclBYXJQmBwUJkcJ8xsuwaVYzVKMVorvWYrvWYpGKcWil2JSpVj0UsyjFF1TqpL6XX8JxHkh7lc/xew+xew+xew+xew+xew+xew+xew+xew+xew+VQn9V59njVLF+gOLsgATWYBFWYARFmCKCzDFBRhOErfTx8CmPZ2dskxnLXw6a+HTWZueztr0dNaYp7NmP501++msoSvmdhqCmQ1CgqekBE6HgRrMQQ3moAZzUIM5qMEc1GAOajBHBfQ1/ukrr18e9ZVXp59Kxj6bVee378r56fRnOmSjDtmoQzbqkI06ZKMO2ahDttIhgEXIwwh5GCEPI+RhhDyMkIcR8lSEQBZhLkaYixHmYoS5GGEuRpiLEeaqCEEswjyMMA8jzMMI8zDCPIwwDyPMUxFaSXvKb8jeJd3Z2tC7+wnKrMEY3tmBTaAO7GOTDmzKdGCTqwObMh3YJOlAkyTE0H1inIobauAJ8KW4JCsSiqQESQSSSCRhSHyQBCMxkDiQ+COJQhKAJARJEBJfJH5IAoG4xRbuMBdlzelHMZGPbv6GG3qTZb4Lsj2ISj2ISj2IA30QB/ogavggyvYgSvAgyvag0iPicHo4HzpuF6mdkdKp8kO4GmnUNgb9IKn5mGRRtljO+bj8PoVqPYVqPYVqPYVqPYVqPYVqPYVqPYVqPaXUamvYH3ZFySSO9sMuZztDf6j0kZqS7XFlNR/BIT2CQ3oEh/QIDukRHNIjOKRHcEiP4JAeUUPqYOBV69NZ4yFWwlgwYwZjDsYiGfNnLIqxAMYiGAthLIyxcMaCGPNlzI+xUMYCkbmdHQ19Y8uHqjadjENdE5dWGO44kpJ3NvQ1aPN0D1yCdnYx7NNQi52GshsJblQv7WrQ7XXOdSqzbsY/cD3l/8BllEaBX3iaL6fIP78V7vlbl1XMkzzH/6qKs7t2lvz2fJGzB056sVXAydWKTa5WbHK1YtOpFZtArdiUacUmQis2EVox67ci6/dkKXVjSXRjSXRjb92NvXU3lmA3lmA3FrYbm7fdKIleLInuLInuLInuLInuLInuLInuLInuLInuLInulERvlkRXlkRXlkRXlkRXlkRXlkRXlkRXlkRXlkRXSqKPoTeMO9V873vIToSfzi09VCPqx4bWhQ2tCxtaFza0LmxoXdjQurChdWFD68KG1oWGdpKhLzSUqqH1N/CmoUFsERrEMhzEMhzE3nsQy3cQy3cQy3cQy3cQy3cQm4nE2iJzOwfY+5THZfID7cW8WI1lkIGnFY/hWvwYbo8fw2X+MVzmH8Nl/jFcvx/DZf4xXMwfU4kNtjtMsMxkCFvaRzNVR7NRjmYaj2Yaj2aL+Wim42i2mI9mqo5mi/lo1plGs7qNZnUbzeo2mtVmNOk/lFk4giUfwZKPYOlGsHQjWLoRLKUIllIESymCpRRBKQ0z8PbKM9RLrkTmdg5n5ZjAyjGBlWMCG9EENqIJrBwT2PgmsPFNYOObwMoxgZVjAttbTWB7qwlMlwlMlwlMlwlsbzWBqTSBJBhhT5WOaqqMNPSZ6cuKnszKGsQkCWKSBDFJglhSQSypICZQEJMkiIkQxBIOooRPYSmFsiRCWRKhTKdQllIoSymUpRTKUgplSRAby1gBY62RuZ2nYrrmhSAgEQOJA4kvEj8k/kgCkIQgCUQSBMTtPM0u88OqzKOYpn2Ypn2Ypn2Yin2Yin2Yin2Yin2Yin1YZfqQUqOZUrehOLehOLehOLehOLehOLehOLehHrehHrep2GPsWVCh9Bhr2Bfd5ae+znGsTZzMpvTJlPx440TcLLnWc7Bz9gky++sEu0MmP5HVtjerbW9W296str1ZbXuz2vZmte3Natub1bY3yTPJOOqftjDTPUd1a7pzsu3xR1RNT7drOlDVNNrQv8I3XrIYA6/8dWIidWLLQic29E5MwE5MwE5Mlk4kRKwMu1lk8S+VVJyh95MXKhpv2HdF3SeH1HxKmmAcyUbT3mDKDWe85yAbzUTjkLd6yJvOd8snTuCX55xJrA28jG3gZWwDL2MbeBnbwMvYBl7GNvAytoGXVUGSVbgtIny9fS/UJsNDv+C/SyWUImskzmydn6kamawZjGPmGMcWyHHMRuOYVcaxPcM4NrvGsQYzjhluHNszjGPL5Ti2ZxjH9gzj2Kwcx4w6js30cWzPMI6ZeByZeIphf+4mT4Oadg9up5PV7l2s3btYu3exdu9i7d7F2r2LtXsXa/euyiPV0J+GmrEe+DDUmcZKNIWVaAoTntgSxvwZC2BsKWPLGAthLIyxcMbKGQtirC1jrRkLZayEsWDGHIwZjEUxNpaxCMbKGPNlzI+xUsYKGAtE5nZOZetRGEswjCUfxuQJY0mEsSTCWOHCWOHCWBJhbNBhLN0wJnkYpXuG3aENNfunGfZ3ez/R3aKz/DK1c/pBFzh7XZfr/blHvOAd5XexnOmGfT2+M16P34LTcAtOwy04DbfgNNyC03ALTsMtOA234E5qi9Jrhj0nnfvYHQrOM6WQW0VWj0odZ6qXyT3MQs8J/lvfzrOMf/oT5MuO/hPks/U2xVwjZTrnkLY6op+YMGf9TVudy/Ye8vL6ZsNzFJ+wnCdHtk2wkXJkswzacZtZkp3POnYS69hJrGMnsY6dxCZ+Epv4SaxjJ7GOncQ6dhLr2EmsYyexjp3EWlIS69hJrH0ksY6dxHp0Emt6SazpJbEencTaVRLr0UmsRyex9pjE2mMS69FJrOklsfaYRE0vg/XoESzBESz5ESzsCBZ2BCvHCBZoBAW6gAUayQKNZIFGskAjWaCRLNBIFmgkBcr8R+f4wb+xlHCkc3w2c3ssc3ssc0os0yCW6RPL5kUsmxexbF7EMk/FMrVimcNi2ZyJZX6LZTMols2gWObFWDZnYtmciWV1jGUzKJZVNZa5NpbNrljm4VhW8ViqeBYTOYaJHMNEjmEixzCRY5jIMUzkGCZyDBM5hokcw0SOYSLHMJFjmMgxTOQYJnIMEzmGiRzDRI5hIscwkWOYyDFM5BgmcgwTOYZEnsNETmAiJzDpEph0CUy6BCZWApMngQmSwARJYH07gfXtBCZPApMngQmSwAadwPp2AjNKAjNKAjNKAit/Ait4AitxAitjAitVAitOAitOAitHAitHApXDZehrHO3UZnUudlezCJIn4kDii8QPSQCSQCRBSPyBuJ3ZOhXzTZnJPOaTROaTROaTROaTROaTROaTROaTROaTROaTROaTROaTROaTROaTROaTROaTROaTROaTROaTROaTROaTROaTROaTROaTROaTROaTROaTROaTROaTRPJJjnEcvvLzF+5ylleIzJNlZvMN+56MTz14AWyBgRfoHExgB7OTg5nEwcR3MBEdTBoHSZOLc8bZkwXqyd6sJ3uznqwiPZlve7KUerKwPZnjelISC43D3eFyq+E5gi133uHex/zqSN4m38D7E68BAxMJRVKCJAJJJJIwJEFISpG0QeJA0hrJWCQFSHyQBCMxkPgi8UPijyQASSCSJUiWIlmGJARJGZJyJG2BuJ0FxtFfPT/0WZ/c2GZ4DnX2t0jFniKeP9nw/PUzdXmGf57nnz5jLzT0HVpmuYd/T8is8sDXhJxFhr5z7A+1IBYbLe/PMvd7Wtye1Vq+U9PtWXZLnCxwPW+N5jbPkd2jZY+95b1adttt0iBRPOguHxxwt1ZTqz7wti15t9YZ8gjereWMkw/s27XOFgd6ywP2/VrF4sBc1qMPVN2+l2uxONCPlaHlXV32XVz23VvniBfebHhgtTjc/VzJ4oX/kS+0b+ySfxNtP/vooOWtXvK+uUh54Ejv+Wpaw/TNX81LWJP15OcfA+RL9IrldrrtDVV39aHRYrY4zGCLwwy2OMxgC8AMtujPYMvBDLYAzGCLygy2qMxgC8cMWioulBleJH2rMiw5ylYh5+XsI2oZf94qSg37a+XPyue3iwfP44XIh7EFP4wt+GHs7g9j130Yu+7DuFY8jG37YWzbD2NzfliptITthH/C2D9h7J/wTX/CN/0Js/oJs/oJw/2EKf6kYi/95zdbcrt0iufvfrXMuYzZeSiz81Bm56HMzkOZnYcyOw9ldh7K7DyU2Xkos/NQsnOZSkn+nM/5nua//bAatwKrccuxGrccq3HLsRq3HKtxy7Ea9wWr0ZSr0Rir0RirsfyrcQe0Gr2wGtf41eiF1eis1eis1eif1UqFcmbXnZjVTsxqJ77pTnzTnZjvTkxxJ4bbiSnuVLEr/rE1Uq4cPQ3PcV8s5XLXSx74e6vm0SyW/y+ukRcpw+Bd8vJPQKmb5GNUm6n8P7Lrkr4Zc4TbL+ntgf/fUcfGURcb+t6cwXJLs1zZZ4d41VBbs2XKV5cY9GMZpku+bIWhfzfpa7XV99g7/95qX7TSwNuZh7ArBkPYwjeELXxD2HI2hC1nQ9hyNoQtkUPYojiELXVD2MWiIewi0xBaBi819J9m+bdMvsoeS3s1llXGP/155S1sD/GXTsUu07VyvqZkt3gzkGdky5qbgtu52n65r3r5GgOvC45nZRnPZBrPijSeFWk8u4I4nhViPNurjGdlGc+ut41n1wzHs2uG49k1w/HMFOOZKcYzU4xnVwnHMxuMp1JfbuCVrc5smJ2ZIJ1Z8p2ZBJ1ZEp1ZoM4UaO0/apsjvUWx4qCuuYLVfRQb5ihW91FMkFFs0KNY3Uexuo9idR/FpBvF6j6K1X0Uq+0oJusoVttRTORRJPI6A246N/8lX3ElELdzPdvabcWt3Vbc2m3Frd1W3Nptxa3dVtzabcWt3Vbc2m1Vsb1sv9+XKduXKduXjbsvG3dfpnNfpmxfpklfpmVfUuhK43DXNp8xPEdwUXKDtpCP6PweL/9Dgh/KF1QbeNVyPZ5CrMdTiPV4CrEeTyHW4ynEejyFWI+nEOvxFGI9VnQ9VnQ91m09nkKsxyKux1OI9VjE9WiJ9WiJ9Vj49UrmGuazpzGrpzGrp/FNn8Y3fRqzehojPK0iXMUivI8R3scI72OE9zHC+6jI+xjufQz3vgp3NWtfsrVcfpza2IHtq9ZekM9Sq9g1TInXUYnXUYnXUYnXUYnXUYnXUYnXUYnXlRLXGvoPg82XwevsXLqozUF907TYpqeFvFPN7dx44MK82AML8yY2hjK0dBkOqAwHVIYDKsMBleGAynBAZejvMhxdGZq9TA21gWX1NibyNibyNibyNibyNibyNibyNsZ+W4VrNOyb1/ZKkZpvXrvOsG/Mbi+faP5carNh33P3Dl7quhMzvRMzvRMzvRMzvRMzvRMzvRMzvRNVulOlvUVaYKfcVCkLbMU1yHkma9BnUhPexnRdhtVehqkvw9SXYerLMPVlmPoyTH0ZVnsZjmMZjmOZymq7oTeH36lptcPAnVFbtly1ZVuGtmyMbdlS1pYtZW3ZAtWW1Nhp6Du8X1FxdxnH4dNRedbTz+E52rvkdxv2besvGB66RP2SvQzSbet7mixbzi27l9X+TSz3m1juN7Hcb2K538Ryv4nlfhMr/KYS93op7hIR7wWp7T4W/FUM/ioGfxWDv4rBX8Xgr2LwVzH4qyr4DcaR7HnlKdB2+0LVsVs1bmR+bs/83J75uT3zc3vm5/bMz+2Zn9uTn29iIn+FIn+FIn+FIn+FIn+FIn+FIn+FIn+Fc/grFftmFXuBiP6th26c/kG57hbMydmLDb4XG2AvNsBebO/Zi+09ezGZejEperG9Zy8S5tambv0Jduv7UaH7UaH7UaH7UaH7UaH7UaH7UaH7UaH7VRK3GXShwtwkJ8Tthr4R2vmLTOnE3gl9BzrU/DfK8m/wJ5EAJA4kvkgCkfgDcTvvbFpunXy5vcvQv+lfLyW622h5A/JX8uV/+Qbke2ypzcknXOl7VS7sh8LWq6Hfx+budizBdhR6Owq9HZ25HYXejpXajvXYjs7crupxv4ot/8BlsYf+5MY18vAD9kpivscWkgcNPMG6rMjTfIKlSCiSEiQRSCKRhCHxQRKMxEDiQOKPJApJAJIQJEFIfJH4IQkE4nY+ZG9WnlabhocN/ffNuij6iKbm3ZI9auDVx8Gs1w9mrXAwa4WDWRMbzBrjYNYYB7PGOJg1xsGsMQ5ml1cGs6uPg6lNPsYKuw4Luw4Luw4Luw4Luw4Luw4Luw4Luw4Luw4Luw4Luw4Luw4Luw4Luw4Luw4Luw4Luw4Luw4Lu06N/l+ydLtEJf+tKvm4YX/jp1G8dLfA7VC9YFa9YFa9YFavYFavYFavYFavYFavYOaBYKrQEzJH+bcjflI5PmnYn5pe4Wn+1HQVFm4VFm4VFm4VFm4VFm4VFm4VFm4VFm4VFm4VFm4VFm4VFm4VFm4VFm4VFm4VFm4VFm4VFm6VEuUp41CbPdn3vz9u/f3pw+XiPMk4bsk807Tt+R63PU9g3Z7Auj2Bsj+Bsj+BFX0Ci/gEFuQJLOITqjrPGvo6RaA6SX3OYCdZ8vfhb/X8r/ozns7n7ZnvLELZHkLvP4QaPoQaPoRKPYRKPYTiPIRSP4RSP4SCPqQ0/DduDpz+rPf4s97jz3qPP+s9/qz3+LPe4896jz91mxcM+5pShMMD15ReNPQ27QNZ0ZcwOXMpqrQUVVqKKi3F4S/F4S9F/ZaifkuxXSxFlZaisktV7i+zrG7CrG7CrG7CrG7C2Ddh7Jswwk2Y/E2Y/E2Y1U0qkVcO2REO1whkx+jm+Mc6wqtshV+LC8VaXCjW4kKxFheKtbhQrMWFYi0uFGtR8LUo+FoUfC0KvhYXirWo/lqs/FosxVosxVosxVosxVpVitf+Vin+VgXkKrQPK/E6m9IBbHMWwCZ4AJvgAWyCB7AJHsAmeACb4AFsggfQBH+DTZL7sEz3YZnuQ5XvQ5XvwwLehzW7D/W/D2t2n4r9JrPiJrTiJrTiJrTiJrTiJrTiJrTiJnTSJoy9CU26CU26CUe/CUe/Cce4Cce4CX25CUXahCJtQikUKUXSGslYJAVIliBZimQZkjIk5UjaAnE73+IL8YlfgOWV0bP5Svw28+fNWKGbsUI3o/Q3o/Q3Y+1uxtrdjEW5GT1ys9LnHcO+jhrC/lKV812W1F2Y1F2Y1F2Y1F2Y1F2Y1F2Y1F2Y1F2Y1F0qqfdY7C8x9pcY+0uM/SXG/hJjf4mxv8TYX2LsL1Xs91XsPSL6aDXvfMxx2i8xMHeXY7Dl+P7Lceotx9SXY+rLMfXlmNNynK7LcRzLcR4ux9SXYydYrsbxAWs8Ddh4GrDxNGDjacDG04CNpwEbTwOGa8BEGnD0DTiSBpSiAaVowDE2oJYNOOAGVKwB9W9A+Rqw8TRg42nAxtOAjacBG08DNp4GbDwN2HgasPE0YONpUPp/eIxXYbllaus4aIs5cEP0kaHPTjqos5OPD2iKzuHGseuKR3I28olxwBXDN9QTnxr2Zc23PCf6suZ+LaP5tlTxs0NWWGb84HHL7HNe0RP3VUfpJVMV7j+siS/C6b8Ip/8inNeLcF4vwl6wCCf5Iuw5i7B/LFKT7wvD/vxwGn5sqE7yqlV2Xxr6qy+PqktMXxn2NYQe+DeW7sWs78Ws78Ws78Ws78V07sUh3ItDuBeHcK/K+mvbXvfLlL4x9AcpN0r2rZ2g+YuH/k70boEt/460nfcrmPcrmPcrmPcrmPcrmPcrmPcrmPcrKtXvmPel118+YbPye3sLYwZ4cAfzg0E/5+/MVCX+0Tjgksylnv8NO8LmJvjTAaqeesJU/dmgi/o+Zldx+HKBPTzqD+KaXeTTvzRNmCCcMM+h8Z5D4z2HxnsOjfcceu059Npzymu/qlDS8h8dxPJyStwHGXyAGXyAGXyAGXyAGXyA1v8A0/kA0/lApfMb21g14saqETdWjbixasSNVSNurBpxY9WIG6tG7BCNuLFqxI1VIw64EQfciMNqxGE14saqEXVpRF0acfSNuLFqxI1VI26sGnFj1Ygbq0bcWDXixqoRN1aNuLFqxI1Vo9L/d6a/F/X3ov5e1N+L+ntRfy/q70WVvaiyF1X2ospeVNmLBfSi5F6U3Iul9aL+XtTfi/p71ej/29TsnmbN7o9jvN08+O3P2QdtHT4OvY5lyr5rOPASUDq76JPOLvqksws76ewW53R2mSedfWqUzi4WpbOLRensglA6XRByqJSqROJ9ZeL2XyM/4K+Qu52+Dn0N+DU5FD8HWm8NWm8NWm8NWm8NWm8NWm8NWm8NWm8NWm8NWm8NWm8NWm8NWm8NWm8NWm8NWm8NWm8NWm8NWm+NUs3fccg9ptz5rTE8x/WsIcCBN9pHs0+eiZUwFsyYwZiDsUjG/BmLYiyAsQjGQhgLYyycsSDGfBnzYyyUsUBkbmeg43DnJKOOUTs4sA0EOexWdQZrVa3UcXmH7zdg+c/Q8p+h5T9Dy3+Gjv0MHfsZTobP0P+fof8/Q2N/pkRrfTjRnJ2M46ZasKPlubnansrt6m8HmXUnYpsagh3dvANrdQfW6g6s1R1YqzuwVndgre7A8tyBveoOVavQwxp83XErVRjT4VvU4VvU4VvU4VvU4VvU4VvU4VvU4VvU4VulQ7iKXSKi92ruJaYHlyQPrjUeXIU8uFh5cBXy4CrkwRF5cEQeHJEHR+TBQXhwEB6c4B4cuAdXLg9OVg8O3KMGHsFEX4JvugTzXYL5LsF8l2C+SzCRJZj8EkxkCY5kCWa1RGUVaW95nlJ/SI4tSxPZsjSRLUQT2UI0kS1EE9lCNJEtRBPZQjSRLUQT2UI0kS1EE9lCNJEtRBPZQjSRLUQT2UI0kS1EE9lCNJEWoihWpgewMg9gZR7AyjyAlXkAK/MAVuYBLMYDWIwHVOy2Dn3vWl91tbOdvd6ov3LflNN+tM5+THA/JrgfE9yPCe7HBPdjgvvROvsx2/0qwfZ/3uOf/1/S4zs4Wl6KmHGQfnt8+mxH5qUfsFQ/YKl+wFL9gKX6AUv1A5bqB6zOD+ilH1SpOjWZR/5CdlMSH6N5PsaMPsaMPsaMPtYZXens6KP+az7qjy8JQBKCJBCI29nZgbczb8R/uhHb+EZMbyOmtxHT24gRNqISGzHFjSp2l4M7GP/UwunGCbZwV9aFJ7MuPJl14cmsC09mXXgy68KTWReezLrwZNaFJ7MuPJl14cmsC09mXXgy68KTWReezLrwZNaFJ7MuPJm6cDclgbwGOsjhoWtlCfJ4d3YiexHuGi7CvYEiJUgikEQiCUMShSQIiQ+SYCQGEgcSfyQBSEKQ+CLxQxKIpBRJayRjkRQgWYJkKZJlSMqQlCNpC8Tt7NF0auT04KlRT1aXSqxLJdalEutSiXWpxLpUYl0qsS6VWJdKrEsl1qUS61KJdanEulRiXSqxLpVYl0qsSyXWpRLrUol1qcS6VGJdKrEulViXSqxLJdalEutSiXWpVHXppfTX+7gmST5HST5HST5HST7HsX6OY/0cxfocxfocxfocJflcJdT7T3cKzrHH8IO+v9Rn+zDTVqBpK9C0FWjaCjRtBZq2Ak1bgaatQNNWoGkrsEIVWKEKrFAF1qEC61CBdajAQlZgISuwQhVo2go0bQWatgJNW4GmrUDTVqBpK9C0FWjaCjRthfJIX4f9CfkCz4n+hLwfW3NPZevjqbQmnXToy4jCcc4O/+BlxEM5tz/LdhLbIUxiO4RJbIcwie0QJrEdwiS2Q5jEFJjEdgiT2A5hEtshTGI7hElshzCJ7RAmsR3CJLZDmMR2CJPYDmESVWMA21sX4tQpxKlTiHOiEOdEIc6jQpwghThfC3HuFarYA1njKMfGUY6NoxwbRzk2jnJsHOXYOMqxcZRjIuXYOMqxcZTj6Mtx9OWYfDkOuBwbRzmKVI4ilaMu5dg4yrFxlGPjKMfGUY6NoxwbRzk2jnJsHOXYOMqxcZQr/Qcd8lrasfrMKO+gjWMw8+HvWInfsRK/o8S/o8S/Y41+xxr9juL/jl74XekwhMX+BmN/g7G/wdjfYOxvMPY3GPsbjP0Nxv5GxR4qr1XsFXK0MeS1imGOA26DGq1a1XCH/Xn7dXge+igm+ygm+ygm+ygm+ygm+ygm+ygm+ygm+6hKdoT9adj76o+pNp0aT8CUPsEp9Qnm9wnm9wnm9wnm9wnm9wnm9wlOtk8wWUncbiukqDizsDhD/L/YVeQt887PN3x8zLZFVmtX3pyWh80i97wFVvjUzMKinLzshML8vGLxKq97Xv4s7wD1rucUKTiX4DyCWQTnE2QQXECQSTCbIItgDoGLYC5BNsE8ghyC+QQLCHIJFhLkEeQTFBAsKtLtVEERQTGBm2AxwYUEJQSlBEsIlhIsIygr0i1CQQXBRQSVBBcTLCe4hGAFgYdgJcGlBFUEqwguI7AIVhOsIbicYC3BFQTrCNYTeAmuJNhAUE1QQ3AVwdUEtQTXEFxLUEdQT7CRYBNBA0EjwXUEmwm2EGwl2EawnWAHwU6CXQS7CfYQ7CW4nmAfwQ0ENxLcRHAzwS0EtxLcRnA7wR0EdxLcRXA3wT0E9xLcR3A/wQMEDxI8RPAwwSNFesIreIzgXwSPEzxB8CTBUwRPEzxD8CzBcwTPE/yb4AWCFwleIniZ4BWCVwleI3id4A2CNwneInib4B2CdwneI3if4AOCDwk+IviY4BOCTwn2E3xG8DnBfwi+IPiS4CuCrwm+IfiW4DuC7wl+IPiR4CeCnwl+IfiV4DeC3wn+S/CHAqePQWhodGj01ein0V9jgMZAjUEaW2lsrTFYY4jGUI1hGsM1RmiM1NhGY5TGthrbaWyvsYPGjho7aeyssYvGrhq7aeyusYfGnhp7aeytsY/Gvhr7aTxJY3+NAzQO1DhI42CNQzQO1ThM43CNIzSO1HiyxlM0nqrxNI2jNI7WOEbjWI3jNI7XOEHjRI2TNE7WeLrGaI0xGmM1xmmM15igMVFjksZkjSkaTY1TNDo1pmpM0zhV4xkap2mcrjFd4wyNZ2qcaRS5rMD8guKc/Dy58g6w/Oe4ZruzvVVWQFFxYU5WsXgUvsDlKsjIzM3NKM5f4BKvq7JaFxe6XBlZuZlFRd5Uyz8rM2ueSxwOVQ8ysgszFy7MLBQHAgvyi4pzXSXe1HnG/EKxqlv+grkKvfPmW8HFhZl5RXPzCxcKnqrW/Fm09GdaQQWFOfmFOcWlXisgT7wiM9drtcpcODsn260O+mW6i/O9ln+hK1u8eZUVVVCYX5CZLfYPGSJiDg1HZK6CZWSJ3GdnZi2QI7TaLMwsnS1elpuZ5ZqXnzvHVVjkvdQKc83JKc4odhUuzMnLzBWDmpdt+sybV2WF5BeKl7jE7sRVLF8YkrOwIF/sYQoyi+cVeWd5reCifHdhlksdEFoEiXd2Z+coNeX+xW9KZuECr3vY/wDwQDuw'
+)
+DATA = pickle.loads(zlib.decompress(base64.b64decode(DATA)))
+MEMO = (
+b'eJzlXQt8HEd5tx53elmWbMePxElILiGR7MiJEztOnATnLJ2ki3R3yunkR2J7WZ1Wuluf7sTenW0lSoCUh5QetKRHm4ZC0xJom4ZCKaVpGgINaYG0pdBCSiC0gbY0bSmlPAqFAp193O3Mzsy+ZvSwq59/lmZ2v5n/959vvvlmdnb2DYF3nn5hnfZzX7VnRP2v0pwXZ6VqJRifiB2KJKuVljmxVJKUfFW9GDgt5srg6rt6Dh4A/47vWjje19t7UE+Bf3df13fzid5d4C9pIdKL3WRcXkBuPr4bSfYeXNByakn9ol1xvQd7F6BUtRKYzokzxeqJaqVJEc9U45WgcCY7VcqAnJ6Rhgfb1hk/DVKlVRBK83OSIFQrbWO6oslItVxpnVOyBSVbmq+OrMt0VjpSkjKbzYu5AWm6Wh5pAFxkGivB8VQyGh+qZprVdLByQWj3ToDr1suPH+/tOQ5+enceDFUzrSeqmfZ4pkOtvRGuPdOZ2VDOdKk1ZLrLI416qYHoQCSeqhe6z2An3HfXiYW7xb57TvQuCL0m43C+RgG42rsTrbXBptYmvdbGI+P1Kter5V7Wtr6zHfDpvqRmvaSWeOTIaDQeQYoD/zp7D7Z7KS6gF9c2EE1G+lPRRLxe4FZQWjI6NJxaGI0MphYGEkfiCxNjvRamRwLWEoN6iU2xidF6WQ01qipNoZ2gsTor7YYdjJeUKiTcYggPRA+bwteawteqwpl9kESrIREeGDAldpkSuzCJNkMicnTMlDhpSpzEJNoNifGJQ6ZEnynRh0l01EhImKiaZgtTmkylIVsVgWAwBHJCWavs+lptUbMxmorZvF7fuC4J0rhkpyHZnzDNrCldKCKSII1LbjAkU2GozpKI1gnSuGSXLtkchkWbRVS2JSQShbuNbjEWrYtqf9cFA6GxKC62URdrMK2/QTJbQ8JaY5N+/45kZDScih6OCGOJ8ahq7AJu9n3A7NNSHtjm8csK0wtKdiZT0v7KSdP6H+Jk4bS0MCnlCmcsvSEw0mbtDZv1qrsGE/GUkBjTKh2JHDOZKmbvqWNXm/UeHP4FehmbxlPHRgH2ZGIskkwdQ4rZAlAXS0rhlCSkC7mCsjCdzeUs6JpH1lvRbTGcSX8iFoPdYcfxK1TvdBK4Jg9ObqvhsAcig7BnCgJ3ns3XlWwN6WlMzW2GMYRN420UizWx5pBYxES2G85cxR82jeEa0xiuwWQuNIxn0Lx/2rx/Grv/IsPAR8fCSVOkxxTpwUR2GCJJRKTXFOnFRC42NIncORGG/OZtpsxtmMwlhsxYYhSqJzBXyIlKTa4lpCUx2Ut12XaAMByLgBG2v15A+5yogOikpGTTtVLWh8w8rKhX1TxwHPJ1Yn6qJhwIgQQmdVkdfBQyPAA+my/B4EESk7281iSwmTXnICMLhnIkEwsZlYaTycQRs1JRUQpnzEq1JCZ7hVHpYDIRMyudVgqzZqVqChO80rDrVMK061LBtOtSARN5tVHXkWhq2KzrTBZEV/W61BQmeFVNwfjQaARSMD+TkyAF1SQme7XRfUcj8SGo2mBOys+YFbeG9DQm3lML14AFJ6HeX3xdWVSg3q+nMfFeIxBR/TGKvk2R0iVEg45QPQsrZ6fBwJHoAKREQA9N6wxoSUx2l6HCcESNe0wVMpI6Cpgq6GlM/BrDmyYjQxNwj2xRpJky1CfbQkYGVkKfUQLo0ceGoEGpBXTi+ZlC3izByMBK2G2okAwPRCdMRxpUxKlsuWiqoKcx8WsN9sZBeGxKB4rZKalosqclMdnrjKq1Hg1VrfVhqGo9jYnvMcT7o8l+qPWD6aySzkH2o6cx8etryNVBEkJemoctX0tisjfULP9QMtwPBRX3mt73Xkxob41pi9B9ptB9mNC++oA1CjVvwwFT5gAmc2PN20Xi45C3k/JFyNuBFCa436hsMNEPjSmB6UJazJmUaElM9iajO6aGo/0j8ci4WXNbKZNNn8pLxaLZHetZWDk314bC8DEIvCLOQ+DVFCZ4QBcEU8dwHMRM15n1T2XV3p81e0NHqJ6FFXNLnfAJeJhJF8rwMKMlMdlbDezjw9Bg0VzMmGMFCNgyhKHiNqMbh+PRWDhl2kaLmM/OiiXJ7MZGBlbCa2qxkIm54XbTSG7HBA7Wes9wODkE956MqMzAvUdLY+K312gajcChBOhocCihJTHZsEFTajgCzQBKGSlv0qSmMMFDho2pEW14CCaqbU4pzIkzEFUdoXoWVk6/QXdqOJmYGDKdfkspoxTKMxmTbiMDK2Gg5jyORCJjkPM4I0lzkPNQk5hspDZlTZht1TRVqFtXIAQSmNSg0V7h/mQC6lxBMa0UipCz1NOY+JDROw6DmUAU7t2tpyWllIU6eHuoloMVMmxorYZRkLNXIyfI2WtJTDZqGCjkxRrNHtkcInTFO2ojczIKNXXgjJItQR5aS2KyIzWowEqOQlCBOZyFoKpJTHa0Zp+RoynIPqWzJcg+QQoTjBmVog4+MKmIaQiwlsRk40al4aNRyO+JZ7OQ31NTmGDCaNnIKAiE4LC8VcoBHwcF5e2hWg5WyFjN80cjowOQ589KuSnI86tJTPZOw54HE6YjaJouKKY9gwQmlayNF8lwfByIxqDxQhHzRSAzC40XtSysnHGDt1jiMBTaz4IZt8mbmsIEU7UuDHoDPP4Dw4fHfzWJyU4YxnzInFA3Ts6bxjw5j4kcro3+iRTsuIJKoQR5LRBnaWlM/EgtTgdhgLm0GRBzhfwMFKerSUz2qEF1LDwUj6YmBiC3OSvO5LOl8hTkNutZWDnH0BF2DzTrLpm6i3i/uAvcVgkWlOxMVluwVhUplkSlpC7sdcQL+do6brVcaZPOzoG2VkfrE8a9LcCTz4DZJLhb7mtct64sVgIFZUpSqiPrVAqyYNIfr7QU5tQBvaitiHedAp5XEHM5oVQ4pQY+S5UWreCpPdWlTFe80lWSZufU7i8UC2UFdM94pRPklOaFbH4qmwb+rFfFliznpIRRbhlkNKsZ1fLI3aASeWejtkBPQijvBv/X8HcLgnFdULVWQ5OaIvL14NfIOvkG8Csu79ULlG8Ev5fk/er/AKt8k3bxZvA/wCQfUAXB71vU3yPH3QHR62nwX88JtJ62omqls5IaE5FUbp9Sl2yyetDFTdmT3kBsNoIlYUpKg8mTSELDQIngDc1GLRiyw9LoH8trvWHpVkcSOyhN/qGIHmnRlpvssDT7xzLpDctFtfFR0EY6O1AB/6DS3kB1gWHPDknQP5IpFAmp0xpQ9LWazEOV9ulsriQpQqFcqi4Ch9hqum7DsevPyeT7NQCd8uvVUnTph7XMRSSz0g7csgImgnClErOnkDxrRsAmvxH86VqRbjXuJTaUxOxqpldDHTBs2qnD4K1mVl6djdoarZ0+DC4vswr6aItidvowuM3sarSPujhrpw+Dx5VXXp9N+qq1nUIMjvvUyiu0pb6CbqdTi3+dciuv0w5jWV0wFsftNGv1r9nsymu22YVGbf41yq9Ch9KX8e0UavevUGHlFepSxHk7bTr8azO3Gs2jrRPbKbTev0KvsyhEiBmRmLkTTPsywnQ5n+Y8A1U8ArlAzM1Ik4oIphSEW9nnoEWPeLaYj+VtADGEdiUUEKUhUEw1L7xcjVb2jmk7xJMtLIa2O+0d1mZ9smyLiKHxzqCIHBoGdSGPEbxC5nGSq6DPECuXCgKxTn3dbE+9ar30D5Gq/CipSvtuyD7dPLsSxMnXNpEdsmse5H2gBH6z0nlUa1vjRHV+moOxrKHmvwclwtl5oGw8y4ENeQ/UtB75IddlT5p+z+WCQNNV77LX23dZdurvXSHq5cPkzsedd/m4U4HsHXdhlUnjTpF80iVpDIPjfecbaRSKGNbB7kcp2grIAXPQgsGSPUH69nWS3n69E39n83om/dRN9m71kx9afi/wBiZt1N373LVh6J5vZNFGfxmBuzoMXekBVB17c0eV2WDeW5KUWcuQfYkgkMrSh+sbOAZFP+dDA53eJyF62adZb0Jx0NhBOew275oW0yV1MwvC4jaYRbUcnb+9HPl7syfcOnOf4srcW1AEdE5Q7jaa9xXmJEXb2I+QdyFMnl6UTt8+jvS91SN4ncAXuBK4iGKwIQaZ5UNNPSkWJfcrIYtOgJb8Aeoy75tRCuU594sgjogepFo5oro1VJg4RFw/qL0ei15jN6af94FS/i45jiNP4tiH8wpPjGQinfEzDOBv84Rfh/99DL7X/SuLS2+pYlDe7gPKT2hQXD+HJUL5BT+tGmgmz1VbsHyvz1YXl5beioP8Re98VVrThTxw+tCuF/b9LO9AcVDdljtvsoYmHg/5UUzeRTYDx9iY3Rf9kh+85Fh7dzPnqUMPsOGlEm7EVW+YdXT7m7F4gc31vNMSNefLs5KibsZ3Efeb95LjflJZeuB1I8fA65d9aKCTGcfJZLDBX7E4JQo7lrjfvIsW96Pl6Pzt58jfw55w68yd4Mrcr1pCZyonlrjfvI8a91uL0um7iSN9j3gErxOY40rguyxhNp0YNO437+Mc9/+aV0A2HtmhR9v5aIZ5wrv9Ueo01Dk+M3UE9h5qd6XHPuTomv1B96/7wEKNwxjs/1EUh8OmAzcm5xx0uX4EwMDvb6B64dS5nKaqR5bwnqL+pids8uOU2LAhwn1i+l6XyHRgT2DAvO5rIMZVj3kC8REaCLbg7n0WJ0bfw4v2ic+S+kTrXKGI7unSb/406eYO7T12YTJXSJ/iONi+n6NC8vPN/jcnLC0tEualv2WJBag79FF0XyBuUNZe5hXShYIylc2LJfWN11Xj/bf5KSZ/lTvtv8OR9m0m4YK++7h2uogj+fLLuGYM61OPc+T82zgy156FzPnvcuS8IzslgW5svMzui2eGlw+e4MhzYwBD5nqpi8zzBywej/5aCQrvy2vep/weR83kC3DiGZ3KB3kS79XCt+HqMHiSD/Fk+mocGqMr+X0LPLqRovBedr+1zMUM8j2cpp565jfWJDb2TvthtK0cR8tzp8W+Scr8jt8qSL0680PvpbG32B+sTIvJiYB1OkxqHzmJ3cbWGvIRrEASzfLdDAMETupHUFKJ7t2ZSLvNxiQHYvsklMFE/tA6PlDfukN1IvaOjaWMIkmCPjMzDsXjZswf5YnUsSuw28kfWfDSuUFXcmhz7bXsQM/XIe9JtA3tXrRFje6nJBW6ai3rfl65XAH4H/NUTH4f9wj8KRSfwwvB6HJjc4OxoOZiXJHbyTf7Hujlbv8Frolltj9ZZeblp7BB3QvP8jNWcfkTDNbZs2T8LBKe4j+95qjyyYoNzZ/kOhv92PnCmNfZb4+NGT2DkuLqoACUmq0UHS72QlmItyfsOcc94cfXdLvIP3DXgSmtIP8Ys++f8PCTRAv/xDnGpE/SbFphXZCnG/3T/x98+nWyRBt8FuXM9tASlCtPnOymOL12feKXyxZLq+jSPrmqJMg34r3Am4chNexzqE4kojltNOI6Z65sFgQTqr437WaOTf1nPGiRR4KuVvbi2G3c3yD8c1QfuyN6UMvdu0JB0JqIWT61mizJktUM5BnWHk/s8p9GtSRyiap3gIL4dkp7bxEEqFBhLlcuCnuuQxtWHsSE2RvwM6hqG3QU6vHyklKapywZkj6+RFhYlkcp2ta+Ysd7cfl5VBn6MY9oYyW92OJRys0+HrjYxG8nz3G/8BdrrCXkKjZieOFdfhjzNI8wexqat/nLNc+dT5pseH831/nKX52vDHKdoXwWZYl6Zh9K0hTFMznu9yGyKFNKgz7BSXpiSbShOc4LSsvlG/+aJ+/y57EO5oVo+YtB8oEsXhiWX+ThC0km+rlzgCpXrNiQ+hJX1/f584Uxnivef4OSYvvtBJSYByhIT9OWXfSixUmuWxH+ljv+BUr+hhaeW1e+wB03AR9DZ/kiio/UeOjEx+Z4xw3aQVnQ532cx5c2fcjUPo/FzVZe8KiTfGULuZNexWAK5Ifsf8cJGtmP9jKYRs/SIvG96S+5RkwD7PXdmqVFEnMvejXUTaek+TMgEhO03WLZ6axkedsXaV5vrDLsf/+yVwsYtqIkmSXjtvevMINyTZ3r8x9oBvmSR4OEoYoej7Enm+JXvZoi5exfVitkOLP+7702uOzGCl0fOU+2wn9gBuWaOtdnydOs8GWPVijjVuj6BHiyFX7NqxV2q98mJQYerIbIcPT71722ecWNIXayGeI/MoNyTd0GVkP8J4+GWMENsYvNEP/ZG4LKRv3rvALhPgNQt397+gYKxi4IgEEZmyzdvKy/6A7Iv/gDYu65smIhRZ4usbziE8vFNCykqNIlln/1iWUvDQsprnSJ5d98YknSsJDiQpdY/t0nlkUaFlJI6BLLN312oseIQEgRn0sg/+ETyNNEIKSwzyWQb/kE8iwRCClwcwnkP1EgNr4U9bnaZ5TtvjPIcPzMt31ior8YyX7w5H/5w0R/HZn9KJnv+KSJfuqC48zaEdN3/TYddQex47GIjpi+5w+T3QsVjl/1dAT1fX+gHLZbO56J6Ijrv/3hcrV/0XG27IjuB/7Q2W6Ss/GhLlH90Gdb1lc27XDR58COuP7Hp+Hb7DgSnaa7jqB+5NeR0h44O85+HSH92B+kDeqWHnFGXX1XxPmiFRB9EusI6H99cqR+uN6OI/o01hHST/xB2qpB0r4zbweMPmt1BPZTnyNOMS3a2zh9FuuI6Wc+O55SKDl8f5w+k3UCFVvX4A/VtklFTEtCTpyUcnbQNvqH1uATmt1XBA1Um/yjarSion+RHV29eTvlSebyvP8da7LgpPklFOQjXkDqIo96FqlsFwQUjfFpNvPbbOz6N/PUX55vJT+7oygvL2D3Mz/kjQUsGhGeaqLKvJ8C7glK/of5b3uNBS2gA57PU3Czq4h4sMIyH8IRa7FaGOXBNOKcLPozH9cZa7WgoK+/o8ZB21hx4WlJKWmkOX2KngF0mwW0i0rRpwwujEJ+kvYCKCX/uZV10O3WgYS+eIK23PMUnB16AafFXFlCqaDuVCZtMqp0TBfyJaEwh99f2SEIGErDd1/P0Tw6OFMjf6zV+jjn49Yc8oarZ1s5btOJrV9ZvbxvziDu6op1WmATDQ09m5j43gG7s9vgGUkgB0b8s+6X/BwhdFkHNLQCtN0+t7LvZcS6rfyQujLqSbsGE/GUkBhTtwDT3i+pbITKsbDNDnqjBbTj1ALl+CUe7tzGBbzgxd2ys7FpRdmQf0YObMlUNLXx9IabrZGLeDbr5u0Bmipf9z53ob0ldpEgWMEYw9wNliBjGV4Vi12wMsTIW9vIkxoKK3RdGYxgi3VI1L//7FtZ4lehfZiAfGGbdWhdjqbeuhLqy31roKG3WTS9SMpJaf17ClkpN8Vg3q9Q8r/FzR+skDFsXysUyQNrwGAutLDRBSbVLij4nvdhfyWXHdaCnV3ElVn5LrKxEGmVT1g1JJIovxYjYiVNb4eFIIdncihNP6K9seLNjEi3szf9xcugmXzWVZvard+zN9kly9FkNohtbPdePEr2/+pM7NLlaLG3ueuFb8Y18f816tirrGEt9cEkqsS6Rs8enWh/+CIYe3+6jK9O8qOUgfe9XGdel1ujTvpjTxR20HNTyOspIsu9Oh+y6Gj3GBVVctO5o+QVFiWdHqyzdix5uxcRdv2utDaizaNdVLdFyvyIuK5xqa/mWz6v8mprgEY7Xxh9fEY8X93vcSnLothVFsXwOtBNBoqUA418unaUN3Y3+4ry1d4QXSxOFgu5MvAj0DnjNFgMHrrHG6wddaL0iEU1FRoqhlik17o26dQ+rmandv7mSnLP9PMNB3br3WlR350xWN60pSi06mfXsdOzi50e8ll1ne2uzqrrxm7jfVZd7BqLiq76Hfq8ZUcyMhpORQ9HhLHEeFR76mJ7BMtyDa191hiQ/ogHfbS3PJ8dje1G8cjhRrM1EQBtRTWOm5Xwj40y1H6t29pb+hOxGN4e7B7/OmcEPfgVPWdPO88Z5x4GJPvbKfueGOaN11vw7Gmi4CH7wmXqPze4RYVcsXFfd9CoYzCqvRaQJ71RZ//FXHYO97mFR/guL5HDo3hHYGDvRgu8p2jwKk3hgQHyYSUmg8iH19m52+8eHOULwvIMV7ZucgsIuaLnSJjtUxEyOLabGRDOukfI4OoOWBB+ht6osYlRosV1mxZn+VY9u83d4h7eQPQw0ebexNXmbvXAV4LYQ0mAGEzsNreAkCt6zgMUEyMgZDCx1zAgfNA9Qv9n18QOMiB8h3uErg+zwRHebkH4JbrZRY6OkXdUmd1UPQFYzE9x7Kdht/iQK3rOBygMfpBrxz1kQTjW7H1oNee4nIfWfvfgaEPrM1zZGnALCLmi5zxNaU8CQga/F2FA+Jx7hAx+b9CCUKA3KnVoNS2O+9A65B4ebWj9ClebG/bAF2VoJQBiMLGoW0DIFT3nRYqJERAymNgdDAi/5h4hw9A6woDwFfcIGYbWUQvCPN3sqEOr2U35D60xt/iQK3pOcweZwWAHz44btyC8M0hBSJxCnw8L0Qm3DCBXPHIib+lwIytvx27jvio9ZtH3flxfI2SifHSCff30TmcIPfgVPWcnV/NPWpG00pBUV/Z9r3HXwO7H3uqhQJX3Yx6FncCUBedzNJzkHk985YSdvQm3qJArNv0ywtXqDlvgwRs50UNH7I5mZu+HR5xx9OBX9JwkT0bKu/8Pw68CQQ=='
+)
+MEMO = pickle.loads(zlib.decompress(base64.b64decode(MEMO)))
+Shift = 0
+Reduce = 1
+def Lark_StandAlone(**kwargs):
+  return Lark._load_from_dict(DATA, MEMO, **kwargs)
+GRAMMAR_HASH = "dfd9cee1e45431a150ef94d20f1fc1dcc4a1c0422f4be140a3289095f5cffea1"
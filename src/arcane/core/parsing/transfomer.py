@@ -1,9 +1,12 @@
+import math
+import operator
+from dataclasses import dataclass
+from fractions import Fraction
 from typing import Dict, List
 
+import sympy
 from lark import Transformer
-from manim.constants import PI
-from sympy import sympify
-from sympy.core.numbers import E, Float
+from sympy.core.numbers import Number
 
 from arcane.core.models.constructs import (Animatable, Animation, ArcaneArrow,
                                            ArcaneBrace, ArcaneCharge,
@@ -18,7 +21,7 @@ from arcane.core.models.constructs import (Animatable, Animation, ArcaneArrow,
                                            CircleDefinition,
                                            CoordinateAngleLength, Definition,
                                            Direction, ElectricFieldBlock,
-                                           Identifier, MathFunction,
+                                           ForLoop, Identifier, MathFunction,
                                            ObjectTransformExpression,
                                            ParametricMathFunction, PolarBlock,
                                            PolarMathFunction,
@@ -34,7 +37,6 @@ from arcane.core.models.constructs import (Animatable, Animation, ArcaneArrow,
                                            SweepCoordinates, SweepDot,
                                            SweepObjects, SweepTransform,
                                            ThreePoint, VLines)
-from arcane.graphics.utils.math import substitute_sympy_expressions
 from arcane.utils import gen_id
 
 
@@ -59,6 +61,85 @@ def safe_get(lst, index, default=None):
     return lst[index] if 0 <= index < len(lst) else default
 
 
+ARITHMETIC_OPERATORS = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+    "%": operator.mod,
+}
+
+TRIGONOMETRIC_FUNCTIONS = {
+    "sin": sympy.sin,
+    "cos": sympy.cos,
+    "tan": sympy.tan,
+    "atan": sympy.atan,
+}
+
+NUMERIC_TRIGONOMETRIC_FUNCTIONS = {
+    "sin": math.sin,
+    "cos": math.cos,
+    "tan": math.tan,
+    "atan": math.atan,
+}
+
+
+# literals are ints when they are integral, floats otherwise
+NUMBER_TYPES = (int, float)
+
+
+@dataclass
+class NegatedBase:
+    """An algebraic base with a leading minus, which binds looser than ``^`` (-x ^ 2 == -(x ^ 2))"""
+
+    value: sympy.Basic | float
+
+
+def fold_operators(items):
+    """Left folds an alternating list of operands and operator symbols"""
+    result = items[0]
+    for index in range(1, len(items), 2):
+        result = ARITHMETIC_OPERATORS[items[index]](result, items[index + 1])
+    return result
+
+
+def real_power(base, exponent):
+    """``base ^ exponent`` for plain floats, a negative base has a real value for
+    odd roots like sympy's real_root ((-8) ^ (1/3) == -2, (-8) ^ (2/3) == 4)"""
+    if base >= 0 or float(exponent).is_integer():
+        return base**exponent
+    fraction = Fraction(exponent).limit_denominator(1000)
+    if fraction.denominator % 2 == 0 or not math.isclose(fraction, exponent):
+        raise ValueError(f"{base:g} ^ {exponent:g} has no real value")
+    return (-1) ** fraction.numerator * (-base) ** exponent
+
+
+def fold_exponents(items):
+    """Right folds an alternating list of bases and ``^`` symbols, a negated
+    base applies its sign to everything it is raised to"""
+    result = None
+    for base in reversed(items[::2]):
+        negated = isinstance(base, NegatedBase)
+        value = base.value if negated else base
+        if result is None:
+            result = value
+        elif isinstance(value, NUMBER_TYPES) and isinstance(result, NUMBER_TYPES):
+            result = real_power(value, result)
+        else:
+            result = value**result
+        if negated:
+            result = -result
+    return result
+
+
+def to_sympy(value):
+    """Numbers are folded as plain ints and floats, integral literals stay exact
+    once they are part of an expression"""
+    if isinstance(value, int):
+        return sympy.Integer(value)
+    return sympy.Float(value) if isinstance(value, float) else value
+
+
 class ArcaneTransfomer(Transformer):
     @filter_none
     def program(self, items):
@@ -123,7 +204,7 @@ class ArcaneTransfomer(Transformer):
                 item.id = name.value
                 value = item
 
-            elif isinstance(item, Float):
+            elif isinstance(item, Number):
                 value = float(item)
             else:
                 pass
@@ -233,7 +314,7 @@ class ArcaneTransfomer(Transformer):
             if isinstance(item, Identifier):
                 variables.append(item.value)
             else:
-                expression = sympify(item)
+                expression = to_sympy(item)
         return RegularMathFunction(gen_id(), variables, expression)
 
     def parametric_math_function(self, items):
@@ -243,7 +324,7 @@ class ArcaneTransfomer(Transformer):
             if isinstance(item, Identifier):
                 variables.append(item.value)
             else:
-                expressions.append(sympify(item))
+                expressions.append(to_sympy(item))
         return ParametricMathFunction(gen_id(), variables, expressions)
 
     def polar_math_function(self, items):
@@ -253,7 +334,7 @@ class ArcaneTransfomer(Transformer):
             if isinstance(item, Identifier):
                 variables.append(item.value)
             else:
-                expression = sympify(item)
+                expression = to_sympy(item)
         return PolarMathFunction(gen_id(), variables, expression)
 
     def sweep(self, items):
@@ -272,34 +353,36 @@ class ArcaneTransfomer(Transformer):
         return SweepObjects(sweep_from=items[0], sweep_to=items[1])
 
     def numerical_expression(self, items):
-        return float(sympify(" ".join(items)))
+        return float(fold_operators(items))
 
     def numerical_factor(self, items):
-        return " ".join(items)
+        return fold_exponents(items)
 
     def numerical_term(self, items):
-        return " ".join(items)
+        return fold_operators(items)
 
     def numerical_base(self, items):
-        repr_string = ""
-        for item in items:
-            if isinstance(item, Identifier):
-                repr_string += f"{item.value}"
-            else:
-                repr_string += f"{item}"
-        return repr_string
+        value = items[0]
+        # constants are symbolic until they are part of a number
+        if isinstance(value, NegatedBase):
+            return NegatedBase(float(value.value))
+        if isinstance(value, sympy.Basic):
+            return float(value)
+        if value < 0:
+            return NegatedBase(-value)
+        return value
 
     def parametric_expression(self, items):
-        return list(items)
+        return [to_sympy(item) for item in items]
 
     def algebraic_expression(self, items):
-        return f'({" ".join(items)})'
+        return fold_operators(items)
 
     def algebraic_factor(self, items):
-        return " ".join(items)
+        return fold_exponents(items)
 
     def algebraic_term(self, items):
-        return " ".join(items)
+        return fold_operators(items)
 
     def arrow_declaration(self, items):
         style = next(
@@ -309,16 +392,38 @@ class ArcaneTransfomer(Transformer):
 
     @filter_none
     def algebraic_base(self, items):
-        repr_string = ""
+        negated = isinstance(items[0], str)  # leading SUB token
+        if negated:
+            items = items[1:]
+
+        values = []
         for item in items:
             if isinstance(item, Identifier):
-                repr_string += f"{item.value}"
+                values.append(sympy.Symbol(item.value))
+            elif isinstance(item, NegatedBase):
+                negated = not negated
+                values.append(item.value)
+            elif item < 0:
+                # signed numbers carry their own minus
+                negated = not negated
+                values.append(to_sympy(-item))
             else:
-                repr_string += f"{item}"
-        return repr_string
+                values.append(to_sympy(item))
+
+        value = math.prod(values)  # a coefficient followed by an identifier (2x)
+        return NegatedBase(value) if negated else value
+
+    @filter_none
+    def algebraic_group(self, items):
+        if len(items) > 1:  # leading SUB token
+            return NegatedBase(items[1])
+        return items[0]
 
     def trigonometric_function(self, items):
-        return f"{items[0]}({items[1]})"
+        function, argument = items
+        if isinstance(argument, NUMBER_TYPES):
+            return NUMERIC_TRIGONOMETRIC_FUNCTIONS[function](argument)
+        return TRIGONOMETRIC_FUNCTIONS[function](argument)
 
     def point_declaration(self, items):
         return ArcanePoint(id=gen_id(), position=items[0])
@@ -342,24 +447,20 @@ class ArcaneTransfomer(Transformer):
         return tuple(items)
 
     def expression(self, items):
-        if isinstance(
-            items[0], str
-        ):  # check if it's just a literal value(not function)
-            return sympify(items[0])
-        elif isinstance(items[0], List):
-            return list(map(sympify, items[0]))
-        else:
-            return items[0]
+        return to_sympy(items[0])
 
     def COMMENT(self, items):
         pass
 
     def NUMBER(self, n):
-        return float(n)
+        return int(n) if n.lstrip("+-").isdigit() else float(n)
 
     def IDENT(self, n):
         return Identifier(str(n))
 
+    def keyword_identifier(self, items):
+        return Identifier(str(items[0]))
+
     def MUL(self, _):
         return "*"
 
@@ -391,10 +492,10 @@ class ArcaneTransfomer(Transformer):
         return "atan"
 
     def PI(self, _):
-        return PI
+        return sympy.pi
 
     def E(self, _):
-        return float(E)
+        return sympy.E
 
     # process non terminal nodes
 
@@ -413,10 +514,12 @@ class ArcaneTransfomer(Transformer):
 
     @filter_none
     def constant(self, items):
-        return float("".join(map(str, items)))
+        if len(items) > 1:  # leading SUB token
+            return NegatedBase(items[1])
+        return items[0]
 
     def font_option_value(self, items):
-        return items[0]
+        return float(items[0])
 
     def write_value(self, items):
         return items[0]
@@ -572,19 +675,13 @@ class ArcaneTransfomer(Transformer):
 
     @filter_none
     def for_declaration(self, items):
-        variable = items[0]
-        start = items[1]
-        stop = items[2]
-        statements = items[3:]
-
-        evaluated_statements = []
-        for i in range(int(start), int(stop)):
-            evaluated_value = substitute_sympy_expressions(
-                statements, variable.value, i
-            )
-            evaluated_statements.append(evaluated_value)
-
-        return evaluated_statements
+        return ForLoop(
+            id=gen_id(),
+            name=items[0],
+            start=items[1],
+            stop=items[2],
+            body=list(flatten(items[3:])),
+        )
 
     def scale_declaration(self, items):
         return ArcaneScale(id=gen_id(), variable=items[0], factor=items[1])
@@ -1,7 +1,8 @@
 import copy
 from enum import Enum
 from pprint import pprint
-from typing import Any, Dict, List, Literal, Optional, Tuple, Union, cast
+from typing import (Any, Dict, Iterator, List, Literal, Optional, Tuple, Union,
+                    cast)
 
 import numpy as np
 import sympy
@@ -12,8 +13,9 @@ from arcane.core.models.constructs import (Animatable, Animation, ArcaneBrace,
                                            ArcaneMoveAlong, ArcaneRotate,
                                            ArcaneScale, ArcaneText, AxisBlock,
                                            Definition, DirectAnimatable,
-                                           ElectricFieldBlock, Identifier,
-                                           MathFunction, ObjectTransform,
+                                           ElectricFieldBlock, ForLoop,
+                                           Identifier, MathFunction,
+                                           ObjectTransform,
                                            ObjectTransformExpression,
                                            ParametricMathFunction, PolarBlock,
                                            PolarMathFunction, Program,
@@ -27,8 +29,10 @@ from arcane.core.runtime.types import (InterpreterError, InterpreterErrorCode,
 from arcane.graphics.builder import SceneBuilder
 from arcane.graphics.objects import PlotContainer
 from arcane.graphics.scene import construct_scene
-from arcane.graphics.utils.math import (avoid_zero, compute_function_range,
-                                        generate_math_function)
+from arcane.graphics.utils.math import (avoid_zero, compile_expression,
+                                        compute_function_range,
+                                        generate_math_function,
+                                        substitute_sympy_expressions)
 from arcane.utils import gen_id
 
 
@@ -45,6 +49,7 @@ class ArcaneInterpreter:
         self.store = Store()
         self.scene_builder = SceneBuilder()
         self.instruction_pointer = 0
+        self.loop_iterations: Optional[Iterator[Tuple[float, Animation]]] = None
 
         # Results tracking
         self.animation_blocks: List[PlotContainer] = []
@@ -172,6 +177,14 @@ class ArcaneInterpreter:
 
     def execute_next(self) -> Optional[InterpreterMessage]:
         """Execute the next statement in the program"""
+        # Finish the loop being iterated before moving on
+        if self.loop_iterations:
+            next_iteration = next(self.loop_iterations, None)
+            if next_iteration:
+                statement_index, animation = next_iteration
+                return self.process_animation(animation, statement_index)
+            self.loop_iterations = None
+
         # Check if there are any statements left
         if self.instruction_pointer >= len(self.program.statements):
             return None
@@ -194,6 +207,12 @@ class ArcaneInterpreter:
                 self.instruction_pointer += len(current_statement.statements)
                 return values
 
+            elif isinstance(current_statement, ForLoop):
+                self.loop_iterations = self._iterate_loop(
+                    current_statement, statement_index
+                )
+                return InterpreterMessage(InterpreterMessageType.SUCCESS)
+
             elif isinstance(current_statement, ArcaneClearObject):
                 # check if the object iss in the scene builder
                 if self.scene_builder.get(current_statement.variable.id):
@@ -257,11 +276,11 @@ class ArcaneInterpreter:
             instance.math_function = generate_math_function(instance)
 
             # For parametric functions, we need to compute x and y ranges separately
-            x_function = lambda t: instance.expressions[0].subs(
-                instance.variables[0], t
+            x_function = compile_expression(
+                instance.expressions[0], instance.variables[0]
             )
-            y_function = lambda t: instance.expressions[1].subs(
-                instance.variables[0], t
+            y_function = compile_expression(
+                instance.expressions[1], instance.variables[0]
             )
             instance.x_range = compute_function_range(x_function, instance.t_range)
             instance.y_range = compute_function_range(y_function, instance.t_range)
@@ -341,6 +360,21 @@ class ArcaneInterpreter:
             if statement.index == index:
                 return statement.value
 
+    def _iterate_loop(
+        self, loop: ForLoop, statement_index: int
+    ) -> Iterator[Tuple[float, Animation]]:
+        """Lazily yields the animations of every iteration with the loop variable substituted"""
+        values = range(int(loop.start), int(loop.stop))
+        # iterations share the loop's statement, so they are spread between it and the next one
+        step = 1 / max(len(values) * len(loop.body), 1)
+        position = 0
+        for value in values:
+            for animation in substitute_sympy_expressions(
+                loop.body, loop.name.value, value
+            ):
+                yield statement_index + position * step, animation
+                position += 1
+
     def _handle_block(
         self, block: AxisBlock | PolarBlock | ElectricFieldBlock, statement_index: int
     ) -> InterpreterMessage:
@@ -376,6 +410,7 @@ class ArcaneInterpreter:
 
     def _add_object(self, obj, statement_index: int, *, default_dep=None):
         """Helper to add an object with optional dependency logic"""
+        node_id = obj.id
         dep = []
         if isinstance(
             obj, (RegularMathFunction, ParametricMathFunction, PolarMathFunction)
@@ -435,11 +470,12 @@ class ArcaneInterpreter:
                     id=obj.id, value=ray_definition, statement_index=statement_index
                 )
 
-            obj.id = f"propagate-{obj.id}"
+            # obj.id names the rays, the propagation itself is a separate node
+            node_id = gen_id()
             dep = [*map(lambda x: x.id, obj.lenses)]
 
         self.scene_builder.add_object(
-            id=obj.id, value=obj, dependencies=dep, statement_index=statement_index
+            id=node_id, value=obj, dependencies=dep, statement_index=statement_index
         )
 
     def _add_plot_block_to_builder(
@@ -1,7 +1,8 @@
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Any
+from typing import Any, Callable, Sequence
 
+import numpy as np
 from manim import *
 
 
@@ -21,3 +22,20 @@ class AnimationItem:
     config: Dict = field(default_factory=dict)
     animate: bool = True
     defer: bool = False
+
+
+def sequential(
+    rate_func: Callable[[float], float], weights: Sequence[float]
+) -> Callable[[float], float]:
+    """Runs rate_func over equal parts of an animation one after the other, each part
+    covering its share of weights of the animation's progress"""
+    count = len(weights)
+    ends = np.cumsum(weights) / np.sum(weights)
+    starts = np.concatenate([[0], ends[:-1]])
+
+    def sequential_rate_func(t: float) -> float:
+        part = min(int(t * count), count - 1)
+        progress = rate_func(t * count - part)
+        return starts[part] + (ends[part] - starts[part]) * progress
+
+    return sequential_rate_func
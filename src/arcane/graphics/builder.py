@@ -1,6 +1,9 @@
+import logging
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass
 from pprint import pprint
-from typing import Any, List, Optional, OrderedDict, Tuple
+from typing import (Any, Callable, Dict, List, Optional, OrderedDict, Set,
+                    Tuple)
 
 from manim import *
 
@@ -25,8 +28,10 @@ from arcane.core.models.constructs import (AbsoluteCoordinatePosition,
                                            RelativePositionPlacement, SweepDot,
                                            SweepObjects, VLines)
 from arcane.core.runtime.types import InterpreterError, InterpreterErrorCode
-from arcane.graphics.animation import AnimationItem, AnimationPhase
-from arcane.graphics.custom_mobjects.rays import Ray
+from arcane.graphics.animation import (AnimationItem, AnimationPhase,
+                                       sequential)
+from arcane.graphics.cache import load_mobject
+from arcane.graphics.custom_mobjects.rays import Propagate, Ray
 from arcane.graphics.objects import PlotContainer
 from arcane.graphics.renderers.geometry import (render_arrow, render_circle,
                                                 render_elbow, render_line,
@@ -41,9 +46,13 @@ from arcane.graphics.renderers.misc import render_text
 from arcane.graphics.renderers.physics import (render_charge,
                                                render_electric_field,
                                                render_lens, render_rays)
-from arcane.graphics.utils.manim import get_relative_position
+from arcane.graphics.utils.manim import (get_relative_position,
+                                         position_mobject)
 from arcane.graphics.utils.math import (compute_point_on_circle,
                                         generate_math_function)
+from arcane.utils import group_while
+
+logger = logging.getLogger(__name__)
 
 SceneObject = (
     PlotContainer
@@ -74,6 +83,40 @@ SceneObject = (
     | ElectricFieldBlock
 )
 
+# renderers for node values whose mobject doesn't depend on any other node, so they can
+# be constructed in worker processes and positioned once they are back
+PRERENDERERS: Dict[type, Callable[..., Mobject]] = {
+    ArcaneText: render_text.__wrapped__,
+    ArcaneCharge: render_charge.__wrapped__,
+    ArcaneLens: render_lens.__wrapped__,
+}
+
+
+def prerender(value: SceneObject) -> Mobject:
+    """Constructs the mobject for a value in PRERENDERERS, without positioning it"""
+    return PRERENDERERS[type(value)](value)
+
+
+# static primitives consecutive statements can draw with a single mobject
+BATCHED_PRIMITIVES = (ArcaneLine, ArcanePoint, ArcaneSquare)
+
+
+def style_key(mobject: VMobject) -> Tuple[Any, ...]:
+    """Everything about the look of a mobject that a batch of them has to share"""
+    return (
+        mobject.get_stroke_width(),
+        mobject.get_stroke_width(background=True),
+        mobject.z_index,
+        *(
+            tuple(np.round(rgbas, 6).ravel())
+            for rgbas in (
+                mobject.get_stroke_rgbas(),
+                mobject.get_stroke_rgbas(background=True),
+                mobject.get_fill_rgbas(),
+            )
+        ),
+    )
+
 
 @dataclass
 class DependencyNode:
@@ -85,13 +128,20 @@ class DependencyNode:
     mobject: Optional[Any] = None
     relative_mobject: Optional[Mobject] = None
     is_background: bool = False
+    # id of the node whose mobject draws this one, see SceneBuilder.batch_primitives
+    batched_into: Optional[str] = None
 
 
 class SceneBuilder:
     def __init__(self):
         self.dependency_tree: OrderedDict[str, DependencyNode] = OrderedDict()
+        # reverse of DependencyNode.dependencies, kept in sync by add_object/add_dependency
+        self.dependants: Dict[str, Dict[str, None]] = {}
+        self.node_order: Dict[str, int] = {}  # position of each id in dependency_tree
         self.groups: List[Any] = []
         self.animations: List[AnimationItem] = []
+        # mobjects being constructed in worker processes during build
+        self.prerendered: Dict[str, Future] = {}
 
     def num_objects(self) -> int:
         return len(self.dependency_tree.keys())
@@ -104,6 +154,7 @@ class SceneBuilder:
         dependencies: List[str] = [],
         is_background: bool = False,
     ) -> str:
+        dependencies = list(dependencies)
 
         definition = getattr(value, "definition", None)
         position: Optional[Position] = None
@@ -115,12 +166,21 @@ class SceneBuilder:
         if isinstance(position, (RelativeDirectionPosition, RelativeAnglePosition)):
             dependencies.append(position.variable.value)
 
+        # a node added again replaces the previous one and its edges
+        previous = self.dependency_tree.get(id)
+        if previous:
+            for dependency in previous.dependencies:
+                self.dependants[dependency].pop(id, None)
+
         self.dependency_tree[id] = DependencyNode(
             value=value,
             statement_index=statement_index,
             dependencies=dependencies,
             is_background=is_background,
         )
+        self.node_order.setdefault(id, len(self.node_order))
+        for dependency in dependencies:
+            self.dependants.setdefault(dependency, {})[id] = None
         return id
 
     def resolve_position(self, id: str):
@@ -175,18 +235,18 @@ class SceneBuilder:
     def add_dependency(self, id: str, dependency: str) -> None:
         if id in self.dependency_tree:
             self.dependency_tree[id].dependencies.append(dependency)
+            self.dependants.setdefault(dependency, {})[id] = None
 
     def get(self, id: str) -> Optional[DependencyNode]:
         return self.dependency_tree.get(id)
 
+    def get_dependants(self, id: str) -> List[str]:
+        """Ids of the nodes depending on id, in the order they were added to the tree"""
+        return sorted(self.dependants.get(id, ()), key=self.node_order.__getitem__)
+
     def collect_plot_mobjects(self, current_id: str) -> List[Any]:
         collected: List[Any] = []
-        direct_dependants = OrderedDict(
-            (k, v)
-            for k, v in self.dependency_tree.items()
-            if current_id in v.dependencies
-        )
-        for child_id in direct_dependants:
+        for child_id in self.get_dependants(current_id):
             node = self.dependency_tree[child_id]
             if node.mobject is None and isinstance(node.value, (MathFunction, VLines)):
                 self.resolve_dependency(child_id)
@@ -198,6 +258,25 @@ class SceneBuilder:
             collected.extend(self.collect_plot_mobjects(child_id))
         return collected
 
+    def render(
+        self, id: str, render: Callable[..., Mobject], node: DependencyNode
+    ) -> Mobject:
+        """Renders a node, using the mobject constructed by a worker process if there is one"""
+        future = self.prerendered.pop(id, None)
+        if future is not None:
+            try:
+                mobject = future.result()
+            except Exception as error:
+                logger.warning(
+                    "Unable to construct %s in a worker process, constructing it "
+                    "again: %s",
+                    id,
+                    error,
+                )
+            else:
+                return position_mobject(node.value, mobject, node.relative_mobject)
+        return render(node.value, relative_mobject=node.relative_mobject)
+
     def resolve_dependency(self, id: str) -> None:
         node = self.get(id)
         self.resolve_position(id)
@@ -206,9 +285,7 @@ class SceneBuilder:
         if node.mobject:
             return
 
-        dependants = OrderedDict(
-            (k, v) for k, v in self.dependency_tree.items() if id in v.dependencies
-        )
+        dependants = self.get_dependants(id)
 
         if isinstance(node.value, MathFunction):
             container_id = node.dependencies[0]
@@ -235,7 +312,7 @@ class SceneBuilder:
             mobject = render_point(node.value, relative_mobject=node.relative_mobject)
             node.mobject = mobject
             self.dependency_tree[id].mobject = mobject
-            for dependant_id in dependants.keys():
+            for dependant_id in dependants:
                 try:
                     # TODO:(figure out better way to do this)
                     self.resolve_dependency(dependant_id)
@@ -266,12 +343,10 @@ class SceneBuilder:
             node.mobject = True
 
         elif isinstance(node.value, PropagateRays):
-            rays = self.dependency_tree[node.value.id.replace("propagate-", "")]
+            rays = self.dependency_tree[node.value.id]
             assert isinstance(rays.value, ArcaneRays)
             rays_mobject = render_rays(rays.value)
-            self.dependency_tree[node.value.id.replace("propagate-", "")].mobject = (
-                rays_mobject
-            )
+            rays.mobject = rays_mobject
 
             rays = list(rays_mobject)
 
@@ -279,16 +354,15 @@ class SceneBuilder:
                 map(lambda x: self.dependency_tree[x.value].mobject, node.value.lenses)
             )
 
-            for ray in rays:
-                assert isinstance(ray, Ray)
-                if not node.is_background:
-                    self.animations.append(
-                        AnimationItem(
-                            node.statement_index,
-                            animation=ray.animate.propagate(*lenses),
-                            phase=AnimationPhase.PRIMARY,
-                        )
+            assert all(isinstance(ray, Ray) for ray in rays)
+            if rays and not node.is_background:
+                self.animations.append(
+                    AnimationItem(
+                        node.statement_index,
+                        animation=Propagate(rays_mobject, *lenses),
+                        phase=AnimationPhase.PRIMARY,
                     )
+                )
             node.mobject = True
 
         elif isinstance(node.value, ArcaneLine):
@@ -332,10 +406,12 @@ class SceneBuilder:
             ].mobject  # type:ignore
             assert mobject_to_label is not None
             brace = Brace(mobject_to_label)
+            # same as brace.get_tex/get_text, through the cache
             if node.value.is_latex:
-                text = brace.get_tex(node.value.text)
+                text = load_mobject(MathTex, node.value.text)
             else:
-                text = brace.get_text(node.value.text)
+                text = load_mobject(Tex, node.value.text)
+            brace.put_at_tip(text)
             self.animations.extend(
                 [
                     AnimationItem(
@@ -510,9 +586,7 @@ class SceneBuilder:
                 node.mobject = True
 
         elif isinstance(node.value, ArcaneText):
-            text_mobject = render_text(
-                node.value, relative_mobject=node.relative_mobject
-            )
+            text_mobject = self.render(id, render_text, node)
 
             if not node.is_background:
                 self.animations.append(
@@ -611,7 +685,7 @@ class SceneBuilder:
             )
 
         elif isinstance(node.value, PlotContainer):
-            for dependant_id in dependants.keys():
+            for dependant_id in dependants:
                 dependant = self.dependency_tree[dependant_id]
                 if isinstance(dependant.value, MathFunction):
                     node.value.add(dependant.value)
@@ -620,7 +694,7 @@ class SceneBuilder:
 
             descendants: List[Any] = []
             # resolve children
-            for dependant_id in dependants.keys():
+            for dependant_id in dependants:
                 self.resolve_dependency(dependant_id)
             descendants.extend(self.collect_plot_mobjects(id))
 
@@ -705,7 +779,7 @@ class SceneBuilder:
             node.mobject = field_mobject
 
         elif isinstance(node.value, ArcaneCharge):
-            mobject = render_charge(node.value, relative_mobject=node.relative_mobject)
+            mobject = self.render(id, render_charge, node)
             node.mobject = mobject
             if not node.is_background:
                 self.animations.append(
@@ -718,7 +792,7 @@ class SceneBuilder:
                 )
 
         elif isinstance(node.value, ArcaneLens):
-            mobject = render_lens(node.value, relative_mobject=node.relative_mobject)
+            mobject = self.render(id, render_lens, node)
             node.mobject = mobject
             if not node.is_background:
                 self.animations.append(
@@ -806,63 +880,204 @@ class SceneBuilder:
                         )
                     )
 
-    def build(self) -> VGroup:
-        def get_pending_animations() -> OrderedDict[str, DependencyNode]:
-            pending = OrderedDict()
-
-            # Check items without dependencies first
-            for id, node in self.dependency_tree.items():
-                if not node.dependencies and node.mobject is None:
-                    pending[id] = node
-
-            # Check items with dependencies
-            for id, node in self.dependency_tree.items():
-                if node.mobject is None and node.dependencies:
-                    # Check if all dependencies are resolved
-                    all_deps_resolved = all(
-                        self.dependency_tree[dep].mobject is not None
-                        for dep in node.dependencies
-                    )
-                    if all_deps_resolved:
-                        pending[id] = node
-
-            return pending
-
-        previous_pending = None
-        iteration_count = 0
+    def resolution_order(self) -> List[str]:
+        """Orders the nodes so each comes after its dependencies"""
+        return [id for level in self.resolution_levels() for id in level]
+
+    def resolution_levels(self) -> List[List[str]]:
+        """Groups the nodes in topological levels (Kahn's algorithm), nodes without
+        dependencies first and every other node one level after its last dependency,
+        each level in the order the nodes were added"""
+        in_degree: Dict[str, int] = {}
+        for id, node in self.dependency_tree.items():
+            dependencies = set(node.dependencies)
+            for dependency in dependencies:
+                if dependency not in self.dependency_tree:
+                    raise ValueError(f"Dependency with ID {dependency} not found")
+            in_degree[id] = len(dependencies)
+
+        levels: List[List[str]] = []
+        resolved = 0
+        level = [id for id, degree in in_degree.items() if degree == 0]
+        while level:
+            levels.append(level)
+            resolved += len(level)
+            next_level = []
+            for id in level:
+                for dependant_id in self.dependants.get(id, ()):
+                    in_degree[dependant_id] -= 1
+                    if in_degree[dependant_id] == 0:
+                        next_level.append(dependant_id)
+            level = sorted(next_level, key=self.node_order.__getitem__)
+
+        if resolved != len(self.dependency_tree):
+            remaining = [id for id, degree in in_degree.items() if degree > 0]
+            cycle = self._find_cycle(remaining)
+            raise ValueError(
+                f"Circular dependency between objects: {' -> '.join(map(str, cycle))}"
+            )
 
-        while True:
-            pending = get_pending_animations()
+        return levels
+
+    def resolve_levels(self, levels: List[List[str]]) -> None:
+        for level in levels:
+            for id in level:
+                node = self.dependency_tree[id]
+                # already resolved by its container or one of its dependencies
+                if node.mobject is not None:
+                    continue
+                if all(
+                    self.dependency_tree[dependency].mobject is not None
+                    for dependency in node.dependencies
+                ):
+                    self.resolve_dependency(id)
+
+    def _find_cycle(self, remaining: List[str]) -> List[str]:
+        """Follows dependencies between the nodes Kahn's algorithm couldn't order until one repeats"""
+        remaining_ids = set(remaining)
+        path: Dict[str, None] = {}
+        id = remaining[0]
+        while id not in path:
+            path[id] = None
+            # every remaining node still waits on at least one remaining dependency
+            id = next(
+                dependency
+                for dependency in self.dependency_tree[id].dependencies
+                if dependency in remaining_ids
+            )
+        visited = list(path)
+        return visited[visited.index(id) :] + [id]
+
+    def batchable_nodes(self) -> Dict[int, str]:
+        """Ids of the nodes of static primitives nothing else refers to, by the id of
+        their mobject"""
+        return {
+            id(node.mobject): node_id
+            for node_id, node in self.dependency_tree.items()
+            if isinstance(node.value, BATCHED_PRIMITIVES)
+            and not isinstance(getattr(node.value, "definition", None), SweepObjects)
+            and not node.is_background
+            and not node.dependencies
+            and not self.dependants.get(node_id)
+            and isinstance(node.mobject, VMobject)
+            and not node.mobject.submobjects
+        }
+
+    def batch_primitives(self) -> None:
+        """Draws runs of consecutive statements that each only create a static primitive
+        of the same style with one multi-path VMobject, created one path after another"""
+        nodes = self.batchable_nodes()
+        batched: Set[int] = set()
+        batches: List[AnimationItem] = []
+
+        def batch_key(group: List[AnimationItem]) -> Optional[Tuple[Any, ...]]:
+            if len(group) != 1:
+                return None
+            item = group[0]
+            animation = item.animation
+            if (
+                item.defer
+                or item.config
+                or type(animation) is not Create
+                or id(animation.mobject) not in nodes
+            ):
+                return None
+            return style_key(animation.mobject)
+
+        for phase in AnimationPhase:
+            groups = group_while(
+                sorted(
+                    (
+                        item
+                        for item in self.animations
+                        if item.phase == phase and item.animate
+                    ),
+                    key=lambda item: item.index,
+                ),
+                lambda a, b: a.index == b.index,
+            )
+            runs = group_while(
+                [(batch_key(group), group[0]) for group in groups],
+                lambda a, b: a[0] is not None and a[0] == b[0],
+            )
+            for run in runs:
+                if len(run) < 2 or run[0][0] is None:
+                    continue
+                items = [item for _, item in run]
+                primitives = [item.animation.mobject for item in items]
+                batch = VMobject()
+                batch.set_points(np.concatenate([m.points for m in primitives]))
+                batch.match_style(primitives[0])
+                batch.set_z_index(primitives[0].z_index)  # shared through style_key
+                # the first node holds the batch, the others keep their own mobject
+                # but are drawn by it
+                first_id = nodes[id(primitives[0])]
+                for primitive in primitives[1:]:
+                    self.dependency_tree[nodes[id(primitive)]].batched_into = first_id
+                self.dependency_tree[first_id].mobject = batch
+
+                batched.update(id(item) for item in items)
+                batches.append(
+                    AnimationItem(
+                        items[0].index,
+                        # as long as the separate Creates, each path drawn in its turn.
+                        # Create draws every curve of the batch at the same speed, so
+                        # each turn covers the curves of its path
+                        animation=Create(
+                            batch,
+                            run_time=len(items),
+                            rate_func=sequential(
+                                smooth, [m.get_num_curves() for m in primitives]
+                            ),
+                        ),
+                        phase=phase,
+                    )
+                )
 
-            # No more pending animations, we're done
-            if not pending:
-                break
+        self.animations = [
+            item for item in self.animations if id(item) not in batched
+        ] + batches
 
-            # Check if we're stuck in a loop
-            if pending == previous_pending:
-                iteration_count += 1
-                if iteration_count >= 2:
-                    unresolved = [
-                        id
-                        for id, node in self.dependency_tree.items()
-                        if node.mobject is None
-                    ]
-                    raise ValueError(
-                        f"Unable to resolve dependencies after multiple iterations. Unresolved nodes: {unresolved}"
-                    )
-            else:
-                iteration_count = 0
+    def build(self, workers: Optional[int] = None) -> VGroup:
+        """Resolves every node, with more than one worker the mobjects of the values in
+        PRERENDERERS are constructed in a process pool while the rest is resolved"""
+        if workers is None:
+            workers = arcane.graphics.config.build_workers
+        levels = self.resolution_levels()
 
-            # Process pending animations
-            for id in pending.keys():
-                self.resolve_dependency(id)
+        if workers <= 1:
+            self.resolve_levels(levels)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                # submitted level by level so the first nodes resolved are the first built
+                for level in levels:
+                    for node_id in level:
+                        node = self.dependency_tree[node_id]
+                        if node.mobject is None and type(node.value) in PRERENDERERS:
+                            self.prerendered[node_id] = executor.submit(
+                                prerender, node.value
+                            )
+                self.resolve_levels(levels)
+                # left over by nodes resolved through their container
+                for future in self.prerendered.values():
+                    future.cancel()
+                self.prerendered.clear()
+
+        unresolved = [
+            id for id, node in self.dependency_tree.items() if node.mobject is None
+        ]
+        if unresolved:
+            raise ValueError(
+                f"Unable to resolve dependencies. Unresolved nodes: {unresolved}"
+            )
 
-            previous_pending = pending
+        if arcane.graphics.config.batch_primitives:
+            self.batch_primitives()
 
         all_mobject = [
             node.mobject
             for node in self.dependency_tree.values()
-            if isinstance(node.mobject, Mobject)
+            if isinstance(node.mobject, Mobject) and node.batched_into is None
         ]
 
         container_mobject = VGroup(*all_mobject)
@@ -0,0 +1,107 @@
+import inspect
+import logging
+import os
+import pickle
+import zlib
+from functools import cache
+from hashlib import sha256
+from typing import Any, Type
+
+from manim import Mobject, Text, config
+
+from arcane.utils import (evict_cache, get_cache_dir, get_package_version,
+                          get_source_hash)
+
+logger = logging.getLogger(__name__)
+
+# total size of the cached mobjects, least recently used ones are evicted past it
+MAX_CACHE_SIZE = 256 * 1024 * 1024
+
+manim_version = get_package_version("manim")
+
+
+@cache
+def get_code_hash(module: str) -> str:
+    """Hashes this module and the one defining a mobject class, whose code builds (and
+    pickles) the cached mobjects, manim's own code is covered by its version"""
+    if module.partition(".")[0] == "manim":
+        return get_source_hash(__name__)
+    return get_source_hash(__name__, module)
+
+
+@cache
+def get_installed_fonts() -> str:
+    """Hashes the installed fonts, a font name (or the default one) can resolve to a
+    different font once they change"""
+    return sha256("\0".join(sorted(Text.font_list())).encode()).hexdigest()
+
+
+def get_font_settings(mobject_class: Type[Mobject]) -> str:
+    """The font defaults of a Text like mobject and the fonts they resolve against,
+    empty for other mobjects"""
+    parameters = inspect.signature(mobject_class.__init__).parameters
+    if "font" not in parameters:
+        return ""
+    defaults = {
+        name: parameters[name].default
+        for name in ("font", "weight", "slant")
+        if name in parameters
+    }
+    return repr(defaults) + get_installed_fonts()
+
+
+def mobject_cache_key(mobject_class: Type[Mobject], *args: Any, **kwargs: Any) -> str:
+    """Hashes the arguments of a mobject together with everything that changes its paths"""
+    key = "\0".join(
+        (
+            mobject_class.__qualname__,
+            repr(args),
+            repr(sorted(kwargs.items())),
+            config.tex_template.body,
+            get_font_settings(mobject_class),
+            manim_version,
+            get_code_hash(mobject_class.__module__),
+            str(pickle.HIGHEST_PROTOCOL),
+        )
+    )
+    return sha256(key.encode()).hexdigest()
+
+
+def load_mobject(
+    mobject_class: Type[Mobject],
+    *args: Any,
+    max_size: int = MAX_CACHE_SIZE,
+    **kwargs: Any,
+) -> Mobject:
+    """Constructs a Text/Tex like mobject, reusing the paths shaped or compiled by previous
+    runs (or other worker processes) for the same arguments"""
+    cache_dir = get_cache_dir("mobjects")
+    cache_file = (
+        cache_dir / f"{mobject_cache_key(mobject_class, *args, **kwargs)}.mobject"
+    )
+
+    try:
+        mobject = pickle.loads(zlib.decompress(cache_file.read_bytes()))
+        os.utime(cache_file)  # mark as recently used
+        return mobject
+    except FileNotFoundError:
+        pass
+    except Exception:
+        # unreadable or written by incompatible code, construct it again
+        cache_file.unlink(missing_ok=True)
+
+    mobject = mobject_class(*args, **kwargs)
+
+    # write to a temporary file first so concurrent readers never see a partial entry
+    temp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        temp_file.write_bytes(
+            zlib.compress(pickle.dumps(mobject, protocol=pickle.HIGHEST_PROTOCOL))
+        )
+        os.replace(temp_file, cache_file)
+        evict_cache(cache_dir, "*.mobject", max_size)
+    except (OSError, pickle.PicklingError, TypeError, AttributeError) as e:
+        temp_file.unlink(missing_ok=True)
+        logger.warning("Unable to cache %s: %s", mobject_class.__name__, e)
+
+    return mobject
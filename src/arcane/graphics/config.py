@@ -11,3 +11,19 @@ config.media_dir = os.path.join(root_dir, "media")
 config.preview = True
 # config.verbosity = "DEBUG"
 # config.log_to_file = True
+
+# worker processes used by SceneBuilder.build to construct independent mobjects,
+# 1 builds everything in the main process
+build_workers = int(os.environ.get("ARCANE_BUILD_WORKERS", 1))
+
+# scale charges are shown at on screen, their glow uses fewer layers the smaller it is,
+# every layer is drawn if it isn't set
+charge_level_of_detail = (
+    float(os.environ["ARCANE_CHARGE_LOD"])
+    if "ARCANE_CHARGE_LOD" in os.environ
+    else None
+)
+
+# consecutive statements creating static lines, points or squares of the same style are
+# drawn by a single mobject, 0 keeps one mobject per statement
+batch_primitives = os.environ.get("ARCANE_BATCH_PRIMITIVES", "1") != "0"
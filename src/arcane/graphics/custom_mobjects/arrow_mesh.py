@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import numpy as np
+from manim.constants import DEFAULT_ARROW_TIP_LENGTH
+from manim.mobject.types.vectorized_mobject import VGroup, VMobject
+from manim.utils.color import rgb_to_color
+
+__all__ = [
+    "ArrowMesh",
+]
+
+# stroke widths are in hundredths of a unit (Camera.cairo_line_width_multiple)
+STROKE_WIDTH_TO_UNITS = 0.01
+
+
+def _polygon_curves(corners: np.ndarray) -> np.ndarray:
+    """The bezier points (n x 4k x 3) of n closed polygons with k corners each"""
+    start = corners
+    end = np.roll(corners, -1, axis=1)
+    curves = np.stack(
+        [start, start + (end - start) / 3, start + 2 * (end - start) / 3, end],
+        axis=2,
+    )
+    return curves.reshape(len(corners), -1, 3)
+
+
+class ArrowMesh(VGroup):
+    def __init__(
+        self,
+        starts: np.ndarray | None = None,
+        vectors: np.ndarray | None = None,
+        rgbs: np.ndarray | None = None,
+        opacities: np.ndarray | float = 1.0,
+        tip_length: float = DEFAULT_ARROW_TIP_LENGTH,
+        stroke_width: float = 6,
+        max_tip_length_to_length_ratio: float = 0.25,
+        max_stroke_width_to_length_ratio: float = 5,
+        color_levels: int = 32,
+        **kwargs,
+    ) -> None:
+        """Many 2D arrows stored as contiguous point arrays.
+
+        Each arrow is a filled shaft and tip, sized like an :class:`~.Arrow`
+        with the same parameters. Arrows that share a colour and opacity are
+        drawn by a single :class:`~.VMobject`, so the number of mobjects only
+        depends on the number of distinct colours.
+
+        Parameters
+        ----------
+        starts
+            The start of each arrow (n x 3).
+        vectors
+            The vector from the start to the tip of each arrow (n x 3).
+        rgbs
+            The colour of each arrow (n x 3, between 0 and 1).
+        opacities
+            The opacity of each arrow, or of all of them.
+        color_levels
+            The number of levels each colour channel and the opacity are
+            rounded to before grouping the arrows.
+        kwargs
+            Additional parameters to be passed to ``VGroup``.
+        """
+        super().__init__(**kwargs)
+        self.tip_length = tip_length
+        self.arrow_stroke_width = stroke_width
+        self.max_tip_length_to_length_ratio = max_tip_length_to_length_ratio
+        self.max_stroke_width_to_length_ratio = max_stroke_width_to_length_ratio
+        self.color_levels = color_levels
+        if starts is not None:
+            self.set_arrows(starts, vectors, rgbs, opacities)
+
+    def get_arrow_points(self, starts: np.ndarray, vectors: np.ndarray) -> np.ndarray:
+        """The bezier points of the shaft and tip of every arrow (n x 28 x 3)"""
+        lengths = np.linalg.norm(vectors, axis=1)
+        directions = np.divide(
+            vectors,
+            lengths[:, np.newaxis],
+            out=np.zeros_like(vectors),
+            where=lengths[:, np.newaxis] > 0,
+        )
+        normals = np.stack(
+            [-directions[:, 1], directions[:, 0], np.zeros(len(directions))], axis=1
+        )
+
+        tip_lengths = np.minimum(
+            self.tip_length, self.max_tip_length_to_length_ratio * lengths
+        )
+        widths = (
+            np.minimum(
+                self.arrow_stroke_width,
+                self.max_stroke_width_to_length_ratio * lengths,
+            )
+            * STROKE_WIDTH_TO_UNITS
+        )
+        ends = starts + vectors
+        bases = ends - directions * tip_lengths[:, np.newaxis]
+
+        shaft_offsets = normals * (widths / 2)[:, np.newaxis]
+        shafts = np.stack(
+            [
+                starts - shaft_offsets,
+                bases - shaft_offsets,
+                bases + shaft_offsets,
+                starts + shaft_offsets,
+            ],
+            axis=1,
+        )
+        # the tip is as wide as it is long
+        tip_offsets = normals * (tip_lengths / 2)[:, np.newaxis]
+        tips = np.stack([bases - tip_offsets, ends, bases + tip_offsets], axis=1)
+        return np.concatenate([_polygon_curves(shafts), _polygon_curves(tips)], axis=1)
+
+    def set_arrows(
+        self,
+        starts: np.ndarray,
+        vectors: np.ndarray,
+        rgbs: np.ndarray,
+        opacities: np.ndarray | float = 1.0,
+    ) -> ArrowMesh:
+        """Replaces the arrows, reusing the existing submobjects"""
+        starts = np.asarray(starts, dtype=float)
+        vectors = np.asarray(vectors, dtype=float)
+        points = self.get_arrow_points(starts, vectors)
+
+        rgbas = np.column_stack(
+            [
+                np.asarray(rgbs, dtype=float).reshape(-1, 3),
+                np.broadcast_to(np.asarray(opacities, dtype=float), len(starts)),
+            ]
+        )
+        # arrows of close enough colours share the colour of the first of them
+        _, first_indices, style_indices = np.unique(
+            np.round(rgbas * (self.color_levels - 1)).astype(int),
+            axis=0,
+            return_index=True,
+            return_inverse=True,
+        )
+        styles = rgbas[first_indices]
+        style_indices = style_indices.reshape(-1)
+
+        if len(self.submobjects) > len(styles):
+            self.remove(*self.submobjects[len(styles) :])
+        self.add(*(VMobject() for _ in range(len(styles) - len(self.submobjects))))
+
+        for index, (mesh, style) in enumerate(zip(self.submobjects, styles)):
+            mesh.set_points(points[style_indices == index].reshape(-1, 3))
+            mesh.set_fill(rgb_to_color(style[:3]), opacity=style[3])
+            mesh.set_stroke(width=0)
+        return self
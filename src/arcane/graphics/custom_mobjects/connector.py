@@ -0,0 +1,83 @@
+"""Lines and arrows between the centers of two mobjects."""
+
+from __future__ import annotations
+
+from typing import List, Optional, Tuple
+
+import numpy as np
+from manim.mobject.geometry.line import Arrow, Line
+from manim.mobject.mobject import Mobject
+
+__all__ = [
+    "Connector",
+    "ConnectorLine",
+    "ConnectorArrow",
+]
+
+
+class Connector:
+    def __init__(self, from_mobject: Mobject, to_mobject: Mobject, **kwargs) -> None:
+        """Keeps a line (or arrow) between the centers of two mobjects.
+
+        Unlike a line redrawn with ``always_redraw``, the same mobject is kept
+        and its points are only moved when one of the centers moves.
+
+        Parameters
+        ----------
+        from_mobject
+            The mobject the line starts at.
+        to_mobject
+            The mobject the line ends at.
+        kwargs
+            Additional parameters to be passed to the line.
+        """
+        ends = np.array([from_mobject.get_center(), to_mobject.get_center()])
+        super().__init__(*ends, **kwargs)
+        self.connected_ends = ends
+        # the tips taken off while the line is collapsed, and whether each one is
+        # at the start
+        self.collapsed_tips: Optional[List[Tuple[Mobject, bool]]] = None
+
+        # the mobjects are only referenced by the updater, so copies of the line
+        # (made by animations) don't deep copy them
+        def follow(connector: Connector) -> None:
+            connector.connect(from_mobject.get_center(), to_mobject.get_center())
+
+        self.add_updater(follow)
+
+    def connect(self, start: np.ndarray, end: np.ndarray) -> Connector:
+        """Moves the ends of the line to the centers if they aren't there already,
+        collapsing it to the point halfway between them once they're within twice
+        the buff of each other"""
+        ends = np.array([start, end])
+        if np.array_equal(ends, self.connected_ends):
+            return self
+        self.connected_ends = ends
+
+        vector = end - start
+        length = np.linalg.norm(vector)
+        if length <= 2 * self.buff:  # nothing left to draw between them
+            if self.collapsed_tips is None:
+                self.collapsed_tips = [
+                    (tip, tip is getattr(self, "start_tip", None))
+                    for tip in self.pop_tips()
+                ]
+            self.set_points(np.tile((start + end) / 2, (len(self.points), 1)))
+            return self
+
+        buff = vector / length * self.buff
+        # a collapsed line is generated again from the new ends
+        self.put_start_and_end_on(start + buff, end - buff)
+        if self.collapsed_tips is not None:
+            for tip, at_start in self.collapsed_tips:
+                self.add_tip(tip=tip, at_start=at_start)
+            self.collapsed_tips = None
+        return self
+
+
+class ConnectorLine(Connector, Line):
+    pass
+
+
+class ConnectorArrow(Connector, Arrow):
+    pass
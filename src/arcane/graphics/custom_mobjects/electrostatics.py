@@ -1,21 +1,141 @@
 from __future__ import annotations
 
-from typing import Iterable
+from typing import Callable, Dict, Sequence, Tuple
 
 import numpy as np
-from manim import normalize
+from manim import config
 from manim.constants import ORIGIN, TAU
 from manim.mobject.geometry.arc import Arc, Dot
 from manim.mobject.geometry.polygram import Rectangle
 from manim.mobject.types.vectorized_mobject import VGroup
-from manim.mobject.vector_field import ArrowVectorField
-from manim.utils.color import BLUE, RED, RED_A, RED_D, color_gradient
+from manim.mobject.vector_field import DEFAULT_SCALAR_FIELD_COLORS
+from manim.utils.color import (BLUE, RED, RED_A, RED_D, ManimColor,
+                               ParsableManimColor, color_gradient,
+                               color_to_rgb)
+from manim.utils.simple_functions import sigmoid
+
+from arcane.graphics.custom_mobjects.arrow_mesh import ArrowMesh
 
 __all__ = [
     "Charge",
     "ElectricField",
 ]
 
+MAX_GLOW_LAYERS = 80
+MIN_GLOW_LAYERS = 8
+# on-screen width of a glow layer (in pixels) that level of detail aims for
+GLOW_LAYER_PIXELS = 4
+
+# colors and radius of the glow of positive (True) and negative charges
+_GLOW_STYLES = {True: ([RED_D, RED_A], 4), False: (["#3399FF", "#66B2FF"], 2)}
+
+# the glow only depends on the sign of the charge and its number of layers, so each
+# one is built once around the origin and copied for every charge
+_glow_prototypes: Dict[Tuple[bool, int], VGroup] = {}
+
+
+def glow_layer_count(glow_radius: float, scale: float = 1) -> int:
+    """The number of glow layers for a glow of glow_radius drawn at scale on screen."""
+    pixels = glow_radius * scale * config.pixel_width / config.frame_width
+    layer_num = round(pixels / GLOW_LAYER_PIXELS)
+    return int(np.clip(layer_num, MIN_GLOW_LAYERS, MAX_GLOW_LAYERS))
+
+
+def _get_glow(positive: bool, layer_num: int) -> VGroup:
+    key = (positive, layer_num)
+    if key not in _glow_prototypes:
+        layer_colors, layer_radius = _GLOW_STYLES[positive]
+        color_list = color_gradient(layer_colors, layer_num)
+        opacity_func = lambda t: 1500 * (1 - abs(t - 0.009) ** 0.0001)
+        rate_func = lambda t: t**2
+
+        _glow_prototypes[key] = VGroup(
+            *(
+                Arc(
+                    radius=layer_radius * rate_func((0.5 + i) / layer_num),
+                    angle=TAU,
+                    color=color_list[i],  # type:ignore
+                    stroke_width=101
+                    * (rate_func((i + 1) / layer_num) - rate_func(i / layer_num))
+                    * layer_radius,
+                    stroke_opacity=opacity_func(rate_func(i / layer_num)),
+                )
+                for i in range(layer_num)
+            )
+        )
+    return _glow_prototypes[key].copy()
+
+
+# cells closer to a charge than this many times their size are split in four
+REFINE_DISTANCE = 2
+# the cell size from which arrows are drawn at full length (the spacing of an
+# ArrowVectorField), smaller cells get proportionally shorter arrows
+FULL_ARROW_CELL_SIZE = 0.5
+
+
+def adaptive_grid(
+    positions: np.ndarray,
+    max_arrows: int,
+    frame_size: Tuple[float, float],
+    padding: float = 2,
+    min_step: float = 0.25,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Arrow positions (n x 3) covering the charges, and the size of the (square) cell
+    each one stands for.
+
+    The area spanned by the charges is padded, without going past the frame
+    (centered on the origin) unless the charges do. It's covered by a uniform
+    grid using a quarter of max_arrows, then the cells closest to a charge
+    (relative to their size) are split in four, down to min_step, while the
+    arrow count stays within max_arrows.
+    """
+    charge_min = positions[:, :2].min(axis=0)
+    charge_max = positions[:, :2].max(axis=0)
+    frame_half = np.array(frame_size) / 2
+    lower = np.maximum(charge_min - padding, np.minimum(charge_min, -frame_half))
+    upper = np.minimum(charge_max + padding, np.maximum(charge_max, frame_half))
+    extent = upper - lower
+
+    step = max(np.sqrt(np.prod(extent) / max(max_arrows // 4, 1)), min_step)
+    columns, rows = np.maximum(np.ceil(extent / step).astype(int), 1)
+    # rounding both sides up can go over a small budget, the cells are then
+    # stretched to cover the area with fewer of them
+    columns = min(columns, max(max_arrows // rows, 1))
+    rows = min(rows, max(max_arrows // columns, 1))
+    step = max(step, *(extent / [columns, rows]))
+    # center the grid on the area, it can be slightly larger
+    origin = (lower + upper) / 2 - np.array([columns, rows]) * step / 2
+    xs, ys = np.meshgrid(np.arange(columns), np.arange(rows), indexing="ij")
+    centers = origin + (np.column_stack([xs.ravel(), ys.ravel()]) + 0.5) * step
+    sizes = np.full(len(centers), step)
+
+    # every split adds three cells
+    offsets = np.array([[-1, -1], [-1, 1], [1, -1], [1, 1]]) / 4
+    while len(centers) + 3 <= max_arrows:
+        distances = np.linalg.norm(
+            centers[:, np.newaxis, :] - positions[np.newaxis, :, :2], axis=2
+        ).min(axis=1)
+        closeness = distances / sizes
+        candidates = np.flatnonzero(
+            (closeness < REFINE_DISTANCE) & (sizes / 2 >= min_step)
+        )
+        if len(candidates) == 0:
+            break
+        candidates = candidates[np.argsort(closeness[candidates], kind="stable")]
+        split = candidates[: (max_arrows - len(centers)) // 3]
+
+        children = (
+            centers[split, np.newaxis, :]
+            + offsets[np.newaxis, :, :] * sizes[split, np.newaxis, np.newaxis]
+        ).reshape(-1, 2)
+        kept = np.ones(len(centers), dtype=bool)
+        kept[split] = False
+        centers = np.concatenate([centers[kept], children])
+        sizes = np.concatenate([sizes[kept], np.repeat(sizes[split] / 2, 4)])
+
+    points = np.column_stack([centers, np.zeros(len(centers))])
+    return points, sizes
+
 
 class Charge(VGroup):
     def __init__(
@@ -23,6 +143,7 @@ class Charge(VGroup):
         magnitude: float = 1,
         point: np.ndarray = ORIGIN,
         add_glow: bool = True,
+        level_of_detail: float | None = None,
         **kwargs,
     ) -> None:
         """An electrostatic charge object to produce an :class:`~ElectricField`.
@@ -36,6 +157,9 @@ class Charge(VGroup):
         add_glow
             Whether to add a glowing effect. Adds rings of
             varying opacities to simulate glowing effect.
+        level_of_detail
+            The scale the charge is drawn at on screen, the glow uses fewer
+            layers the fewer pixels it covers. All layers are used if not set.
         kwargs
             Additional parameters to be passed to ``VGroup``.
         """
@@ -50,32 +174,17 @@ class Charge(VGroup):
                 Rectangle(width=0.006 * 1.1, height=0.32 * 1.1).set_z_index(1),
             )
             color = RED
-            layer_colors = [RED_D, RED_A]
-            layer_radius = 4
         else:
             label = Rectangle(width=0.27, height=0.003)
             color = BLUE
-            layer_colors = ["#3399FF", "#66B2FF"]
-            layer_radius = 2
 
         if add_glow:  # use many arcs to simulate glowing
-            layer_num = 80
-            color_list = color_gradient(layer_colors, layer_num)
-            opacity_func = lambda t: 1500 * (1 - abs(t - 0.009) ** 0.0001)
-            rate_func = lambda t: t**2
-
-            for i in range(layer_num):
-                self.add(
-                    Arc(
-                        radius=layer_radius * rate_func((0.5 + i) / layer_num),
-                        angle=TAU,
-                        color=color_list[i],  # type:ignore
-                        stroke_width=101
-                        * (rate_func((i + 1) / layer_num) - rate_func(i / layer_num))
-                        * layer_radius,
-                        stroke_opacity=opacity_func(rate_func(i / layer_num)),
-                    ).shift(point)
+            layer_num = MAX_GLOW_LAYERS
+            if level_of_detail is not None:
+                layer_num = glow_layer_count(
+                    _GLOW_STYLES[magnitude > 0][1], level_of_detail
                 )
+            self.add(*_get_glow(magnitude > 0, layer_num).shift(point))
 
         self.add(Dot(point=self.point, radius=self.radius, color=color))
         self.add(label.scale(self.radius / 0.3).shift(point))
@@ -83,16 +192,56 @@ class Charge(VGroup):
             mob.set_z_index(1)
 
 
-class ElectricField(ArrowVectorField):
-    def __init__(self, *charges: Charge, **kwargs) -> None:
+def default_length_func(norm: np.ndarray) -> np.ndarray:
+    """Arrow lengths of an ArrowVectorField"""
+    return 0.45 * sigmoid(norm)
+
+
+class ElectricField(ArrowMesh):
+    def __init__(
+        self,
+        *charges: Charge,
+        color: ParsableManimColor | None = None,
+        min_color_scheme_value: float = 0,
+        max_color_scheme_value: float = 2,
+        colors: Sequence[ParsableManimColor] = DEFAULT_SCALAR_FIELD_COLORS,
+        length_func: Callable[[np.ndarray], np.ndarray] = default_length_func,
+        opacity: float = 1.0,
+        max_arrows: int = 400,
+        padding: float = 2,
+        min_step: float = 0.25,
+        **kwargs,
+    ) -> None:
         """An electric field.
 
+        The arrows are coloured like an :class:`~.ArrowVectorField` and drawn
+        as a single :class:`ArrowMesh`, on an :func:`adaptive_grid` that gets
+        denser near the charges.
+
         Parameters
         ----------
         charges
             The charges affecting the electric field.
+        color
+            The color of every arrow, instead of coloring them by strength.
+        min_color_scheme_value
+            The field strength mapped to the first color in ``colors``.
+        max_color_scheme_value
+            The field strength mapped to the last color in ``colors``.
+        colors
+            The colors of the gradient the arrows are colored with.
+        length_func
+            Maps field strengths (an array of them) to arrow lengths.
+        opacity
+            The opacity of the arrows.
+        max_arrows
+            The most arrows the field is drawn with.
+        padding
+            How far around the charges the field is drawn.
+        min_step
+            The smallest distance between two arrows.
         kwargs
-            Additional parameters to be passed to ``ArrowVectorField``.
+            Additional parameters to be passed to ``ArrowMesh``.
 
         Examples
         --------
@@ -110,37 +259,90 @@ class ElectricField(ArrowVectorField):
                     self.add(charge1, charge2, charge3)
                     self.add(field)
         """
+        super().__init__(**kwargs)
         self.charges = charges
-        positions = []
-        magnitudes = []
-        for charge in charges:
-            positions.append(charge.get_center())
-            magnitudes.append(charge.magnitude)
-
-        xs = [pos[0] for pos in positions]
-        ys = [pos[1] for pos in positions]
-
-        x_min, x_max = min(xs), max(xs)
-        y_min, y_max = min(ys), max(ys)
-
-        super().__init__(
-            lambda p: self._field_func(p, positions, magnitudes),
-            x_range=[x_min, x_max, 0.5],
-            y_range=[y_min, y_max, 0.5],
-            **kwargs,
+        self.field_color = None if color is None else ManimColor.parse(color)
+        self.color_scheme_range = (min_color_scheme_value, max_color_scheme_value)
+        self.rgbs = np.array([color_to_rgb(gradient) for gradient in colors])
+        self.length_func = length_func
+        self.opacity = opacity
+        self.max_arrows = max_arrows
+        self.padding = padding
+        self.min_step = min_step
+
+        self._positions, self._magnitudes = self._get_charge_state()
+        self._draw_field()
+
+    def _get_charge_state(self) -> Tuple[np.ndarray, np.ndarray]:
+        positions = np.array([charge.get_center() for charge in self.charges])
+        magnitudes = np.array([charge.magnitude for charge in self.charges])
+        return positions, magnitudes
+
+    def _get_rgbs(self, strengths: np.ndarray) -> np.ndarray:
+        """The color of each arrow, interpolated like VectorField.pos_to_rgb"""
+        if self.field_color is not None:
+            return np.tile(self.field_color.to_rgb(), (len(strengths), 1))
+        min_value, max_value = self.color_scheme_range
+        alpha = (np.clip(strengths, min_value, max_value) - min_value) / (
+            max_value - min_value
         )
+        alpha *= len(self.rgbs) - 1
+        first = alpha.astype(int)
+        second = np.minimum(first + 1, len(self.rgbs) - 1)
+        alpha = (alpha % 1)[:, np.newaxis]
+        return (1 - alpha) * self.rgbs[first] + alpha * self.rgbs[second]
 
-    def _field_func(
-        self,
-        p: np.ndarray,
-        positions: Iterable[np.ndarray],
-        magnitudes: Iterable[float],
+    def _draw_field(self) -> None:
+        grid, cell_sizes = adaptive_grid(
+            self._positions,
+            self.max_arrows,
+            (config.frame_width, config.frame_height),
+            padding=self.padding,
+            min_step=self.min_step,
+        )
+        values = self.field_at(grid, self._positions, self._magnitudes)
+        strengths = np.linalg.norm(values, axis=1)
+        scale = np.divide(
+            self.length_func(strengths),
+            strengths,
+            out=np.zeros_like(strengths),
+            where=strengths != 0,
+        )
+        # so arrows in the smaller cells near the charges don't overlap
+        scale *= np.minimum(cell_sizes / FULL_ARROW_CELL_SIZE, 1)
+        self.set_arrows(
+            grid,
+            values * scale[:, np.newaxis],
+            self._get_rgbs(strengths),
+            self.opacity,
+        )
+
+    def update_field(self) -> ElectricField:
+        """Follows the charges, the arrows are only recomputed (in place) when a charge
+        moved or changed magnitude."""
+        positions, magnitudes = self._get_charge_state()
+        if np.array_equal(positions, self._positions) and np.array_equal(
+            magnitudes, self._magnitudes
+        ):
+            return self
+
+        self._positions, self._magnitudes = positions, magnitudes
+        self._draw_field()
+        return self
+
+    @staticmethod
+    def field_at(
+        points: np.ndarray, positions: np.ndarray, magnitudes: np.ndarray
     ) -> np.ndarray:
-        field_vect = np.zeros(3)
-        for p0, mag in zip(positions, magnitudes):
-            r = p - p0
-            dist = np.linalg.norm(r)
-            if dist < 0.1:
-                return np.zeros(3)
-            field_vect += mag / dist**2 * normalize(r)
-        return field_vect
+        """The field at each of the points (n x 3) from all the charges, with a
+        single broadcast over points and charges."""
+        r = points[:, np.newaxis, :] - positions[np.newaxis, :, :]
+        dist = np.linalg.norm(r, axis=2)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # mag / dist**2 * normalize(r)
+            field = (magnitudes[:, np.newaxis] * r / dist[..., np.newaxis] ** 3).sum(
+                axis=1
+            )
+        # the field isn't drawn too close to a charge
+        field[(dist < 0.1).any(axis=1)] = 0
+        return field
@@ -3,7 +3,7 @@
 
 from __future__ import annotations
 
-from typing import Iterable, Tuple
+from typing import Dict, Iterable, Tuple
 
 import numpy as np
 from manim import config
@@ -12,23 +12,26 @@ from manim.mobject.geometry.arc import Circle
 from manim.mobject.geometry.boolean_ops import Difference, Intersection
 from manim.mobject.geometry.polygram import Square
 from manim.mobject.types.vectorized_mobject import VectorizedPoint, VMobject
-from shapely import geometry as gm
 
 __all__ = ["Lens"]
 from manim.mobject.opengl.opengl_compatibility import ConvertToOpenGL
 
 
-def intersection(vmob1: VMobject, vmob2: VMobject) -> Iterable[Iterable[float]]:
-    """intersection points of 2 curves"""
-    a = gm.LineString(vmob1.points)
-    b = gm.LineString(vmob2.points)
-    intersects: gm.GeometryCollection = a.intersection(b)
-    try:  # for intersections > 1
-        return np.array(
-            [[[x, y, z] for x, y, z in m.coords][0] for m in intersects.geoms]
-        )
-    except:  # else
-        return np.array([[x, y, z] for x, y, z in intersects.coords])
+# rays starting on an outline (where they were refracted) don't hit it again right away
+HIT_TOLERANCE = 1e-7
+
+
+def _circle_hits(
+    points: np.ndarray, vectors: np.ndarray, center: np.ndarray, radius: float
+) -> np.ndarray:
+    """both t where points + t * vectors (n x 2) cross a circle, nan if they don't"""
+    offsets = points - center
+    a = np.einsum("ij,ij->i", vectors, vectors)
+    b = np.einsum("ij,ij->i", vectors, offsets)
+    c = np.einsum("ij,ij->i", offsets, offsets) - radius**2
+    discriminant = b**2 - a * c
+    root = np.sqrt(np.where(discriminant >= 0, discriminant, np.nan))
+    return np.stack([(-b - root) / a, (-b + root) / a], axis=1)
 
 
 def snell(i_ang: float, n: float) -> float:
@@ -41,6 +44,40 @@ def antisnell(r_ang: float, n: float) -> float:
     return np.arcsin(np.sin(r_ang) * n)
 
 
+# the outline only depends on the focal length, thickness and refractive index, so
+# the boolean operations run once per shape and every lens copies the result
+LensGeometry = Tuple[float, np.ndarray, np.ndarray]
+_lens_geometry: Dict[Tuple[float, float, float], LensGeometry] = {}
+
+
+def _get_geometry(f: float, d: float, n: float) -> LensGeometry:
+    """radius of curvature, outline points and centers of curvature of a lens"""
+    key = (f, d, n)
+    if key not in _lens_geometry:
+        f *= 50 / 7 * f if f > 0 else -50 / 7 * f  # this is odd, but it works
+        if f > 0:
+            r = ((n - 1) ** 2 * f * d / n) ** 0.5
+            outline = Intersection(
+                a := Circle(r).shift(RIGHT * (r - d / 2)),
+                b := Circle(r).shift(LEFT * (r - d / 2)),
+            )
+        else:
+            r = ((n - 1) ** 2 * -f * d / n) ** 0.5
+            outline = Difference(
+                Difference(
+                    Square(2 * 0.7 * r),
+                    a := Circle(r).shift(LEFT * (r + d / 2)),
+                ),
+                b := Circle(r).shift(RIGHT * (r + d / 2)),
+            )
+        _lens_geometry[key] = (
+            r,
+            outline.insert_n_curves(50).points,
+            np.array([a.get_center(), b.get_center()]),
+        )
+    return _lens_geometry[key]
+
+
 class Lens(VMobject, metaclass=ConvertToOpenGL):
     def __init__(self, f: float, d: float, n: float = 1.52, **kwargs) -> None:
         """A lens. Commonly used with :class:`~Ray` .
@@ -60,36 +97,14 @@ class Lens(VMobject, metaclass=ConvertToOpenGL):
         """
         super().__init__(**kwargs)
         self.f = f
-        f *= 50 / 7 * f if f > 0 else -50 / 7 * f  # this is odd, but it works
-        if f > 0:
-            r = ((n - 1) ** 2 * f * d / n) ** 0.5
-        else:
-            r = ((n - 1) ** 2 * -f * d / n) ** 0.5
         self.d = d
         self.n = n
-        self.r = r
-        if f > 0:
-            self.set_points(
-                Intersection(
-                    a := Circle(r).shift(RIGHT * (r - d / 2)),
-                    b := Circle(r).shift(LEFT * (r - d / 2)),
-                )
-                .insert_n_curves(50)
-                .points
-            )
-        else:
-            self.set_points(
-                Difference(
-                    Difference(
-                        Square(2 * 0.7 * r),
-                        a := Circle(r).shift(LEFT * (r + d / 2)),
-                    ),
-                    b := Circle(r).shift(RIGHT * (r + d / 2)),
-                )
-                .insert_n_curves(50)
-                .points
-            )
-        self.add(VectorizedPoint(a.get_center()), VectorizedPoint(b.get_center()))
+        self.r, points, centers = _get_geometry(f, d, n)
+        self.set_points(points.copy())
+        self.add(*(VectorizedPoint(center) for center in centers))
+        # the vertex of the surface around C[0], tracks the radius of curvature
+        # once the lens is scaled
+        self.add(VectorizedPoint(LEFT * d / 2))
 
     @property
     def C(self) -> Tuple[Iterable[float]]:
@@ -97,3 +112,85 @@ class Lens(VMobject, metaclass=ConvertToOpenGL):
         i = 0
         i += 1 if config.renderer != "opengl" else 0
         return self[i].points[0], self[i + 1].points[0]  # why is this confusing
+
+    @property
+    def vertex(self) -> np.ndarray:
+        """Returns the point where the surface around ``C[0]`` crosses the axis."""
+        return self.submobjects[2].points[0]
+
+    def surface_hits(self, points: np.ndarray, vectors: np.ndarray) -> np.ndarray:
+        """Where rays first cross the outline of the lens.
+
+        The surfaces are the arcs of the two circles of curvature (and the
+        sides of the square a concave lens is cut from), so every ray is
+        intersected at once instead of against the points of the outline.
+        They're placed from the current centers of curvature and vertex, so
+        the lens can be moved, scaled or rotated.
+
+        Parameters
+        ----------
+        points
+            The start of each ray (n x 2).
+        vectors
+            The direction of each ray (n x 2).
+
+        Returns
+        -------
+        np.ndarray
+            The smallest positive t for which ``points + t * vectors`` is on
+            the outline, ``inf`` for the rays that miss it.
+        """
+        points = np.asarray(points, dtype=float)[:, :2]
+        vectors = np.asarray(vectors, dtype=float)[:, :2]
+        c0, c1 = (np.asarray(c, dtype=float)[:2] for c in self.C)
+        radius = np.linalg.norm(self.vertex[:2] - c0)
+        r2 = radius**2 * (1 + HIT_TOLERANCE)
+
+        def crossings(t: np.ndarray) -> np.ndarray:
+            return points[:, np.newaxis] + t[..., np.newaxis] * vectors[:, np.newaxis]
+
+        def inside(q: np.ndarray, center: np.ndarray) -> np.ndarray:
+            return np.sum((q - center) ** 2, axis=-1) <= r2
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t0 = _circle_hits(points, vectors, c0, radius)
+            t1 = _circle_hits(points, vectors, c1, radius)
+            if self.f > 0:
+                # the intersection of the two circles
+                candidates = [t0, t1]
+                valid = [inside(crossings(t0), c1), inside(crossings(t1), c0)]
+            else:
+                # a square with the two circles cut out of its sides, aligned with
+                # the axis of the lens
+                center = (c0 + c1) / 2
+                half = 0.7 * radius
+                axis = (c1 - c0) / np.linalg.norm(c1 - c0)
+                frame = np.array([axis, [-axis[1], axis[0]]])
+
+                def in_square(q: np.ndarray) -> np.ndarray:
+                    return np.all(
+                        np.abs((q - center) @ frame.T) <= half * (1 + HIT_TOLERANCE),
+                        axis=-1,
+                    )
+
+                local_points = (points - center) @ frame.T
+                local_vectors = vectors @ frame.T
+                sides = np.stack(
+                    [
+                        (side * half - local_points[:, i]) / local_vectors[:, i]
+                        for i in (0, 1)
+                        for side in (-1, 1)
+                    ],
+                    axis=1,
+                )
+                q = crossings(sides)
+                candidates = [t0, t1, sides]
+                valid = [
+                    in_square(crossings(t0)),
+                    in_square(crossings(t1)),
+                    in_square(q) & ~inside(q, c0) & ~inside(q, c1),
+                ]
+
+            t = np.concatenate(candidates, axis=1)
+            t = np.where(np.concatenate(valid, axis=1) & (t > HIT_TOLERANCE), t, np.inf)
+        return np.min(t, axis=1)
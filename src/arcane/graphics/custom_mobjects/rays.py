@@ -2,21 +2,168 @@
 
 from __future__ import annotations
 
-from typing import Iterable
+from typing import Iterable, List
 
 import numpy as np
 from manim import config
+from manim.animation.animation import Animation
 from manim.mobject.geometry.line import Line
-from manim.utils.space_ops import angle_of_vector, rotate_vector
+from manim.mobject.types.vectorized_mobject import VGroup
 
-from arcane.graphics.custom_mobjects.lens import (Lens, antisnell,
-                                                  intersection, snell)
+from arcane.graphics.custom_mobjects.lens import Lens, antisnell, snell
 
 __all__ = [
     "Ray",
+    "Propagate",
+    "trace_rays",
+    "propagate_rays",
 ]
 
 
+def _angles(vectors: np.ndarray) -> np.ndarray:
+    return np.arctan2(vectors[:, 1], vectors[:, 0])
+
+
+def _rotate(vectors: np.ndarray, angles: np.ndarray) -> np.ndarray:
+    cos, sin = np.cos(angles), np.sin(angles)
+    return np.stack(
+        [
+            cos * vectors[:, 0] - sin * vectors[:, 1],
+            sin * vectors[:, 0] + cos * vectors[:, 1],
+        ],
+        axis=1,
+    )
+
+
+def trace_rays(
+    starts: np.ndarray,
+    vectors: np.ndarray,
+    lenses: Iterable[Lens],
+    init_length: float | np.ndarray = 5,
+) -> List[np.ndarray]:
+    """Refracts a bundle of rays through lenses.
+
+    Every ray enters the nearest lens along its last segment that it hasn't
+    gone through yet, until it misses them all or is totally internally
+    reflected. All the rays are traced together, one lens crossing at a time.
+
+    Parameters
+    ----------
+    starts
+        The start of each ray (n x 3).
+    vectors
+        The initial segment of each ray (n x 3).
+    lenses
+        The lenses the rays propagate through.
+    init_length
+        Scales the segment leaving each lens, for all the rays or each of them.
+
+    Returns
+    -------
+    List[np.ndarray]
+        The corners of the path of each ray.
+    """
+    lenses = list(lenses)
+    starts = np.asarray(starts, dtype=float).reshape(-1, 3)
+    points = starts[:, :2].copy()
+    segments = np.asarray(vectors, dtype=float).reshape(-1, 3)[:, :2].copy()
+    count = len(starts)
+    rows = np.arange(count)
+    init_lengths = np.broadcast_to(np.asarray(init_length, dtype=float), count)
+
+    centers = np.array([[c[:2] for c in lens.C] for lens in lenses]).reshape(-1, 2, 2)
+    indices = np.array([lens.n for lens in lenses])
+    # the sign of the refraction angles of convex (-1) and concave (1) lenses
+    signs = np.array([-1 if lens.f > 0 else 1 for lens in lenses])
+
+    corners = [points.copy()]
+    masks = [np.ones(count, dtype=bool)]
+    travelling = np.ones(count, dtype=bool)
+    traversed = np.zeros((count, len(lenses)), dtype=bool)
+
+    for _ in lenses:
+        hits = np.stack(
+            [lens.surface_hits(points, segments) for lens in lenses], axis=1
+        )
+        hits[traversed | ~travelling[:, np.newaxis] | (hits > 1)] = np.inf
+        nearest = np.argmin(hits, axis=1)
+        entering = np.isfinite(hits[rows, nearest])
+        if not entering.any():
+            break
+
+        ray = rows[entering]
+        lens_index = nearest[entering]
+        traversed[ray, lens_index] = True
+        c0, c1 = centers[lens_index, 0], centers[lens_index, 1]
+        n, sign = indices[lens_index], signs[lens_index]
+        incoming = segments[ray]
+        entry = points[ray] + hits[ray, lens_index][:, np.newaxis] * incoming
+
+        i_ang = _angles(entry - c0) - _angles(-incoming)
+        # the centre of curvature of a concave surface is behind it
+        inside = _rotate(c0 - entry, snell(i_ang, n) * sign) * -sign[:, np.newaxis]
+        exit_t = np.full(len(ray), np.inf)
+        for index, lens in enumerate(lenses):
+            own = lens_index == index
+            if own.any():
+                exit_t[own] = lens.surface_hits(entry[own], inside[own])
+        exited = np.isfinite(exit_t)
+        exit_t[~exited] = 0
+        exit = entry + exit_t[:, np.newaxis] * inside
+
+        i_ang = _angles(exit - c1) - _angles(entry - exit)
+        escaped = exited & (np.abs(np.sin(i_ang)) < 1 / n)
+        with np.errstate(invalid="ignore"):
+            outgoing = _rotate(c1 - exit, antisnell(i_ang, n) * -sign)
+        outgoing *= (sign * init_lengths[ray])[:, np.newaxis]
+
+        for corner, reached in ((entry, entering[ray]), (exit, exited)):
+            step = np.zeros_like(points)
+            step[ray] = corner
+            mask = np.zeros(count, dtype=bool)
+            mask[ray[reached]] = True
+            corners.append(step)
+            masks.append(mask)
+
+        travelling[ray[~escaped]] = False
+        points[ray] = exit
+        segments[ray] = outgoing
+
+    corners.append(points + segments)
+    masks.append(travelling)
+
+    corners = np.stack(corners, axis=1)
+    masks = np.stack(masks, axis=1)
+    return [
+        np.column_stack([corners[i, masks[i]], np.full(masks[i].sum(), starts[i, 2])])
+        for i in range(count)
+    ]
+
+
+def propagate_rays(rays: List[Ray], lenses: Iterable[Lens]) -> List[np.ndarray]:
+    """The corners of each ray once its last segment is traced through lenses"""
+    corners = [ray.get_corners() for ray in rays]
+    paths = trace_rays(
+        [c[-2] for c in corners],
+        [c[-1] - c[-2] for c in corners],
+        lenses,
+        [ray.init_length for ray in rays],
+    )
+    return [np.vstack([c[:-2], path]) for c, path in zip(corners, paths)]
+
+
+def _subdivide(corners: np.ndarray, count: int) -> np.ndarray:
+    """The same polyline split in count segments, spread over its segments like
+    manim does when aligning curves"""
+    segments = len(corners) - 1
+    splits = np.bincount(np.arange(count) * segments // count, minlength=segments)
+    pieces = [
+        corners[i] + np.outer(np.arange(split) / split, corners[i + 1] - corners[i])
+        for i, split in enumerate(splits)
+    ]
+    return np.vstack([*pieces, corners[-1:]])
+
+
 class Ray(Line):
     def __init__(
         self,
@@ -73,73 +220,61 @@ class Ray(Line):
         lenses
             All the lenses for the ray to propagate through
         """
-        # TODO: make modular(?) Clean up logic
-        sorted_lens = self._sort_lens(lenses)
-        for lens in sorted_lens:
-            intersects = intersection(lens, self)
-            if len(intersects) == 0:
-                continue
-            intersects = self._sort_intersections(intersects)
-            if not self.propagated:
-                self.put_start_and_end_on(
-                    self.start,
-                    intersects[-1],
-                )
-            else:
-                nppcc = (
-                    self.n_points_per_cubic_curve
-                    if config.renderer != "opengl"
-                    else self.n_points_per_curve
-                )
-                if len(self.points) > nppcc:
-                    self.points = self.points[:-nppcc]
-                self.add_line_to(intersects[1])
-            self.end = intersects[-1]
-            i_ang = angle_of_vector(self.end - lens.C[0])
-            i_ang -= angle_of_vector(self.start - self.end)
-            r_ang = snell(i_ang, lens.n)
-            r_ang *= -1 if lens.f > 0 else 1
-            ref_ray = rotate_vector(lens.C[0] - self.end, r_ang)
-            intersects = intersection(
-                lens,
-                Line(
-                    self.end - ref_ray * self.init_length,
-                    self.end + ref_ray * self.init_length,
-                ),
-            )
-            intersects = self._sort_intersections(intersects)
-            self.add_line_to(intersects[1])
-            self.start = self.end
-            self.end = intersects[1]
-            i_ang = angle_of_vector(self.end - lens.C[1])
-            i_ang -= angle_of_vector(self.start - self.end)
-            if np.abs(np.sin(i_ang)) < 1 / lens.n:
-                r_ang = antisnell(i_ang, lens.n)
-                r_ang *= -1 if lens.f < 0 else 1
-                ref_ray = rotate_vector(lens.C[1] - self.end, r_ang)
-                ref_ray *= -1 if lens.f > 0 else 1
-                self.add_line_to(self.end + ref_ray * self.init_length)
-                self.start = self.end
-                self.end = self.get_end()
-            self.propagated = True
-
-    def _sort_lens(self, lenses: Iterable[Lens]) -> Iterable[Lens]:
-        dists = []
-        for lens in lenses:
-            try:
-                dists += [
-                    [np.linalg.norm(intersection(self, lens)[0] - self.start), lens]
-                ]
-            except:
-                dists += [[np.inf, lens]]
-        dists.sort(key=lambda x: x[0])
-        return np.array(dists, dtype=object)[:, 1]
-
-    def _sort_intersections(
-        self, intersections: Iterable[Iterable[float]]
-    ) -> Iterable[Iterable[float]]:
-        result = []
-        for inters in intersections:
-            result.append([np.linalg.norm(inters - self.end), inters])
-        result.sort(key=lambda x: x[0])
-        return np.array(result, dtype=object)[:, 1]
+        (path,) = propagate_rays([self], lenses)
+        self.set_points_as_corners(path)
+        self.propagated = True
+
+    def get_corners(self) -> np.ndarray:
+        """The start of every segment of the ray and its end"""
+        nppcc = (
+            self.n_points_per_cubic_curve
+            if config.renderer != "opengl"
+            else self.n_points_per_curve
+        )
+        return np.vstack([self.points[::nppcc], self.points[-1:]])
+
+
+class Propagate(Animation):
+    def __init__(self, rays: VGroup, *lenses: Lens, **kwargs) -> None:
+        """Propagates a bundle of rays through lenses in a single animation.
+
+        All the rays are traced together when the animation begins, then each
+        frame moves the corners of every ray towards its refracted path at
+        once, without a target copy per ray.
+
+        Parameters
+        ----------
+        rays
+            A group of :class:`~Ray` .
+        lenses
+            All the lenses for the rays to propagate through.
+        kwargs
+            Additional parameters to be passed to :class:`~Animation` .
+        """
+        self.lenses = lenses
+        super().__init__(rays, **kwargs)
+
+    def begin(self) -> None:
+        rays = list(self.mobject)
+        self.paths = propagate_rays(rays, self.lenses)
+        starts, ends = [np.zeros((0, 3))], [np.zeros((0, 3))]
+        for ray, path in zip(rays, self.paths):
+            corners = ray.get_corners()
+            count = max(len(corners), len(path)) - 1
+            starts.append(_subdivide(corners, count))
+            ends.append(_subdivide(path, count))
+        self.bounds = np.cumsum([0] + [len(corners) for corners in starts[1:]])
+        self.start_corners = np.concatenate(starts)
+        self.corner_shifts = np.concatenate(ends) - self.start_corners
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        corners = self.start_corners + self.rate_func(alpha) * self.corner_shifts
+        for ray, start, end in zip(self.mobject, self.bounds[:-1], self.bounds[1:]):
+            ray.set_points_as_corners(corners[start:end])
+
+    def finish(self) -> None:
+        super().finish()
+        for ray, path in zip(self.mobject, self.paths):
+            ray.set_points_as_corners(path)
+            ray.propagated = True
@@ -0,0 +1,223 @@
+import logging
+import math
+import os
+import re
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import fields, is_dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from manim import TexTemplate, config
+from manim.utils.tex_file_writing import tex_hash
+
+import arcane.graphics.config
+from arcane.core.models.constructs import ArcaneBrace, ArcaneText, Program
+
+logger = logging.getLogger(__name__)
+
+# expressions compiled by one latex run, fewer makes more batches to run in parallel
+MIN_BATCH_SIZE = 8
+
+_STANDALONE_CLASS = re.compile(
+    r"\\documentclass(\[(?P<options>[^\]]*)\])?\{standalone\}"
+)
+
+# expressions SingleStringMathTex rewrites before compiling them (filler after a trailing
+# ^, _ or dot, a lone \sqrt, ...), see its _modify_special_strings
+_REWRITTEN_EXPRESSIONS = ("\\over", "\\overline", "\\sqrt", "\\sqrt{", "\\substack")
+_REWRITTEN_ENDINGS = ("_", "^", "dot")
+
+
+def _tex_expression(tex_string: str) -> Optional[str]:
+    """The expression SingleStringMathTex compiles for a tex string, None for the few it
+    rewrites first, which are left for manim to compile on its own"""
+    expression = tex_string.strip()
+    if (
+        not expression
+        or expression in _REWRITTEN_EXPRESSIONS
+        or expression.endswith(_REWRITTEN_ENDINGS)
+        or expression.startswith("\\\\")
+    ):
+        return None
+
+    lefts, rights = (
+        len([s for s in expression.split(command)[1:] if s and s[0] in "(){}[]|.\\"])
+        for command in ("\\left", "\\right")
+    )
+    opening, closing = (
+        expression.count(brace)
+        - expression.count("\\" + brace)
+        + expression.count("\\\\" + brace)
+        for brace in "{}"
+    )
+    array = ("\\begin{array}" in expression) != ("\\end{array}" in expression)
+    if lefts != rights or opening != closing or array:
+        return None
+    return expression
+
+
+def _latex_expression(value: Any) -> Optional[Tuple[str, str]]:
+    """The expression and environment manim compiles for a value, the same as Tex/MathTex
+    with a single string"""
+    if isinstance(value, ArcaneText) and value.is_latex:
+        expression, environment = f"${value.value}$", "center"
+    elif isinstance(value, ArcaneBrace):
+        # brace labels are MathTex when they are latex and Tex otherwise
+        expression = value.text
+        environment = "align*" if value.is_latex else "center"
+    else:
+        return None
+    if "{{" in expression:  # split in several expressions by MathTex
+        return None
+    expression = _tex_expression(expression)
+    return (expression, environment) if expression else None
+
+
+def collect_latex(program: Program) -> List[Tuple[str, str]]:
+    """Finds every LaTeX expression (with its environment) the scene will compile"""
+    expressions: Dict[Tuple[str, str], None] = {}
+    pending: List[Any] = [program]
+    while pending:
+        obj = pending.pop()
+        if isinstance(obj, (list, tuple)):
+            pending.extend(reversed(obj))
+        elif isinstance(obj, dict):
+            pending.extend(reversed(obj.values()))
+        elif is_dataclass(obj):
+            expression = _latex_expression(obj)
+            if expression:
+                expressions[expression] = None
+            else:
+                pending.extend(
+                    getattr(obj, field.name) for field in reversed(fields(obj))
+                )
+    return list(expressions)
+
+
+def _batch_document(tex_template: TexTemplate, pages: List[str]) -> Optional[str]:
+    """A document with one page per expression, cropped like the standalone documents
+    manim compiles for each of them"""
+    prefix, placeholder, suffix = tex_template.body.partition(
+        tex_template.placeholder_text
+    )
+    match = _STANDALONE_CLASS.search(prefix)
+    if not placeholder or not match:
+        return None
+
+    options = match.group("options")
+    documentclass = (
+        rf"\documentclass[{options + ',' if options else ''}multi]{{standalone}}"
+    )
+    prefix = prefix[: match.start()] + documentclass + prefix[match.end() :]
+    body = "\n".join(
+        "\n".join([r"\begin{standalone}", page, r"\end{standalone}"]) for page in pages
+    )
+    return prefix + body + suffix
+
+
+def _compilation_command(
+    tex_template: TexTemplate, tex_file: Path, tex_dir: Path
+) -> Optional[List[str]]:
+    """The arguments of manim's tex_compilation_command, None for unknown compilers"""
+    output_format = tex_template.output_format
+    if tex_template.tex_compiler in {"latex", "pdflatex", "luatex", "lualatex"}:
+        options = [f"-output-format={output_format[1:]}"]
+    elif tex_template.tex_compiler == "xelatex" and output_format in {".xdv", ".pdf"}:
+        options = ["-no-pdf"] if output_format == ".xdv" else []
+    else:
+        return None
+    return [
+        tex_template.tex_compiler,
+        *options,
+        "-interaction=batchmode",
+        "-halt-on-error",
+        f"-output-directory={tex_dir.as_posix()}",
+        tex_file.as_posix(),
+    ]
+
+
+def _compile_batch(
+    tex_template: TexTemplate, tex_dir: Path, batch: List[Tuple[str, Path]]
+) -> None:
+    """Compiles the pages of a batch in one latex run and splits it in the svg files
+    manim looks for before compiling an expression"""
+    document = _batch_document(tex_template, [page for page, _ in batch])
+    if document is None:
+        return
+
+    batch_file = tex_dir / f"batch_{os.getpid()}_{tex_hash(document)}.tex"
+    command = _compilation_command(tex_template, batch_file, tex_dir)
+    if command is None:
+        return
+    batch_file.write_text(document, encoding="utf-8")
+    output_file = batch_file.with_suffix(tex_template.output_format)
+    try:
+        subprocess.run(command, capture_output=True, check=True)
+        for page, (_, svg_file) in enumerate(batch, start=1):
+            # dvisvgm writes a temporary file so manim never reads a partial svg
+            temp_file = svg_file.with_suffix(f".{os.getpid()}.tmp")
+            subprocess.run(
+                [
+                    "dvisvgm",
+                    *(["--pdf"] if tex_template.output_format == ".pdf" else []),
+                    "-p",
+                    str(page),
+                    output_file.as_posix(),
+                    "-n",
+                    "-v",
+                    "0",
+                    "-o",
+                    temp_file.as_posix(),
+                ],
+                capture_output=True,
+                check=True,
+            )
+            os.replace(temp_file, svg_file)
+    except (OSError, subprocess.CalledProcessError) as e:
+        # manim compiles the expressions left again one by one and reports the error
+        logger.warning(
+            "Unable to precompile LaTeX, compiling the expressions separately: %s", e
+        )
+    finally:
+        for extension in (".tex", ".aux", ".log", tex_template.output_format):
+            batch_file.with_suffix(extension).unlink(missing_ok=True)
+
+
+def precompile_latex(program: Program, workers: Optional[int] = None) -> None:
+    """Compiles every LaTeX expression of a program ahead of building the scene, in a few
+    latex runs instead of one per expression"""
+    if workers is None:
+        workers = min(arcane.graphics.config.build_workers, os.cpu_count() or 1)
+
+    tex_template: TexTemplate = config.tex_template
+    tex_dir = config.get_dir("tex_dir")
+    tex_dir.mkdir(parents=True, exist_ok=True)
+
+    prefix, _, suffix = tex_template.body.partition(tex_template.placeholder_text)
+    pending: List[Tuple[str, Path]] = []
+    for expression, environment in collect_latex(program):
+        document = tex_template.get_texcode_for_expression_in_env(
+            expression, environment
+        )
+        # same path as manim.utils.tex_file_writing.generate_tex_file
+        svg_file = tex_dir / f"{tex_hash(document)}.svg"
+        if not svg_file.exists():
+            page = document[len(prefix) : len(document) - len(suffix)]
+            pending.append((page, svg_file))
+
+    if not pending:
+        return
+
+    batch_count = min(workers, math.ceil(len(pending) / MIN_BATCH_SIZE))
+    batch_size = math.ceil(len(pending) / batch_count)
+    batches = [
+        pending[start : start + batch_size]
+        for start in range(0, len(pending), batch_size)
+    ]
+    with ThreadPoolExecutor(max_workers=len(batches)) as executor:
+        list(
+            executor.map(
+                lambda batch: _compile_batch(tex_template, tex_dir, batch), batches
+            )
+        )
@@ -12,6 +12,8 @@ from arcane.core.models.constructs import (ArcaneArrow, ArcaneCircle,
                                            ArcaneRegularPolygon, ArcaneSquare,
                                            SweepCoordinates, SweepObjects,
                                            ThreePoint)
+from arcane.graphics.custom_mobjects.connector import (ConnectorArrow,
+                                                       ConnectorLine)
 from arcane.graphics.utils.manim import (apply_positioning, get_random_color,
                                          map_color_string)
 
@@ -35,10 +37,7 @@ def render_line(
     elif isinstance(line.definition, SweepObjects):
         assert from_object is not None
         assert to_object is not None
-        rendered_line = always_redraw(
-            lambda: Line(start=from_object.get_center(), end=to_object.get_center())
-        )
-        return rendered_line
+        return ConnectorLine(from_object, to_object)
 
     else:
         direction = np.array(
@@ -199,30 +198,29 @@ def render_arrow(
     from_object: Optional[Mobject] = None,
     to_object: Optional[Mobject] = None,
 ):
+    stroke_color = get_random_color()
+    if arrow.style and arrow.style.stroke_color:
+        stroke_color = map_color_string(arrow.style.stroke_color)
+
+    arrow_style = {
+        "color": stroke_color,
+        "buff": 0.1,  # Space between arrow and points
+        "max_tip_length_to_length_ratio": 0.25,  # Controls arrow head size
+    }
+
     if isinstance(arrow.definition, SweepCoordinates):
         start = np.array(
             [arrow.definition.sweep_from[0], arrow.definition.sweep_from[1], 0]
         )
         end = np.array([arrow.definition.sweep_to[0], arrow.definition.sweep_to[1], 0])
+        arrow_mobject = Arrow(start=start, end=end, **arrow_style)
 
     elif isinstance(arrow.definition, SweepObjects):
         assert from_object is not None
         assert to_object is not None
 
-        start = from_object.get_center()
-        end = to_object.get_center()
-
-    stroke_color = get_random_color()
-    if arrow.style and arrow.style.stroke_color:
-        stroke_color = map_color_string(arrow.style.stroke_color)
-
-    arrow_mobject = Arrow(
-        start=start,
-        end=end,
-        color=stroke_color,
-        buff=0.1,  # Space between arrow and points
-        max_tip_length_to_length_ratio=0.25,  # Controls arrow head size
-    )
+        # follows the objects when they move
+        arrow_mobject = ConnectorArrow(from_object, to_object, **arrow_style)
 
     if arrow.style and arrow.style.fill:
         fill_color = map_color_string(arrow.style.fill)
@@ -42,6 +42,7 @@ def render_parametric_math_function(
         t_range=[start, end],
         color=color,
         stroke_width=3,
+        use_vectorized=True,
     )
 
     return graph
@@ -77,6 +78,7 @@ def render_regular_math_function(
         x_range=[x_start, x_end, 0.1],
         color=color,
         stroke_width=3,
+        use_vectorized=True,
     )
 
     return graph
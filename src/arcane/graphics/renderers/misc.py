@@ -6,13 +6,15 @@ import numpy as np
 from manim import *
 
 from arcane.core.models.constructs import ArcaneText, RelativePositionPlacement
+from arcane.graphics.cache import load_mobject
 from arcane.graphics.utils.manim import apply_positioning
 
 
 @apply_positioning
 def render_text(text: ArcaneText, **kwargs):
     if text.is_latex:
-        text_mobject = Tex(
+        text_mobject = load_mobject(
+            Tex,
             f"${text.value}$",
             font_size=(
                 text.options.get("size")
@@ -21,7 +23,8 @@ def render_text(text: ArcaneText, **kwargs):
             ),  # type:ignore
         )
     else:
-        text_mobject = Text(
+        text_mobject = load_mobject(
+            Text,
             text.value,
             font_size=(
                 text.options.get("size")
@@ -1,5 +1,6 @@
 from manim import *
 
+import arcane.graphics.config
 from arcane.core.models.constructs import (ArcaneCharge, ArcaneLens,
                                            ArcaneRays, Direction,
                                            PropagateRays)
@@ -21,11 +22,16 @@ def render_lens(lens: ArcaneLens, **kwargs):
 
 @apply_positioning
 def render_charge(charge: ArcaneCharge, **kwargs):
-    return Charge(charge.magnitude)
+    return Charge(
+        charge.magnitude,
+        level_of_detail=arcane.graphics.config.charge_level_of_detail,
+    )
 
 
 def render_electric_field(charges: List[Charge], **kwargs):
-    field = always_redraw(lambda: ElectricField(*charges))
+    field = ElectricField(*charges)
+    # only recomputed on the frames a charge moved or changed magnitude
+    field.add_updater(lambda field: field.update_field())
     return field
 
 
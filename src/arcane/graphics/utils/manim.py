@@ -59,43 +59,46 @@ def clip_plot(csystem, plotfun, x_range=[-5, 5, 0.01], **kwargs):
     return grp
 
 
-def apply_positioning(func):
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        value = args[0]
-        relative_mobject: Optional[Mobject] = kwargs.get("relative_mobject", None)
-        mobject: Mobject = func(*args, **kwargs)
-        definition = getattr(value, "definition", None)
-        position: Optional[Position] = None
-        if definition:
-            position = definition.position
-        else:
-            position = value.position
+def position_mobject(
+    value: Any, mobject: Mobject, relative_mobject: Optional[Mobject] = None
+) -> Mobject:
+    definition = getattr(value, "definition", None)
+    position: Optional[Position] = None
+    if definition:
+        position = definition.position
+    else:
+        position = value.position
 
-        if position:
-            if isinstance(position, RelativeDirectionPosition):
-                placement = position.placement
+    if position:
+        if isinstance(position, RelativeDirectionPosition):
+            placement = position.placement
 
-                direction_map = {
-                    RelativePositionPlacement.ABOVE: UP,
-                    RelativePositionPlacement.BELOW: DOWN,
-                    RelativePositionPlacement.LEFT: LEFT,
-                    RelativePositionPlacement.RIGHT: RIGHT,
-                }
+            direction_map = {
+                RelativePositionPlacement.ABOVE: UP,
+                RelativePositionPlacement.BELOW: DOWN,
+                RelativePositionPlacement.LEFT: LEFT,
+                RelativePositionPlacement.RIGHT: RIGHT,
+            }
 
-                assert relative_mobject is not None
+            assert relative_mobject is not None
 
-                if placement in direction_map:
-                    mobject = mobject.next_to(
-                        relative_mobject, direction_map[placement]
-                    )
-                elif placement == RelativePositionPlacement.CENTER:
-                    mobject = mobject.move_to(relative_mobject.get_center())
+            if placement in direction_map:
+                mobject = mobject.next_to(relative_mobject, direction_map[placement])
+            elif placement == RelativePositionPlacement.CENTER:
+                mobject = mobject.move_to(relative_mobject.get_center())
 
-            elif isinstance(position, tuple):
-                mobject.move_to(np.array([*position, 0]))
+        elif isinstance(position, tuple):
+            mobject.move_to(np.array([*position, 0]))
 
-        return mobject
+    return mobject
+
+
+def apply_positioning(func):
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        relative_mobject: Optional[Mobject] = kwargs.get("relative_mobject", None)
+        mobject: Mobject = func(*args, **kwargs)
+        return position_mobject(args[0], mobject, relative_mobject)
 
     return wrapper
 
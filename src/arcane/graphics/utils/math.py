@@ -1,4 +1,5 @@
 import copy
+from enum import Enum
 from typing import Any, Callable, Tuple, Union
 
 import numpy as np
@@ -15,6 +16,10 @@ def substitute_sympy_expressions(obj: Any, variable: str, value: Any) -> Any:
     """
     Recursively walk through an object or list and substitute sympy expressions.
 
+    Containers and objects are copied shallowly on the way down, so the
+    result never aliases a mutable node of the input while the leaves
+    (sympy expressions without the variable, strings, numbers) are shared.
+
     Args:
         obj: The object to walk through (can be any type)
         variable: The variable name to substitute (string)
@@ -23,11 +28,13 @@ def substitute_sympy_expressions(obj: Any, variable: str, value: Any) -> Any:
     Returns:
         The object with all sympy expressions substituted
     """
-    if obj is None:
+    if obj is None or isinstance(obj, Enum):
         return obj
 
     # Handle sympy expressions
-    if isinstance(obj, (Add, Mul, Symbol)):
+    if isinstance(obj, sympy.Basic):
+        if not isinstance(obj, (Add, Mul, Symbol)):
+            return obj
         try:
             return obj.subs(variable, value)
         except:
@@ -48,53 +55,28 @@ def substitute_sympy_expressions(obj: Any, variable: str, value: Any) -> Any:
 
     # Handle objects with attributes (dataclasses, custom objects, etc.)
     if hasattr(obj, "__dict__"):
-        # Use deep copy to preserve object structure and handle complex initialization
-        try:
-            result = copy.deepcopy(obj)
-            # Recursively substitute in all attributes
-            for attr_name, attr_value in result.__dict__.items():
-                setattr(
-                    result,
-                    attr_name,
-                    substitute_sympy_expressions(attr_value, variable, value),
-                )
-            return result
-        except (TypeError, ValueError):
-            # If deep copy fails, try shallow copy and modify in place
-            result = copy.copy(obj)
-            for attr_name, attr_value in result.__dict__.items():
-                setattr(
-                    result,
-                    attr_name,
-                    substitute_sympy_expressions(attr_value, variable, value),
-                )
-            return result
+        result = copy.copy(obj)
+        for attr_name, attr_value in vars(obj).items():
+            setattr(
+                result,
+                attr_name,
+                substitute_sympy_expressions(attr_value, variable, value),
+            )
+        return result
 
     # Handle objects with slots (like some dataclasses)
     if hasattr(obj, "__slots__"):
-        try:
-            result = copy.deepcopy(obj)
-            for slot_name in obj.__slots__:
-                if hasattr(result, slot_name):
-                    slot_value = getattr(result, slot_name)
-                    setattr(
-                        result,
-                        slot_name,
-                        substitute_sympy_expressions(slot_value, variable, value),
-                    )
-            return result
-        except (TypeError, ValueError):
-            # If deep copy fails, try shallow copy
-            result = copy.copy(obj)
-            for slot_name in obj.__slots__:
-                if hasattr(result, slot_name):
-                    slot_value = getattr(result, slot_name)
-                    setattr(
-                        result,
-                        slot_name,
-                        substitute_sympy_expressions(slot_value, variable, value),
-                    )
-            return result
+        result = copy.copy(obj)
+        for slot_name in obj.__slots__:
+            if hasattr(obj, slot_name):
+                setattr(
+                    result,
+                    slot_name,
+                    substitute_sympy_expressions(
+                        getattr(obj, slot_name), variable, value
+                    ),
+                )
+        return result
 
     # For any other type, return as is
     return obj
@@ -126,12 +108,229 @@ def compute_point_on_circle(
     return (x, y)
 
 
-def compute_function_range(func, value_range, num_samples=100):
+# how many times larger than its samples a function has to get between them to be
+# treated as unbounded there
+POLE_GROWTH = 1e4
+
+
+def _evaluate_samples(func, samples: np.ndarray) -> np.ndarray:
+    """Evaluates a function over an array of samples in a single call where possible"""
+    try:
+        with np.errstate(all="ignore"):
+            values = np.asarray(func(samples), dtype=float)
+    except TypeError:
+        values = None
+    if values is None or values.shape != samples.shape:
+        # the function isn't vectorized (or is constant), evaluate sample by sample
+        values = np.vectorize(func, otypes=[float])(samples)
+    return values
+
+
+def _magnitudes(func, samples: np.ndarray) -> np.ndarray:
+    """The absolute values of func at samples, infinite where it isn't finite"""
+    values = np.abs(_evaluate_samples(func, samples))
+    return np.where(np.isfinite(values), values, np.inf)
+
+
+def _blows_up(
+    func, lows: np.ndarray, highs: np.ndarray, sampled: np.ndarray, iterations=40
+) -> np.ndarray:
+    """
+    Whether func grows without bound somewhere between each low and high.
+
+    A ternary search narrows each interval down to its largest magnitude. Around a
+    bounded peak that settles close to the sampled magnitude, closing in on a pole
+    it keeps growing.
+    """
+    peaks = np.zeros(len(lows))
+    for _ in range(iterations):
+        third = (highs - lows) / 3
+        left = _magnitudes(func, lows + third)
+        right = _magnitudes(func, highs - third)
+        peaks = np.maximum(peaks, np.maximum(left, right))
+        towards_left = left > right
+        highs = np.where(towards_left, highs - third, highs)
+        lows = np.where(towards_left, lows, lows + third)
+    with np.errstate(invalid="ignore"):
+        return peaks > POLE_GROWTH * sampled
+
+
+def _near_discontinuities(
+    func, x_values: np.ndarray, values: np.ndarray, jump_factor: float
+) -> np.ndarray:
+    """
+    Marks the samples around a discontinuity.
+
+    Values near an asymptote (e.g. tan around PI/2 or 1/x^2 around 0) grow without
+    bound and would otherwise dominate the range. A jump between neighbours of more
+    than ``jump_factor`` times the median step is a candidate, whatever the sign of
+    the values, and is a discontinuity if the function blows up between them (see
+    ``_blows_up``) or one of them isn't finite. The samples on either side are
+    marked, and so are the ones further out for as long as the steps stay that
+    large, the climb towards the asymptote.
+    """
+    finite = np.isfinite(values)
+    magnitudes = np.abs(values)
+    steps = np.abs(np.diff(values))
+    both_finite = finite[:-1] & finite[1:]
+    typical_step = np.median(steps[both_finite]) if both_finite.any() else 0.0
+    with np.errstate(invalid="ignore"):
+        large = both_finite & (steps > jump_factor * typical_step)
+
+    # tan around PI/2 or 1/x around 0, the asymptote is between the two samples
+    crossing = large & (np.sign(values[:-1]) * np.sign(values[1:]) < 0)
+    # 1/x^2 around 0, the asymptote is around the largest sample of the jumps
+    peak = np.zeros(len(values), dtype=bool)
+    peak[1:-1] = (
+        finite[1:-1]
+        & (large[:-1] | large[1:])
+        & (magnitudes[1:-1] >= np.where(finite[:-2], magnitudes[:-2], 0))
+        & (magnitudes[1:-1] >= np.where(finite[2:], magnitudes[2:], 0))
+    )
+
+    marked = np.zeros(len(values), dtype=bool)
+    (jumps,) = np.nonzero(crossing)
+    if len(jumps):
+        sampled = np.maximum(magnitudes[jumps], magnitudes[jumps + 1])
+        jumps = jumps[_blows_up(func, x_values[jumps], x_values[jumps + 1], sampled)]
+        marked[jumps] = marked[jumps + 1] = True
+    (peaks,) = np.nonzero(peak & ~marked)
+    if len(peaks):
+        peaks = peaks[
+            _blows_up(func, x_values[peaks - 1], x_values[peaks + 1], magnitudes[peaks])
+        ]
+        marked[peaks - 1] = marked[peaks] = marked[peaks + 1] = True
+
+    # samples blowing up next to one that isn't finite (1/x sampled at 0), the
+    # edges of a domain (sqrt(x) around 0) are kept
+    marked[1:-1] |= ~finite[2:] & large[:-1]
+    marked[1:-1] |= ~finite[:-2] & large[1:]
+
+    # the climb towards each asymptote
+    while True:
+        spread = marked.copy()
+        spread[1:] |= marked[:-1] & large
+        spread[:-1] |= marked[1:] & large
+        if np.array_equal(spread, marked):
+            return marked
+        marked = spread
+
+
+def compute_function_range(
+    func, value_range, num_samples=200, refine_samples=16, jump_factor=20.0
+):
+    """
+    Computes the (min, max) of a function over a range of input values.
+
+    The function is evaluated over the whole sample array at once, then the
+    neighbourhoods of local extrema and sign changes are resampled more densely
+    so narrow peaks between samples aren't missed. Non-finite values are ignored
+    and so are the samples around a discontinuity (see ``_near_discontinuities``),
+    everything else counts towards the range.
+
+    Args:
+        func: The (ideally vectorized) function to evaluate
+        value_range: The (start, end) of the input values
+        num_samples: Number of evenly spaced samples in the initial pass
+        refine_samples: Number of extra samples around each extremum or sign change
+        jump_factor: How many median steps a jump between two samples must span
+            to be treated as a discontinuity
+
+    Returns:
+        A tuple of the minimum and maximum value of the function
+    """
     x_values = np.linspace(value_range[0], value_range[1], num_samples)
-    vfunc = np.vectorize(func)
-    y_values = vfunc(x_values)
-    y_min, y_max = np.min(y_values), np.max(y_values)
-    return (y_min, y_max)
+    y_values = _evaluate_samples(func, x_values)
+
+    finite = np.isfinite(y_values)
+    if not finite.any():
+        # nothing plottable in this range, fall back to a unit range
+        return (-1.0, 1.0)
+
+    discontinuous = _near_discontinuities(func, x_values, y_values, jump_factor)
+
+    # interior samples where the slope or the value changes sign
+    slopes = np.sign(np.diff(np.where(finite, y_values, 0)))
+    extrema = np.nonzero(slopes[:-1] * slopes[1:] < 0)[0] + 1
+    signs = np.sign(np.where(finite, y_values, 0))
+    crossings = np.nonzero(signs[:-1] * signs[1:] < 0)[0] + 1
+    candidates = np.unique(np.concatenate([extrema, crossings]))
+    candidates = candidates[(candidates > 0) & (candidates < num_samples - 1)]
+    # resampling around an asymptote would only find larger values
+    candidates = candidates[~discontinuous[candidates]]
+
+    y_values = y_values[~discontinuous]
+    if len(candidates):
+        offsets = np.linspace(-1, 1, refine_samples)
+        step = x_values[1] - x_values[0]
+        refined_x = (x_values[candidates][:, None] + offsets * step).ravel()
+        y_values = np.concatenate([y_values, _evaluate_samples(func, refined_x)])
+
+    y_values = y_values[np.isfinite(y_values)]
+    if not len(y_values):
+        return (-1.0, 1.0)
+    return (float(np.min(y_values)), float(np.max(y_values)))
+
+
+def compile_expression(expression: Any, variable: str) -> Callable:
+    """
+    Compiles a sympy expression of a single variable into a numpy callable.
+
+    The returned callable accepts either a scalar or an array of samples. Scalars
+    take a fast path through the ``math`` module (used by updaters such as the
+    sweep dot), arrays are evaluated in a single vectorized numpy call. Anything
+    the compiler can't handle falls back to sympy substitution.
+
+    Args:
+        expression: The sympy expression to compile
+        variable: The name of the free variable in the expression
+
+    Returns:
+        Callable: A function mapping a scalar or array of values to floats
+    """
+    expression = sympy.sympify(expression)
+    symbol = sympy.Symbol(variable)
+
+    def fallback(x):
+        try:
+            value = complex(expression.subs(symbol, x).evalf())
+        except TypeError:
+            # zoo, nan or anything else that isn't a number is an undefined point
+            return np.nan
+        return value.real if value.imag == 0 else np.nan
+
+    try:
+        scalar_function = sympy.lambdify(symbol, expression, modules="math")
+        array_function = sympy.lambdify(symbol, expression, modules="numpy")
+    except Exception:
+        scalar_function = fallback
+        array_function = np.vectorize(fallback, otypes=[float])
+
+    def scalar_call(x):
+        try:
+            return float(scalar_function(float(x)))
+        except (ValueError, ZeroDivisionError, OverflowError):
+            # domain errors (e.g. log of a negative number) are undefined points
+            return np.nan
+        except Exception:
+            return fallback(x)
+
+    def compiled_function(x):
+        if np.ndim(x) == 0:
+            return scalar_call(x)
+
+        samples = np.asarray(x, dtype=float)
+        try:
+            with np.errstate(all="ignore"):
+                values = np.asarray(array_function(samples), dtype=float)
+        except Exception:
+            values = np.array([scalar_call(sample) for sample in samples.flat])
+        if values.shape != samples.shape:
+            # constant expressions evaluate to a scalar regardless of input shape
+            values = np.full(samples.shape, values)
+        return values
+
+    return compiled_function
 
 
 def generate_math_function(math_function: MathFunction) -> Callable:
@@ -144,19 +343,17 @@ def generate_math_function(math_function: MathFunction) -> Callable:
     Returns:
         Callable: The generated math function
     """
+    variable = math_function.variables[0] if math_function.variables else "x"
+
     if isinstance(math_function, (RegularMathFunction, PolarMathFunction)):
-        return lambda x: math_function.expression.subs(math_function.variables[0], x)
+        return compile_expression(math_function.expression, variable)
 
     elif isinstance(math_function, ParametricMathFunction):
-        x_function = lambda t: math_function.expressions[0].subs(
-            math_function.variables[0], t
-        )
-        y_function = lambda t: math_function.expressions[1].subs(
-            math_function.variables[0], t
-        )
+        x_function = compile_expression(math_function.expressions[0], variable)
+        y_function = compile_expression(math_function.expressions[1], variable)
 
         def parametric_function(t_val):
-            return np.array([float(x_function(t_val)), float(y_function(t_val))])
+            return np.array([x_function(t_val), y_function(t_val)])
 
         return parametric_function
 
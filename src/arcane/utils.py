@@ -1,4 +1,7 @@
-import uuid
+import os
+from hashlib import sha256
+from importlib import metadata
+from importlib.util import find_spec
 from pathlib import Path
 
 
@@ -10,6 +13,49 @@ def get_project_root(marker: str = "pyproject.toml"):
     return current_path  # Fallback if marker isn't found
 
 
+def get_cache_dir(name: str) -> Path:
+    """Returns (and creates) a cache directory shared by all arcane processes"""
+    root = os.environ.get("ARCANE_CACHE_DIR") or os.path.join(
+        os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "arcane"
+    )
+    cache_dir = Path(root) / name
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+def evict_cache(cache_dir: Path, pattern: str, max_size: int) -> None:
+    """Removes the least recently used entries matching pattern until they fit in max_size bytes"""
+    entries = []
+    for entry in cache_dir.glob(pattern):
+        try:
+            entries.append((entry.stat(), entry))
+        except FileNotFoundError:  # evicted by another process
+            pass
+
+    total_size = sum(stat.st_size for stat, _ in entries)
+    for stat, entry in sorted(entries, key=lambda item: item[0].st_mtime):
+        if total_size <= max_size:
+            break
+        entry.unlink(missing_ok=True)
+        total_size -= stat.st_size
+
+
+def get_package_version(name: str) -> str:
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return "dev"
+
+
+def get_source_hash(*modules: str) -> str:
+    """Hashes the source of modules, so caches of the objects they define are
+    invalidated when the code changes"""
+    source_hash = sha256()
+    for module in modules:
+        source_hash.update(Path(find_spec(module).origin).read_bytes())
+    return source_hash.hexdigest()
+
+
 def group_while(lst, condition):
     groups = []
     current = []
@@ -24,5 +70,31 @@ def group_while(lst, condition):
     return groups
 
 
-def gen_id():
-    return str(uuid.uuid4())
+class IdCounter:
+    """Hands out increasing integer ids, only the main process generates them
+    (worker processes construct mobjects for nodes that already have one)"""
+
+    def __init__(self, start: int = 1) -> None:
+        self._next_id = start
+
+    def next(self) -> int:
+        next_id = self._next_id
+        self._next_id += 1
+        return next_id
+
+    def peek(self) -> int:
+        """Returns the id handed out next, without handing it out"""
+        return self._next_id
+
+    def advance_to(self, next_id: int) -> None:
+        """Makes sure ids below next_id (e.g. from a cached program) are never handed
+        out again"""
+        self._next_id = max(self._next_id, next_id)
+
+
+ids = IdCounter()
+
+
+def gen_id() -> int:
+    """Returns a new integer id for an object the user didn't name"""
+    return ids.next()
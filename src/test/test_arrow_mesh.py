@@ -0,0 +1,30 @@
+import numpy as np
+
+from arcane.graphics.custom_mobjects.arrow_mesh import ArrowMesh
+
+
+def test_arrow_points_match_arrow_proportions():
+    mesh = ArrowMesh()
+    points = mesh.get_arrow_points(
+        np.array([[1.0, 1.0, 0.0], [0.0, 0.0, 0.0]]),
+        np.array([[0.0, 2.0, 0.0], [0.0, 0.0, 0.0]]),
+    )
+    assert points.shape == (2, 28, 3)
+
+    shaft, tip = points[0, :16:4], points[0, 16::4]
+    # default tip length and shaft stroke width of 6 (0.06 units)
+    assert np.allclose(
+        shaft, [[1.03, 1, 0], [1.03, 2.65, 0], [0.97, 2.65, 0], [0.97, 1, 0]]
+    )
+    assert np.allclose(tip, [[1.175, 2.65, 0], [1, 3, 0], [0.825, 2.65, 0]])
+    # a zero vector collapses on its start
+    assert np.allclose(points[1], 0)
+
+
+def test_short_arrows_scale_tip_and_width():
+    points = ArrowMesh().get_arrow_points(
+        np.array([[0.0, 0.0, 0.0]]), np.array([[0.4, 0.0, 0.0]])
+    )
+    shaft, tip = points[0, :16:4], points[0, 16::4]
+    assert np.allclose(shaft[:2], [[0, -0.01, 0], [0.3, -0.01, 0]])
+    assert np.allclose(tip, [[0.3, -0.05, 0], [0.4, 0, 0], [0.3, 0.05, 0]])
@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+from manim import linear
+
+from arcane.core.models.constructs import (ArcaneCharge, ArcaneLens,
+                                           ArcanePoint, ArcaneText)
+from arcane.graphics.animation import sequential
+from arcane.graphics.builder import SceneBuilder
+
+
+def build_scene(dependencies):
+    scene_builder = SceneBuilder()
+    for index, (id, node_dependencies) in enumerate(dependencies.items()):
+        scene_builder.add_object(
+            id=id,
+            statement_index=index,
+            value=ArcanePoint(id=id, position=(0.0, 0.0)),
+            dependencies=node_dependencies,
+        )
+    return scene_builder
+
+
+def test_resolution_order():
+    scene_builder = build_scene(
+        {"line": ["a", "b"], "b": [], "label": ["line"], "a": [], "brace": ["b"]}
+    )
+    assert scene_builder.resolution_order() == ["b", "a", "line", "brace", "label"]
+    assert scene_builder.get_dependants("b") == ["line", "brace"]
+    assert scene_builder.resolution_levels() == [
+        ["b", "a"],
+        ["line", "brace"],
+        ["label"],
+    ]
+
+
+def test_resolution_order_reports_cycle():
+    scene_builder = build_scene({"a": [], "b": ["a", "d"], "c": ["b"], "d": ["c"]})
+    with pytest.raises(ValueError, match="b -> d -> c -> b"):
+        scene_builder.resolution_order()
+
+
+def test_consecutive_primitives_are_batched():
+    scene_builder = build_scene({"a": [], "b": [], "c": [], "label": ["c"]})
+    built = scene_builder.build()
+
+    # c and label depend on each other, so they keep their own mobject and animation
+    batch, *singles = sorted(scene_builder.animations, key=lambda item: item.index)
+    assert len(singles) == 2
+    assert batch.animation.run_time == 2
+    assert batch.animation.mobject is scene_builder.get("a").mobject
+    assert len(batch.animation.mobject.points) == 2 * len(
+        scene_builder.get("c").mobject.points
+    )
+    assert batch.animation.mobject.z_index == scene_builder.get("c").mobject.z_index
+    # b is drawn by the batch of a, so only the batch is in the scene
+    assert scene_builder.get("b").batched_into == "a"
+    assert all(mobject is not scene_builder.get("b").mobject for mobject in built)
+
+
+def test_sequential_parts_cover_their_weights():
+    rate_func = sequential(linear, [1, 3])
+    assert rate_func(0) == 0
+    assert rate_func(0.25) == pytest.approx(0.125)
+    assert rate_func(0.5) == pytest.approx(0.25)
+    assert rate_func(0.75) == pytest.approx(0.625)
+    assert rate_func(1) == pytest.approx(1)
+
+
+def build_prerendered_scene(workers):
+    scene_builder = SceneBuilder()
+    values = [
+        ArcaneText(id="label", value="lens", position=(1.0, 2.0)),
+        ArcaneCharge(id="charge", position=(-1.0, 0.0), magnitude=2.0),
+        ArcaneLens(id="lens", focal_length=2, thickness=1, position=(3.0, -1.0)),
+    ]
+    for index, value in enumerate(values):
+        scene_builder.add_object(id=value.id, statement_index=index, value=value)
+    return scene_builder.build(workers=workers)
+
+
+def test_worker_processes_build_the_same_scene(tmp_path, monkeypatch):
+    monkeypatch.setenv("ARCANE_CACHE_DIR", str(tmp_path))
+    serial = build_prerendered_scene(workers=1)
+    parallel = build_prerendered_scene(workers=2)
+
+    assert [type(mobject) for mobject in parallel] == [
+        type(mobject) for mobject in serial
+    ]
+    for parallel_mobject, serial_mobject in zip(parallel, serial):
+        assert np.allclose(
+            parallel_mobject.get_all_points(), serial_mobject.get_all_points()
+        )
+        assert parallel_mobject.get_color() == serial_mobject.get_color()
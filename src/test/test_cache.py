@@ -0,0 +1,48 @@
+from arcane.core.parsing import cache
+from arcane.core.parsing.cache import load_program
+from arcane.utils import IdCounter
+
+SOURCE = """Define cubic as f(x) = x ^ 3
+@cubic from -1 to 1
+"""
+
+
+def test_load_program_reuses_cached_program(tmp_path, monkeypatch):
+    monkeypatch.setenv("ARCANE_CACHE_DIR", str(tmp_path))
+    program = load_program(SOURCE)
+
+    monkeypatch.setattr(cache, "parse", None)  # a cache hit must not parse again
+    cached_program = load_program(SOURCE)
+
+    assert cached_program == program
+    assert len(list((tmp_path / "programs").iterdir())) == 1
+
+
+def test_load_program_evicts_least_recently_used(tmp_path, monkeypatch):
+    monkeypatch.setenv("ARCANE_CACHE_DIR", str(tmp_path))
+    load_program(SOURCE)
+    entry_size = next((tmp_path / "programs").iterdir()).stat().st_size
+
+    # only room for one entry of about this size
+    other_source = SOURCE + "@cubic from 0 to 1\n"
+    load_program(other_source, max_size=2 * entry_size - 1)
+
+    entries = [entry.name for entry in (tmp_path / "programs").iterdir()]
+    assert entries == [f"{cache.program_cache_key(other_source)}.program"]
+
+
+def test_program_cache_key_follows_the_model_code(monkeypatch):
+    key = cache.program_cache_key(SOURCE)
+    monkeypatch.setattr(cache, "model_hash", "changed constructs")
+    assert cache.program_cache_key(SOURCE) != key
+
+
+def test_cached_programs_reserve_their_ids(tmp_path, monkeypatch):
+    monkeypatch.setenv("ARCANE_CACHE_DIR", str(tmp_path))
+    load_program(SOURCE)
+    next_id = cache.ids.peek()
+
+    # a new run starts counting from 1 again
+    monkeypatch.setattr(cache, "ids", IdCounter())
+    load_program(SOURCE)
+    assert cache.ids.peek() == next_id
@@ -0,0 +1,56 @@
+import numpy as np
+from manim import RIGHT, UP, Dot
+
+from arcane.graphics.custom_mobjects.connector import (ConnectorArrow,
+                                                       ConnectorLine)
+
+
+def test_connector_line_follows_its_ends():
+    start, end = Dot(), Dot(RIGHT * 2)
+    line = ConnectorLine(start, end)
+
+    points = line.points
+    line.update()
+    # left alone while the ends don't move
+    assert line.points is points
+
+    end.shift(UP * 2)
+    line.update()
+    assert np.allclose(line.get_start_and_end(), [[0, 0, 0], [2, 2, 0]])
+
+
+def test_connector_arrow_keeps_its_buff():
+    start, end = Dot(), Dot(RIGHT * 2)
+    arrow = ConnectorArrow(start, end, buff=0.1)
+
+    end.shift(RIGHT * 2)
+    arrow.update()
+    assert np.allclose(arrow.get_start_and_end(), [[0.1, 0, 0], [3.9, 0, 0]])
+
+
+def test_connector_arrow_collapses_while_its_ends_are_close():
+    start, end = Dot(), Dot(RIGHT * 2)
+    arrow = ConnectorArrow(start, end, buff=0.25)
+
+    end.move_to(RIGHT * 0.2)
+    arrow.update()
+    assert not arrow.has_tip()
+    assert np.allclose(arrow.points, [0.1, 0, 0])
+
+    end.move_to(RIGHT * 3)
+    arrow.update()
+    assert arrow.has_tip()
+    assert np.allclose(arrow.get_start_and_end(), [[0.25, 0, 0], [2.75, 0, 0]])
+
+
+def test_connector_line_collapses_when_its_ends_meet():
+    start, end = Dot(), Dot(RIGHT * 2)
+    line = ConnectorLine(start, end)
+
+    end.move_to(start)
+    line.update()
+    assert np.allclose(line.points, [0, 0, 0])
+
+    end.move_to(UP)
+    line.update()
+    assert np.allclose(line.get_start_and_end(), [[0, 0, 0], [0, 1, 0]])
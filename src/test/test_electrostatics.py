@@ -0,0 +1,90 @@
+import numpy as np
+from manim import LEFT, RIGHT, UP, config
+
+from arcane.graphics.custom_mobjects.electrostatics import (MAX_GLOW_LAYERS,
+                                                            MIN_GLOW_LAYERS,
+                                                            Charge,
+                                                            ElectricField,
+                                                            adaptive_grid,
+                                                            glow_layer_count)
+from arcane.graphics.renderers.physics import render_electric_field
+
+
+def test_glow_layer_count_follows_on_screen_size(monkeypatch):
+    monkeypatch.setattr(config, "pixel_width", 1920)
+    monkeypatch.setattr(config, "frame_width", 16)
+
+    assert glow_layer_count(4) == MAX_GLOW_LAYERS
+    assert glow_layer_count(4, scale=0.5) == 60
+    assert glow_layer_count(4, scale=0.01) == MIN_GLOW_LAYERS
+
+
+def test_field_at_sums_every_charge():
+    positions = np.array([[0.0, 0.0, 0.0], [4.0, 0.0, 0.0]])
+    magnitudes = np.array([1.0, -2.0])
+    points = np.array([[2.0, 0.0, 0.0], [0.0, 2.0, 0.0], [4.05, 0.0, 0.0]])
+
+    field = ElectricField.field_at(points, positions, magnitudes)
+
+    assert np.allclose(field[0], [0.25 + 0.5, 0, 0])
+    r = np.array([-4.0, 2.0, 0.0])
+    assert np.allclose(field[1], [0, 0.25, 0] - 2 * r / np.linalg.norm(r) ** 3)
+    # too close to the second charge
+    assert np.all(field[2] == 0)
+
+
+def test_field_is_only_redrawn_when_a_charge_changed(monkeypatch):
+    charges = [Charge(-1, LEFT, add_glow=False), Charge(1, RIGHT, add_glow=False)]
+    field = render_electric_field(charges)
+    draws = []
+    monkeypatch.setattr(field, "_draw_field", lambda: draws.append(True))
+
+    field.update()
+    assert draws == []
+
+    charges[0].shift(UP)
+    field.update()
+    field.update()
+    assert len(draws) == 1
+
+
+def test_update_field_follows_the_charges():
+    charges = [Charge(-1, LEFT, add_glow=False), Charge(1, RIGHT, add_glow=False)]
+    field = ElectricField(*charges)
+    before = field.get_all_points().copy()
+
+    charges[1].magnitude = 2
+    field.update_field()
+    after = field.get_all_points()
+    assert after.shape == before.shape
+    assert not np.allclose(after, before)
+    assert np.allclose(after, ElectricField(*charges).get_all_points())
+
+
+def test_adaptive_grid_is_bounded_and_denser_near_charges():
+    positions = np.array([[0.0, 0.0, 0.0]])
+    points, sizes = adaptive_grid(positions, max_arrows=100, frame_size=(16, 9))
+
+    assert 25 <= len(points) <= 100
+    # a single charge still gets a field around it
+    assert np.all(points[:, :2].min(axis=0) < -1.5)
+    assert np.all(points[:, :2].max(axis=0) > 1.5)
+    distances = np.linalg.norm(points[:, :2], axis=1)
+    assert sizes[distances.argmin()] < sizes[distances.argmax()]
+
+
+def test_adaptive_grid_keeps_arrow_budget_for_spread_charges():
+    positions = np.array([[-50.0, -50.0, 0.0], [50.0, 50.0, 0.0], [0.0, 0.0, 0.0]])
+    for max_arrows in (10, 400, 2000):
+        points, _ = adaptive_grid(positions, max_arrows, frame_size=(16, 9))
+        assert len(points) <= max_arrows
+
+
+def test_adaptive_grid_keeps_small_budgets_on_wide_frames():
+    positions = np.array([[-5.0, 0.0, 0.0], [5.0, 0.0, 0.0]])
+    points, sizes = adaptive_grid(positions, max_arrows=3, frame_size=(10, 1))
+
+    assert 1 <= len(points) <= 3
+    # the cells still cover the charges
+    assert points[:, 0].min() - sizes.max() / 2 <= -5
+    assert points[:, 0].max() + sizes.max() / 2 >= 5
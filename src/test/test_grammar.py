@@ -1,9 +1,11 @@
 import os
 
+import lark
 import pytest
+from sympy import sympify
 
+from arcane.core.parsing import parser, standalone_parser
 from arcane.core.parsing.parser import parse
-from arcane.core.parsing.transfomer import ArcaneTransfomer
 
 
 def get_test_scripts():
@@ -20,6 +22,69 @@ def test_script_grammar(script_path):
     with open(script_path, "r") as f:
         content = f.read()
         # If any step fails, pytest will show the specific error and mark the test as failed
-        tree = parse(content)
-        program = ArcaneTransfomer().transform(tree)
+        program = parse(content)
         # The test passes if no exception is raised
+
+
+@pytest.mark.parametrize(
+    "expression, expected",
+    [
+        ("(1 + 2) * 3", 9),
+        ("10 / 4 - 1", 1.5),
+        ("-2 ^ 2", -4),
+        ("(-2) ^ 2", 4),
+        ("2 ^ 3 ^ 2", 512),
+        ("7 mod 3", 1),
+        ("-PI ^ 2", -9.8696044),
+        ("sin(-PI / 2) ^ 2", 1),
+        ("(-8) ^ (1 / 3)", -2),
+        ("(-8) ^ (2 / 3)", 4),
+    ],
+)
+def test_numerical_expression(expression, expected):
+    """Test if numerical expressions are folded with the usual precedence"""
+    program = parse(f"Define c as circle with radius {expression} at (0, 0)")
+    radius = program.statements[0].value.value.definition.radius
+    assert radius == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    "expression, expected",
+    [
+        ("x ^ 2 + 3x", "x**2 + 3*x"),
+        ("2 ^ x ^ 2", "2**(x**2)"),
+        ("x ^ (1 / 3)", "x**(1/3)"),
+        ("0.5x - 1", "0.5*x - 1"),
+        ("x mod 3", "Mod(x, 3)"),
+        ("sin(2x) + cos(x / 2)", "sin(2*x) + cos(x/2)"),
+        ("e ^ x", "E**x"),
+        ("2 * PI", "2*pi"),
+        ("-x ^ 2", "-(x**2)"),
+        ("-(x + 1) ^ 2", "-((x + 1)**2)"),
+        ("x - -3", "x + 3"),
+    ],
+)
+def test_algebraic_expression(expression, expected):
+    """Test if algebraic expressions build the same sympy tree as sympify, with
+    exact integers and symbolic constants"""
+    program = parse(f"Define g as f(x) = {expression}")
+    assert program.statements[0].value.value.expression == sympify(expected)
+
+
+def test_even_root_of_negative_number_is_an_error():
+    with pytest.raises(ValueError, match="no real value"):
+        parse("Define c as circle with radius (-8) ^ 0.5 at (0, 0)")
+
+
+def test_changed_grammar_builds_and_caches_the_parser(tmp_path, monkeypatch):
+    monkeypatch.setenv("ARCANE_CACHE_DIR", str(tmp_path))
+    # the standalone tables no longer match grammar.lark
+    monkeypatch.setattr(standalone_parser, "GRAMMAR_HASH", "stale")
+
+    source = "Define c as circle with radius 2 at (0, 0)"
+    assert parser._load_parser().parse(source) == parse(source)
+    cache_file = tmp_path / "parser" / f"{parser.grammar_hash}-lark{lark.__version__}"
+    assert cache_file.is_file()
+
+    # the cached tables parse just the same
+    assert parser._load_parser().parse(source) == parse(source)
@@ -0,0 +1,43 @@
+import os
+
+from sympy import Symbol, sympify
+
+from arcane.core.models.constructs import ForLoop
+from arcane.core.parsing.parser import parse
+from arcane.core.runtime.interpreter import ArcaneInterpreter
+from arcane.core.runtime.types import (InterpreterMessage,
+                                       InterpreterMessageType)
+
+WAVES = os.path.join(os.path.dirname(__file__), "test_scripts", "waves.arc")
+
+
+def test_for_loop_substitutes_each_iteration(monkeypatch):
+    with open(WAVES, "r") as f:
+        program = parse(f.read())
+    loop = program.statements[2].value
+    assert isinstance(loop, ForLoop)
+
+    interpreter = ArcaneInterpreter(program)
+    processed = []
+
+    def process_animation(animation, statement_index, id=""):
+        processed.append((statement_index, animation))
+        return InterpreterMessage(InterpreterMessageType.SUCCESS)
+
+    monkeypatch.setattr(interpreter, "process_animation", process_animation)
+    while interpreter.execute_next() is not None:
+        pass
+
+    # the plot, then one transform per value of i in [1, 10)
+    _, *iterations = processed
+    assert len(iterations) == 9
+    indices = [statement_index for statement_index, _ in iterations]
+    assert indices == sorted(indices)
+    assert 2 <= indices[0] and indices[-1] < 3
+
+    for value, (_, animation) in enumerate(iterations, start=1):
+        expected = sympify(f"basic + sin({value} * x)")
+        assert animation.instance.object_to == expected
+    # iterations are substituted from the untouched loop body
+    assert loop.body[0].instance.object_to.has(Symbol("i"))
+    assert len({id(animation.instance) for _, animation in iterations}) == 9
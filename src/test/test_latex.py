@@ -0,0 +1,56 @@
+import shutil
+
+import numpy as np
+import pytest
+from manim import MathTex, Tex, tempconfig
+
+from arcane.core.parsing.parser import parse
+from arcane.graphics.latex import collect_latex, precompile_latex
+
+SOURCE = r"""Define line as line from (0,0) to (3,3)
+@brace on line with text "straight line"
+@write latex "\frac{1}{2}" above line
+@write latex "\frac{1}{2}" below line
+@write "not latex" at (1, 1)
+"""
+
+MORE_LATEX = r"""@write latex "x^2 + y^2" at (2, 2)
+@write latex "\sqrt{2}" at (3, 3)
+"""
+
+
+def test_collect_latex():
+    assert collect_latex(parse(SOURCE)) == [
+        ("straight line", "center"),
+        (r"$\frac{1}{2}$", "center"),
+    ]
+
+
+@pytest.mark.skipif(
+    shutil.which("latex") is None or shutil.which("dvisvgm") is None,
+    reason="LaTeX isn't installed",
+)
+def test_batched_pages_match_their_expressions(tmp_path):
+    program = parse(SOURCE + MORE_LATEX)
+    expressions = collect_latex(program)
+    assert len(expressions) == 4
+
+    mobject_classes = {"center": Tex, "align*": MathTex}
+    with tempconfig({"tex_dir": str(tmp_path / "batched")}):
+        precompile_latex(program, workers=2)
+        assert len(list((tmp_path / "batched").glob("*.svg"))) == len(expressions)
+        batched = [
+            mobject_classes[environment](expression)
+            for expression, environment in expressions
+        ]
+    # compiled by manim one expression at a time
+    with tempconfig({"tex_dir": str(tmp_path / "separate")}):
+        separate = [
+            mobject_classes[environment](expression)
+            for expression, environment in expressions
+        ]
+
+    for batched_mobject, separate_mobject in zip(batched, separate):
+        assert np.allclose(
+            batched_mobject.get_all_points(), separate_mobject.get_all_points()
+        )
@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+from sympy import sympify
+
+from arcane.graphics.utils.math import (compile_expression,
+                                        compute_function_range)
+
+
+@pytest.mark.parametrize(
+    "expression, value_range, expected",
+    [
+        ("x ^ 2", (-2, 2), (0, 4)),
+        ("sin(x)", (-np.pi, np.pi), (-1, 1)),
+        ("sin(50 * x)", (0, 1), (-1, 1)),
+        ("3", (0, 1), (3, 3)),
+    ],
+)
+def test_function_range(expression, value_range, expected):
+    func = compile_expression(sympify(expression), "x")
+    y_min, y_max = compute_function_range(func, value_range)
+    assert y_min == pytest.approx(expected[0], abs=1e-3)
+    assert y_max == pytest.approx(expected[1], abs=1e-3)
+
+
+def test_function_range_clips_asymptotes():
+    func = compile_expression(sympify("tan(x)"), "x")
+    y_min, y_max = compute_function_range(func, (-np.pi, np.pi))
+    assert -100 < y_min < -1
+    assert 1 < y_max < 100
+
+
+@pytest.mark.parametrize(
+    "expression, value_range, expected_min",
+    [
+        ("1 / x ^ 2", (-1, 1), 1),
+        ("1 / x ^ 2", (-np.pi, np.pi), 1 / np.pi**2),
+        ("1 / (x - 0.5) ^ 2", (-1, 1), 4 / 9),
+    ],
+)
+def test_function_range_clips_even_poles(expression, value_range, expected_min):
+    func = compile_expression(sympify(expression), "x")
+    y_min, y_max = compute_function_range(func, value_range)
+    assert y_min == pytest.approx(expected_min, rel=1e-3)
+    assert 1 < y_max < 100
+
+
+def test_uncompilable_expressions_are_undefined_where_not_numeric():
+    # f has no numeric value, so the sympy fallback can't produce a number either
+    func = compile_expression(sympify("f(x) + 1"), "x")
+    assert np.isnan(func(0.5))
+    assert np.isnan(func(np.array([0.5, 1.0]))).all()
+
+
+@pytest.mark.parametrize(
+    "expression, value_range",
+    [
+        ("exp(-100 * x ^ 2)", (-5, 5)),
+        ("1 / (1 + x ^ 2)", (-50, 50)),
+    ],
+)
+def test_function_range_keeps_narrow_peaks(expression, value_range):
+    func = compile_expression(sympify(expression), "x")
+    y_min, y_max = compute_function_range(func, value_range)
+    assert y_min == pytest.approx(0, abs=1e-3)
+    assert y_max == pytest.approx(1, abs=1e-2)
+
+
+def test_function_range_ignores_poles_on_samples():
+    func = compile_expression(sympify("1 / x"), "x")
+    # x = 0 is one of the samples
+    y_min, y_max = compute_function_range(func, (-1, 1), num_samples=201)
+    assert -200 < y_min < -1
+    assert 1 < y_max < 200
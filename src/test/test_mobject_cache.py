@@ -0,0 +1,37 @@
+import numpy as np
+from manim import Square, Text
+
+from arcane.graphics import cache
+from arcane.graphics.cache import load_mobject, mobject_cache_key
+
+
+class CountingSquare(Square):
+    constructed = 0
+
+    def __init__(self, *args, **kwargs):
+        CountingSquare.constructed += 1
+        super().__init__(*args, **kwargs)
+
+
+def test_load_mobject_reuses_cached_mobject(tmp_path, monkeypatch):
+    monkeypatch.setenv("ARCANE_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(CountingSquare, "constructed", 0)
+    square = load_mobject(CountingSquare, side_length=2)
+    cached_square = load_mobject(CountingSquare, side_length=2)
+
+    assert CountingSquare.constructed == 1
+    assert cached_square is not square
+    assert np.allclose(cached_square.points, square.points)
+
+    load_mobject(CountingSquare, side_length=3)
+    assert CountingSquare.constructed == 2
+    assert len(list((tmp_path / "mobjects").iterdir())) == 2
+
+
+def test_text_cache_key_follows_the_installed_fonts(monkeypatch):
+    text_key = mobject_cache_key(Text, "label")
+    square_key = mobject_cache_key(Square, side_length=2)
+
+    monkeypatch.setattr(cache, "get_installed_fonts", lambda: "other fonts")
+    assert mobject_cache_key(Text, "label") != text_key
+    assert mobject_cache_key(Square, side_length=2) == square_key
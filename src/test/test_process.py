@@ -0,0 +1,74 @@
+import pytest
+
+from arcane.core.models.constructs import Animation, Identifier
+from arcane.core.parsing.parser import parse
+from arcane.core.parsing.process import _get_dependencies, resolve_dependencies
+from arcane.utils import gen_id
+
+
+def resolve(source):
+    return resolve_dependencies(parse(source)).statements
+
+
+def animated(statement):
+    """The variable an injected or written animation of a variable shows"""
+    value = statement.value
+    if isinstance(value, Animation) and isinstance(value.instance, Identifier):
+        return value.instance.value
+    return None
+
+
+def test_unanimated_dependencies_are_injected_before_their_first_use():
+    statements = resolve("""Define a as point at (0, 0)
+Define b as point at (1, 1)
+Define l as line from a to b
+@b
+@l""")
+    # b is animated later on, so only a is shown before l is defined
+    assert [animated(statement) for statement in statements] == [
+        None,
+        None,
+        "a",
+        None,
+        "b",
+        "l",
+    ]
+    assert [statement.index for statement in statements] == list(range(6))
+
+
+def test_dependencies_are_ordered_and_skip_generated_identifiers():
+    node = [
+        Identifier("b"),
+        Identifier(""),
+        Identifier(gen_id()),
+        (Identifier("a"), {"key": Identifier("b")}),
+    ]
+    assert _get_dependencies(node) == ["b", "a"]
+
+
+def test_undefined_dependencies_are_an_error():
+    with pytest.raises(ValueError, match="Undefined variable 'a'"):
+        resolve('@brace on a with text "x"')
+
+
+def test_loop_bodies_animate_their_instance():
+    statements = resolve("""Define segment as line from (0,0) to (3,3)
+@brace on segment with text "x"
+for i from 1 to 2 {
+  @segment
+}""")
+    assert len(statements) == 3
+    assert not any(animated(statement) for statement in statements)
+
+
+def test_block_statements_follow_injected_animations():
+    statements = resolve("""Define segment as line from (0,0) to (3,3)
+@brace on segment with text "x"
+Define g as f(x) = x
+on axis one {
+  @g from 0 to 1
+}""")
+    assert animated(statements[1]) == "segment"
+    block = statements[4].value
+    assert block.statements == [5]
+    assert animated(statements[5]) == "g"
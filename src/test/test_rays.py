@@ -0,0 +1,112 @@
+import numpy as np
+import pytest
+from manim import LEFT, RIGHT, VGroup
+
+from arcane.graphics.custom_mobjects.lens import Lens
+from arcane.graphics.custom_mobjects.rays import (Propagate, Ray,
+                                                  propagate_rays, trace_rays)
+
+
+def bundle(heights, x=-3, length=3):
+    starts = np.array([[x, y, 0] for y in heights], dtype=float)
+    vectors = np.tile(RIGHT * length, (len(heights), 1))
+    return starts, vectors
+
+
+def test_axial_ray_goes_straight_through():
+    lens = Lens(1, 1)
+    starts, vectors = bundle([0])
+    (path,) = trace_rays(starts, vectors, [lens], init_length=3)
+    assert len(path) == 4
+    assert path[1] == pytest.approx([-0.5, 0, 0], abs=1e-6)
+    assert path[2] == pytest.approx([0.5, 0, 0], abs=1e-6)
+    assert np.allclose(path[:, 1], 0)
+
+
+def test_rays_missing_the_lenses_are_unchanged():
+    lens = Lens(1, 1).shift(RIGHT * 10)
+    starts, vectors = bundle([-0.2, 0.2])
+    for start, path in zip(starts, trace_rays(starts, vectors, [lens])):
+        assert np.allclose(path, [start, start + RIGHT * 3])
+
+
+@pytest.mark.parametrize("focal_length, bends_down", [(1, True), (-1, False)])
+def test_lenses_refract_rays(focal_length, bends_down):
+    lens = Lens(focal_length, 1)
+    starts, vectors = bundle([-0.3, 0.3])
+    below, above = trace_rays(starts, vectors, [lens], init_length=3)
+
+    # a bundle symmetric about the axis stays symmetric
+    assert np.allclose(above[:, 0], below[:, 0])
+    assert np.allclose(above[:, 1], -below[:, 1])
+
+    outgoing = above[-1] - above[-2]
+    assert outgoing[0] > 0
+    assert (outgoing[1] < 0) == bends_down
+
+
+def test_rays_go_through_lenses_in_order():
+    lenses = [Lens(1, 1).shift(RIGHT * 2), Lens(-1, 1).shift(LEFT)]
+    starts, vectors = bundle([0.05])
+    (path,) = trace_rays(starts, vectors, lenses, init_length=3)
+    assert len(path) == 6
+    assert np.all(np.diff(path[:, 0]) > 0)
+
+
+def test_ray_propagate_uses_the_tracer():
+    lens = Lens(1, 1)
+    ray = Ray(LEFT * 3 + np.array([0, 0.3, 0]), RIGHT, init_length=3)
+    ray.propagate(lens)
+    (path,) = trace_rays(*bundle([0.3]), [lens], init_length=3)
+    assert np.allclose(ray.get_corners(), path)
+
+
+def test_lenses_copy_the_cached_outline():
+    first = Lens(2, 0.5)
+    second = Lens(2, 0.5).shift(RIGHT)
+    assert np.allclose(first.points + RIGHT, second.points)
+    assert np.allclose(first.C[0] + RIGHT, second.C[0])
+    assert Lens(2, 0.6).width > first.width
+
+
+def test_propagate_animates_the_whole_bundle():
+    lens = Lens(1, 1)
+    rays = VGroup(
+        *(Ray(np.array([-3, y, 0]), RIGHT, init_length=3) for y in (-0.3, 0, 0.3))
+    )
+    paths = propagate_rays(list(rays), [lens])
+
+    animation = Propagate(rays, lens)
+    animation.begin()
+    assert np.allclose(rays[0].get_start(), [-3, -0.3, 0])
+    assert np.allclose(rays[0].get_end(), [0, -0.3, 0])
+    animation.finish()
+    for ray, path in zip(rays, paths):
+        assert np.allclose(ray.get_corners(), path)
+
+
+@pytest.mark.parametrize("focal_length", [1, -1])
+def test_rays_follow_scaled_and_rotated_lenses(focal_length):
+    scale, angle, offset = 2, np.pi / 5, np.array([1, -0.5, 0])
+    rotation = np.array(
+        [
+            [np.cos(angle), -np.sin(angle), 0],
+            [np.sin(angle), np.cos(angle), 0],
+            [0, 0, 1],
+        ]
+    )
+
+    def transform(points, offset=offset):
+        return scale * points @ rotation.T + offset
+
+    starts, vectors = bundle([-0.3, 0.05, 0.3])
+    expected = trace_rays(starts, vectors, [Lens(focal_length, 1)], init_length=3)
+
+    lens = Lens(focal_length, 1).scale(scale, about_point=np.zeros(3))
+    lens.rotate(angle, about_point=np.zeros(3)).shift(offset)
+    paths = trace_rays(transform(starts), transform(vectors, 0), [lens], init_length=3)
+    for path, unmoved in zip(paths, expected):
+        # the corners on the lens move with it, the outgoing ray keeps its direction
+        assert np.allclose(path[:-1], transform(unmoved[:-1]))
+        outgoing = transform(unmoved[-1]) - transform(unmoved[-2])
+        assert np.allclose(np.cross(path[-1] - path[-2], outgoing), 0)